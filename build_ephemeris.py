@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+
+
+from datetime import date
+
+import click
+
+from paper_cal.ephemeris import build_ephemeris
+
+
+@click.command()
+@click.option(
+    '--first',
+    '-f',
+    default=date.today().year - 100,
+    help='First year in the table',
+)
+@click.option(
+    '--last',
+    '-l',
+    default=date.today().year + 100,
+    help='Last year in the table',
+)
+@click.argument('path', default='ephemeris.bin')
+def main(first, last, path):
+    ''' '''
+
+    # Use it with:  export PAPER_CAL_EPHEMERIS=ephemeris.bin
+    build_ephemeris(path, first, last)
+
+
+if __name__ == '__main__':
+    main()
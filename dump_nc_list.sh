@@ -3,8 +3,8 @@
 # Generate the TXT file
 python radio_events.py > list.txt
 
-# Generate the CSV file from the TXT file
-cat <(echo "Date,Controller") <(cat list.txt) | tr ' ' ',' > list.csv
+# Generate the CSV file, quoted so that names can have spaces and commas
+python radio_events.py --format csv > list.csv
 
 # Generate the spreadsheet files from the CSV file
 libreoffice --headless --convert-to ods list.csv
@@ -1,37 +1,64 @@
 #!/usr/bin/env python
 
 
-from datetime import datetime
+import sys
+from datetime import date
 
-from vobject import iCalendar
 import click
 
+from paper_cal import REGISTRY, merged
+from paper_cal.ical import write_ical, write_recurring
 
-def generate_ical():
+
+@click.command()
+@click.option(
+    '--year',
+    '-y',
+    default=date.today().year,
+    help='First year to export',
+)
+@click.option(
+    '--years',
+    '-n',
+    default=1,
+    help='Number of years to export',
+)
+@click.option(
+    '--source',
+    '-s',
+    multiple=True,
+    type=click.Choice(sorted(REGISTRY)),
+    help='Holidays to export, all of them by default',
+)
+@click.option(
+    '--output',
+    '-o',
+    type=click.Path(dir_okay=False, writable=True),
+    help='File to write, standard output by default',
+)
+@click.option(
+    '--expand',
+    '-x',
+    is_flag=True,
+    help='One event per occurrence instead of recurring events',
+)
+def main(year, years, source, output, expand):
     ''' '''
 
     # http://eventable.github.io/vobject/
     # https://en.wikipedia.org/wiki/ICalendar
+    def write(out):
+        if expand:
+            write_ical(merged(range(year, year + years), source or None), out)
+        else:
+            rules = [rule for name in source or REGISTRY for rule in REGISTRY[name]]
+            write_recurring(rules, range(year, year + years), out)
 
-    calendar = iCalendar()
-    event = calendar.add('vevent')
-
-    event.add('summary').value = 'WCARC'
-
-    # utc = vobject.icalendar.utc
-    # event.add('dtstart').value = datetime(2020, 2, 28, tzinfo=utc)
-    event.add('dtstart').value = datetime(2020, 2, 28, 19)
-
-    return calendar
-
-
-# @click.command()
-# @click.option('', '', default='', help='')
-def main():
-    ''' '''
-
-    calendar = generate_ical()
-    print(calendar.serialize())
+    if output is None:
+        write(sys.stdout)
+        return
+    with open(output, 'w', newline='') as out:
+        write(out)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+
+import sys
+from datetime import date
+
+import click
+
+from paper_cal import REGISTRY, load_oog, merged, parallel, register
+from paper_cal.export import WRITERS, write_events
+
+
+@click.command()
+@click.option(
+    '--year',
+    '-y',
+    default=date.today().year,
+    help='First year to show',
+)
+@click.option(
+    '--years',
+    '-n',
+    default=1,
+    help='Number of years to show',
+)
+@click.option(
+    '--source',
+    '-s',
+    multiple=True,
+    type=click.Choice(sorted(REGISTRY)),
+    help='Holidays to show, all of them by default',
+)
+@click.option(
+    '--file',
+    '-f',
+    'files',
+    multiple=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help='Also show the events of an oog rule file',
+)
+@click.option(
+    '--region',
+    '-r',
+    help='Only holidays of a region such as CA-NS, which includes those of CA',
+)
+@click.option(
+    '--tag',
+    '-t',
+    help='Only holidays with a tag',
+)
+@click.option(
+    '--jobs',
+    '-j',
+    default=1,
+    help='Number of processes, 0 for one per CPU',
+)
+@click.option(
+    '--format',
+    '-F',
+    default='text',
+    type=click.Choice(sorted(WRITERS)),
+    help='Output format',
+)
+def main(year, years, source, files, region, tag, jobs, format):
+    ''' '''
+
+    # Rule files become sources of their own, shown with the other sources
+    source = list(source)
+    for path in files:
+        register(path, load_oog(path))
+        if source:
+            source.append(path)
+
+    years = range(year, year + years)
+    if jobs == 1:
+        events = merged(years, source or None, region, tag)
+    else:
+        events = parallel(years, source or None, jobs or None, region, tag)
+    write_events(events, sys.stdout, format)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+
+
+import subprocess
+import sys
+import time
+
+import click
+
+IMPORTS = {
+    'paper_cal': 'import paper_cal',
+    'closest_date': 'import paper_cal; paper_cal.closest_date(paper_cal.MONDAY)',
+    'rules': 'import paper_cal; paper_cal.evaluate',
+    'pymeeus': 'import paper_cal; paper_cal.spring(2024)',
+}
+
+
+def import_time(statement: str) -> float:
+    ''' '''
+
+    # A fresh interpreter every time, nothing is cached in sys.modules
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', statement], check=True)
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option('--runs', '-r', default=10, help='Number of runs of each import')
+def main(runs):
+    ''' '''
+
+    # See also:  python -X importtime -c 'import paper_cal'
+    baseline = min(import_time('pass') for _ in range(runs))
+    for name, statement in IMPORTS.items():
+        best = min(import_time(statement) for _ in range(runs)) - baseline
+        print(f'{name:<14}{best * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -6,6 +6,7 @@ from .paper_cal import (
     repeat_date,
     ordinal,
     heb_date,
+    hebrew_year,
     isl_date,
 )
 from .paper_cal import (
@@ -21,6 +22,8 @@ from .paper_cal import (
     first_moon,
     full_moon,
     last_moon,
+    lunations,
+    moon_phases,
 )
 from .paper_cal import (
     spin,
@@ -30,12 +33,18 @@ from .paper_cal import (
     animal,
     correlation,
 )
+from .computus import easter_ordinals, orthodox_easter_ordinals, passover_ordinals
+from .islamic import IslamicTable, islamic_dates, tabular_months, use_islamic_table
+from .paper_cal import Clock, FixedClock, set_clock, today
+
+from .ephemeris import use_ephemeris, build_ephemeris
 
 # Useful constants
 from .paper_cal import JAN, FEB, MAR, APR, MAY, JUN, JUL, AUG, SEP, OCT, NOV, DEC
 from .paper_cal import MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY, SATURDAY, SUNDAY
 from .paper_cal import MON, TUE, WED, THU, FRI, SAT, SUN
 from .paper_cal import WEEK1, WEEK2, WEEK3, WEEK4
+from .paper_cal import NEW_MOON, FIRST_QUARTER_MOON, FULL_MOON, LAST_QUARTER_MOON
 from .paper_cal import (
     JANUARY,
     FEBRUARY,
@@ -79,3 +88,76 @@ from .paper_cal import (
     DHU_AL_QADAH,
     DHU_AL_HIJJAH,
 )
+
+# Holiday rules, only imported the first time they are used so that tools
+# which just need closest_date() and friends start up quickly
+LAZY = {
+    'Event': 'rules',
+    'Rule': 'rules',
+    'Fixed': 'rules',
+    'YearDay': 'rules',
+    'Weekday': 'rules',
+    'Coincident': 'rules',
+    'Observed': 'rules',
+    'Easter': 'rules',
+    'Hebrew': 'rules',
+    'Islamic': 'rules',
+    'Astronomical': 'rules',
+    'Lunar': 'rules',
+    'MoonPhase': 'rules',
+    'evaluate': 'rules',
+    'Policy': 'observance',
+    'substitute': 'observance',
+    'NEXT_MONDAY': 'observance',
+    'NEAREST_WEEKDAY': 'observance',
+    'NEAREST_MONDAY': 'observance',
+    'SUNDAY_TO_MONDAY': 'observance',
+    'INDEX': 'registry',
+    'REGISTRY': 'registry',
+    'register': 'registry',
+    'rules_for': 'registry',
+    'holidays': 'registry',
+    'merged': 'registry',
+    'parallel': 'registry',
+    'ordinals': 'bulk',
+    'batch': 'bulk',
+    'closest_ordinals': 'bulk',
+    'closest_dates': 'bulk',
+    'parse_oog': 'oog',
+    'load_oog': 'oog',
+    'Incremental': 'incremental',
+    'fingerprint': 'incremental',
+    'ical_lines': 'ical',
+    'recurring_lines': 'ical',
+    'write_ical': 'ical',
+    'write_recurring': 'ical',
+    'write_csv': 'export',
+    'write_tsv': 'export',
+    'write_jsonl': 'export',
+    'write_events': 'export',
+    'AsyncCalendar': 'aio',
+    'RuleIndex': 'index',
+    'BusinessDays': 'business',
+    'business_days': 'business',
+    'EventStore': 'store',
+    'event_store': 'store',
+    'FeedHandler': 'server',
+    'serve': 'server',
+}
+
+
+def __getattr__(name):
+    if name not in LAZY:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    from importlib import import_module
+
+    # No lazy name is also the name of a submodule, importing one would bind
+    # the submodule over it
+    module = import_module(f'.{LAZY[name]}', __name__)
+    globals()[name] = getattr(module, name)
+    return globals()[name]
+
+
+def __dir__():
+    return sorted([*globals(), *LAZY])
@@ -0,0 +1,108 @@
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from . import server
+from .cache import memoize
+from .registry import rules_for
+from .rules import Event, Rule
+
+# The query API for asyncio code.  Astronomy and rule evaluation block for
+# tens of milliseconds on a miss, so misses go to a bounded pool of threads
+# while the event loop carries on.  Hits (anything memoize() already holds)
+# are answered inline, without a trip through the pool, and concurrent calls
+# for the same arguments wait on a single computation instead of each
+# starting their own, which is what happens on 1 January when every client
+# asks for the new year at once.
+#
+#   calendar = AsyncCalendar()
+#   await calendar.call(spring, 2024)
+#   await calendar.holidays(2024, ['canada'])
+#   await calendar.response('canada', 2024, 'ics')
+#
+# Use threads rather than processes: results are memoized in this process,
+# for the next calls to find.
+
+MAX_WORKERS = 4
+RULE_CACHE_SIZE = 4096
+
+
+@memoize(maxsize=RULE_CACHE_SIZE)
+def rule_events(rule: Rule, year: int) -> tuple[Event, ...]:
+    ''' '''
+
+    return tuple(rule.evaluate(year))
+
+
+class AsyncCalendar:
+    ''' '''
+
+    def __init__(self, executor: Executor | None = None, max_workers=MAX_WORKERS):
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers, thread_name_prefix='paper_cal')
+        self.executor = executor
+        self.pending = {}  # (function, args) to the future computing it
+
+    async def call(self, function, *args):
+        ''' '''
+
+        # function(*args), answered inline when memoize() knows the result
+        lookup = getattr(function, 'cache_get', None)
+        if lookup is not None:
+            try:
+                return lookup(*args)
+            except KeyError:
+                pass
+
+        return await self._shared(function, args)
+
+    def _shared(self, function, args) -> asyncio.Future:
+        # The computation of function(*args) in the pool, started by the first
+        # caller and shared with everyone asking before it is done.  One
+        # caller giving up must not cancel it for the others.
+        key = (function, args)
+        future = self.pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.executor, function, *args)
+            self.pending[key] = future
+            future.add_done_callback(lambda _: self.pending.pop(key, None))
+        return asyncio.shield(future)
+
+    async def evaluate(self, rules, years) -> list[Event]:
+        ''' '''
+
+        # Same events, in the same order, as evaluate(rules, years), with the
+        # misses computed concurrently
+        if isinstance(years, int):
+            years = [years]
+
+        found = []
+        misses = {}
+        for year in years:
+            for rule in rules:
+                try:
+                    found.append(rule_events.cache_get(rule, year))
+                except KeyError:
+                    misses[len(found)] = self._shared(rule_events, (rule, year))
+                    found.append(())
+        if misses:
+            computed = await asyncio.gather(*misses.values())
+            for index, events in zip(misses, computed):
+                found[index] = events
+        return [event for events in found for event in events]
+
+    async def holidays(self, years, sources=None, region=None, tag=None) -> list[Event]:
+        ''' '''
+
+        return await self.evaluate(rules_for(sources, region, tag), years)
+
+    async def response(self, region: str, year: int, format: str) -> server.Response:
+        ''' '''
+
+        # A rendered feed, as served by paper_cal.server
+        return await self.call(server.response, region, year, format)
+
+    def close(self) -> None:
+        ''' '''
+
+        self.executor.shutdown(wait=False)
@@ -0,0 +1,296 @@
+import gc
+from datetime import date
+from itertools import repeat
+from operator import itemgetter
+
+from .computus import easter_ordinals
+from .observance import substitute
+from .paper_cal import (
+    ADAR,
+    FEBRUARY,
+    HEB_YEAR_OFFSET,
+    LENGTH_OF_WEEK,
+    NISAN,
+    TISHREI,
+    heb_date,
+    hebrew_year,
+)
+from .rd import DAYS_BEFORE_MONTH, is_gregorian_leap
+from .rules import Easter, Event, Fixed, Hebrew, Observed, Weekday, YearDay
+
+# Evaluate many rules over many years in one pass.  Rules are grouped by kind
+# and the simple kinds (fixed dates, weekday rules, Easter offsets, days of
+# the year, observed days, Hebrew dates) are resolved with plain integer
+# arithmetic on proleptic Gregorian ordinals (date.toordinal()) for every
+# year at once.  Anything else (Islamic, astronomical, lunar...) falls back
+# to Rule.dates() one year at a time.  Rules that do not occur every year (an
+# observed day when the holiday did not move, February 29) give None for
+# those years.
+#
+# Events are sorted as integers (the ordinal and the rule) and only made into
+# Event tuples once, in order, at the end.
+
+DAYS_IN_MONTH = [-1, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+
+SLOT_BITS = 32  # events made one at a time
+YEAR_BITS = 16  # position of the year in the span
+SLOT_MASK = (1 << SLOT_BITS) - 1
+
+# How many days closest_date() steps back from an ordinal falling on a given
+# weekday to reach the desired weekday, SHIFTS[desired_weekday][weekday]
+SHIFTS = [
+    [(weekday - desired + 3) % LENGTH_OF_WEEK - 3 for weekday in range(LENGTH_OF_WEEK)]
+    for desired in range(LENGTH_OF_WEEK)
+]
+
+
+class _Years:
+    ''' '''
+
+    # Everything about a span of years that the rule kinds share
+
+    def __init__(self, years):
+        self.years = list(years)
+        self.leaps = [is_gregorian_leap(year) for year in self.years]
+        self.starts = [date(year, 1, 1).toordinal() for year in self.years]
+        self._easters = None
+        self._month_starts = {}
+        self._hebrew_years = {}
+
+    def month_starts(self, month: int) -> list[int]:
+        ''' '''
+
+        if month not in self._month_starts:
+            before = DAYS_BEFORE_MONTH[month]
+            if month > FEBRUARY:
+                leaps = self.leaps
+            else:
+                leaps = [False] * len(self.years)
+            self._month_starts[month] = [
+                start + before + leap for start, leap in zip(self.starts, leaps)
+            ]
+        return self._month_starts[month]
+
+    def month_lengths(self, month: int) -> list[int]:
+        ''' '''
+
+        if month == FEBRUARY:
+            return [DAYS_IN_MONTH[month] + leap for leap in self.leaps]
+        return [DAYS_IN_MONTH[month]] * len(self.years)
+
+    def easters(self) -> list[int]:
+        ''' '''
+
+        if self._easters is None:
+            self._easters = easter_ordinals(self.years)
+        return self._easters
+
+    def hebrew_year(self, heb_year: int):
+        ''' '''
+
+        # Every Hebrew rule of the span looks up the same years
+        if heb_year not in self._hebrew_years:
+            self._hebrew_years[heb_year] = hebrew_year(heb_year)
+        return self._hebrew_years[heb_year]
+
+
+def _fixed(rule, span):
+    starts = span.month_starts(rule.month)
+    if rule.day < 0:
+        lengths = span.month_lengths(rule.month)
+        return [s + n + rule.day for s, n in zip(starts, lengths)]
+    return _missing(rule, span, [s + rule.day - 1 for s in starts])
+
+
+def _missing(rule, span, found):
+    # None for the years without that day of the month (February 29)
+    if rule.day < 29:
+        return found
+    lengths = span.month_lengths(rule.month)
+    return [f if rule.day <= n else None for f, n in zip(found, lengths)]
+
+
+def _year_day(rule, span):
+    return [start + rule.day - 1 for start in span.starts]
+
+
+def _closest(shifts, anchors, last):
+    # Same steps as closest_date(), on ordinals (day 1 is a Monday)
+    if not last:
+        return [anchor - shifts[(anchor + 6) % LENGTH_OF_WEEK] for anchor in anchors]
+
+    found = []
+    for anchor in anchors:
+        ordinal = anchor - shifts[(anchor + 6) % LENGTH_OF_WEEK]
+        if ordinal > anchor:
+            # Jump back into the month if we managed to leave it
+            ordinal -= LENGTH_OF_WEEK
+        found.append(ordinal)
+    return found
+
+
+def _weekday(rule, span):
+    starts = span.month_starts(rule.month)
+    if rule.last:
+        lengths = span.month_lengths(rule.month)
+        anchors = [s + n - 1 for s, n in zip(starts, lengths)]
+    else:
+        anchors = [s + rule.day - 1 for s in starts]
+    found = _closest(SHIFTS[rule.weekday % LENGTH_OF_WEEK], anchors, rule.last)
+    return found if rule.last else _missing(rule, span, found)
+
+
+def _easter(rule, span):
+    return span.easters()
+
+
+def _hebrew(rule, span):
+    found = []
+    for year in span.years:
+        heb_year = year + HEB_YEAR_OFFSET + (rule.month >= TISHREI)
+        structure = span.hebrew_year(heb_year)
+        if (
+            not NISAN <= rule.month <= ADAR
+            or structure.month_starts[rule.month] is None
+            or not 1 <= rule.day <= structure.month_lengths[rule.month]
+        ):
+            heb_date(rule.month, rule.day, year)  # raises the same ValueError
+        found.append(structure.month_starts[rule.month] + rule.day - 1)
+    return found
+
+
+def _observed(rule, span):
+    anchors = [s + rule.day - 1 for s in span.month_starts(rule.month)]
+    if rule.group:
+        others = [
+            [s + day - 1 for s in span.month_starts(month)] for month, day in rule.group
+        ]
+        found = [substitute(days, rule.policy)[0] for days in zip(anchors, *others)]
+    else:
+        shifts = rule.policy.shifts
+        found = [anchor + shifts[(anchor + 6) % LENGTH_OF_WEEK] for anchor in anchors]
+    if rule.keep:
+        return found
+    return [f if f != anchor else None for f, anchor in zip(found, anchors)]
+
+
+ORDINALS = {
+    Fixed: _fixed,
+    YearDay: _year_day,
+    Weekday: _weekday,
+    Easter: _easter,
+    Hebrew: _hebrew,
+    Observed: _observed,
+}
+
+
+def ordinals(rule, years) -> list[int]:
+    ''' '''
+
+    if not isinstance(years, _Years):
+        years = _Years(years)
+    found = ORDINALS[type(rule)](rule, years)
+    if not rule.offset:
+        return list(found)
+    return [None if ordinal is None else ordinal + rule.offset for ordinal in found]
+
+
+def _month_end(ordinal: int) -> int:
+    nearby_date = date.fromordinal(ordinal)
+    length = DAYS_IN_MONTH[nearby_date.month]
+    if nearby_date.month == FEBRUARY and is_gregorian_leap(nearby_date.year):
+        length += 1
+    return ordinal + length - nearby_date.day
+
+
+def closest_ordinals(desired_weekdays, nearby_ordinals, last=False) -> list[int]:
+    ''' '''
+
+    # closest_date() for a whole list of ordinals at once.  The weekdays and
+    # the last flags are either one value for every ordinal or a list with a
+    # value per ordinal.
+    anchors = list(nearby_ordinals)
+    if isinstance(desired_weekdays, int) and isinstance(last, bool):
+        if last:
+            anchors = [_month_end(anchor) for anchor in anchors]
+        return _closest(SHIFTS[desired_weekdays % LENGTH_OF_WEEK], anchors, last)
+
+    if isinstance(desired_weekdays, int):
+        desired_weekdays = repeat(desired_weekdays)
+    if isinstance(last, bool):
+        last = repeat(last)
+
+    found = []
+    for desired_weekday, anchor, at_end in zip(desired_weekdays, anchors, last):
+        if at_end:
+            anchor = _month_end(anchor)
+        found.extend(
+            _closest(SHIFTS[desired_weekday % LENGTH_OF_WEEK], (anchor,), at_end)
+        )
+    return found
+
+
+def closest_dates(desired_weekdays, nearby_dates, last=False) -> list[date]:
+    ''' '''
+
+    nearby_ordinals = map(date.toordinal, nearby_dates)
+    return list(
+        map(date.fromordinal, closest_ordinals(desired_weekdays, nearby_ordinals, last))
+    )
+
+
+def _batch(rules, years) -> list[Event]:
+
+    span = _Years(years)
+
+    # Every event is an integer: its ordinal, the position of the year it
+    # was evaluated for, and the slot of its name and time (a rule, or a
+    # single event of a rule that has to be evaluated one year at a time).
+    # Sorting the integers gives the order of a stable sort by date of the
+    # events of evaluate(), without making any Event first.
+    shift = YEAR_BITS + SLOT_BITS
+    positions = [position << SLOT_BITS for position in range(len(span.years))]
+    slots = []  # (None, name, time) or an Event
+    keys = []
+    for rule in rules:
+        if type(rule) in ORDINALS:
+            found = ordinals(rule, span)
+            if rule.years is None and not rule.skip and rule.since is None:
+                slot = len(slots)
+                slots.append((None, rule.name, rule.time))
+                keys += [
+                    ordinal << shift | position | slot
+                    for ordinal, position in zip(found, positions)
+                    if ordinal is not None
+                ]
+                continue
+            for position, year, ordinal in zip(positions, span.years, found):
+                if ordinal is not None and rule.occurs(year):
+                    keys.append(ordinal << shift | position | len(slots))
+                    slots.append((None, rule.label(year), rule.time))
+            continue
+        for position, year in zip(positions, span.years):
+            for event in rule.evaluate(year):
+                keys.append(event.date.toordinal() << shift | position | len(slots))
+                slots.append(event)
+    keys.sort()
+
+    made = list(map(slots.__getitem__, [key & SLOT_MASK for key in keys]))
+    dates = map(date.fromordinal, [key >> shift for key in keys])
+    names = map(itemgetter(1), made)
+    times = map(itemgetter(2), made)
+    return list(map(tuple.__new__, repeat(Event), zip(dates, names, times)))
+
+
+def batch(rules, years) -> list[Event]:
+    ''' '''
+
+    # Hundreds of thousands of tuples at once: the cyclic garbage collector
+    # would go through all of them again and again for nothing
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        return _batch(rules, years)
+    finally:
+        if collecting:
+            gc.enable()
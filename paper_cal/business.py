@@ -0,0 +1,90 @@
+from array import array
+from datetime import date, timedelta
+from itertools import accumulate
+
+from .cache import memoize
+from .paper_cal import SATURDAY, SUNDAY
+from .store import STATUTORY, EventStore
+
+# Business days of a region: every day that is neither a weekend day nor a
+# day off, where days off are the days of the rules tagged "statutory" for
+# the region (and its country), observed days included.  For every day of
+# the span, the number of business days before it is kept in an array, so
+# that counting the business days between two days is a subtraction and
+# adding business days to a day is an array lookup.
+#
+#   ontario = BusinessDays('CA-ON', range(2020, 2041))
+#   ontario.add(date(2024, 12, 20), 10)     2025-01-08
+#   ontario.count(date(2024, 12, 1), date(2025, 1, 1))
+
+BUSINESS_CACHE_SIZE = 32
+
+
+class BusinessDays:
+    ''' '''
+
+    def __init__(
+        self, region: str, years, tag: str = STATUTORY, weekend=(SATURDAY, SUNDAY)
+    ):
+        self.region = region
+        store = EventStore(years, region=region, tag=tag)
+        self.start, self.end = store.start, store.end
+        self.days_off = frozenset(store.all.ordinals)
+
+        first = self.start.toordinal()
+        days = range(first, self.end.toordinal() + 1)
+        weekend = {day % 7 for day in weekend}
+        working = [
+            # Ordinal 1 (1 January of year 1) is a Monday
+            (day - 1) % 7 not in weekend and day not in self.days_off
+            for day in days
+        ]
+
+        # before[i] is the number of business days before the i-th day of the
+        # span, business[n] is the ordinal of the n-th business day
+        self.before = array('l', accumulate(working, initial=0))
+        self.business = array(
+            'l', (day for day, is_open in zip(days, working) if is_open)
+        )
+
+    def _index(self, day: date) -> int:
+        if not self.start <= day <= self.end:
+            raise ValueError(f'{day} is outside of {self.start} to {self.end}')
+        return day.toordinal() - self.start.toordinal()
+
+    def is_business_day(self, day: date) -> bool:
+        ''' '''
+
+        index = self._index(day)
+        return self.before[index + 1] > self.before[index]
+
+    def count(self, start: date, end: date) -> int:
+        ''' '''
+
+        # Business days from start to the day before end, like range()
+        if end <= start:
+            return 0
+        last = self._index(end - timedelta(days=1))
+        return self.before[last + 1] - self.before[self._index(start)]
+
+    def add(self, day: date, days: int) -> date:
+        ''' '''
+
+        # The days-th business day after day (before it when negative), or
+        # day itself (the next business day when it is not one) for 0
+        index = self._index(day)
+        if days > 0:
+            position = self.before[index + 1] + days - 1
+        else:
+            position = self.before[index] + days
+        if not 0 <= position < len(self.business):
+            raise ValueError(f'{day} plus {days} business days is outside of the span')
+        return date.fromordinal(self.business[position])
+
+
+@memoize(maxsize=BUSINESS_CACHE_SIZE)
+def business_days(region: str, first: int, last: int) -> BusinessDays:
+    ''' '''
+
+    # Shared by everyone asking for the same region and years
+    return BusinessDays(region, range(first, last + 1))
@@ -0,0 +1,85 @@
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+from typing import NamedTuple
+
+# A bounded LRU cache like functools.lru_cache(), which also counts how many
+# results had to be thrown away to make room for new ones
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def memoize(maxsize: int = 256):
+    ''' '''
+
+    def decorator(function):
+        cache = OrderedDict()
+        stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        lock = Lock()
+        parameters = None
+
+        def make_key(args, kwargs):
+            nonlocal parameters
+
+            # spring(2024) and spring(year=2024) share the same entry
+            if not kwargs:
+                return args
+            if parameters is None:
+                from inspect import signature
+
+                parameters = signature(function)
+            return tuple(parameters.bind(*args, **kwargs).arguments.values())
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            with lock:
+                if key in cache:
+                    stats['hits'] += 1
+                    cache.move_to_end(key)
+                    return cache[key]
+                stats['misses'] += 1
+
+            # Compute outside of the lock, two threads asking for the same
+            # year at once will both compute it
+            result = function(*args, **kwargs)
+
+            with lock:
+                cache[key] = result
+                cache.move_to_end(key)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+                    stats['evictions'] += 1
+            return result
+
+        def cache_get(*args, **kwargs):
+            # The result if it is already known, KeyError otherwise, without
+            # ever calling function
+            key = make_key(args, kwargs)
+            with lock:
+                result = cache[key]
+                stats['hits'] += 1
+                cache.move_to_end(key)
+                return result
+
+        def cache_info() -> CacheInfo:
+            with lock:
+                return CacheInfo(maxsize=maxsize, currsize=len(cache), **stats)
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+                stats.update(hits=0, misses=0, evictions=0)
+
+        wrapper.cache_get = cache_get
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
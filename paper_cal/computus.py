@@ -0,0 +1,92 @@
+from math import floor
+
+from .rd import fixed_from_gregorian, fixed_from_julian
+
+# Easter and Passover for whole ranges of years, as proleptic Gregorian
+# ordinals (date.toordinal()) that movable feast offsets can simply be added
+# to.  The arithmetic is the one from Epoch.easter() and Epoch.jewish_pesach()
+# (Meeus, Astronomical Algorithms, pages 67-73) written with integer division
+# so that nothing has to go through PyMeeus one year at a time.
+#
+# Like those two, the Gregorian computus is only used from 1583 onwards and
+# earlier years get the Julian computus, with the month and day taken as they
+# are on the proleptic Gregorian calendar (this is what easter() has always
+# returned).  orthodox_easter_ordinals() uses the Julian computus for every
+# year and converts the result to the Gregorian calendar, which is the day
+# Orthodox churches actually celebrate on.
+
+GREGORIAN_REFORM = 1583
+
+
+def _gregorian_easter(year: int) -> tuple[int, int]:
+    a = year % 19
+    b = year // 100
+    c = year % 100
+    d = b // 4
+    e = b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i = c // 4
+    k = c % 4
+    ll = (32 + 2 * (e + i) - h - k) % 7
+    m = (a + 11 * h + 22 * ll) // 451
+    n = h + ll - 7 * m + 114
+    return n // 31, n % 31 + 1
+
+
+def _julian_easter(year: int) -> tuple[int, int]:
+    a = year % 4
+    b = year % 7
+    c = year % 19
+    d = (19 * c + 15) % 30
+    e = (2 * a + 4 * b - d + 34) % 7
+    n = d + e + 114
+    return n // 31, n % 31 + 1
+
+
+def _pesach(year: int) -> tuple[int, int]:
+    # Same floating point steps as Epoch.jewish_pesach(), so that the
+    # fractional comparisons below land on exactly the same side
+    c = year // 100
+    s = 0 if year < GREGORIAN_REFORM else floor((3.0 * c - 5.0) / 4.0)
+    a = (12 * (year + 1)) % 19
+    b = year % 4
+    q = -1.904412361576 + 1.554241796621 * a + 0.25 * b - 0.003177794022 * year + s
+    j = (floor(q) + 3 * year + 5 * b + 2 + s) % 7
+    r = q - floor(q)
+    if j == 2 or j == 4 or j == 6:
+        d = floor(q) + 23
+    elif j == 1 and a > 6 and r > 0.632870370:
+        d = floor(q) + 24
+    elif j == 0 and a > 11 and r > 0.897723765:
+        d = floor(q) + 23
+    else:
+        d = floor(q) + 22
+    if d > 31:
+        return 4, d - 31
+    return 3, d
+
+
+def easter_ordinals(years) -> list[int]:
+    ''' '''
+
+    return [
+        fixed_from_gregorian(
+            year,
+            *(_gregorian_easter if year >= GREGORIAN_REFORM else _julian_easter)(year),
+        )
+        for year in years
+    ]
+
+
+def orthodox_easter_ordinals(years) -> list[int]:
+    ''' '''
+
+    return [fixed_from_julian(year, *_julian_easter(year)) for year in years]
+
+
+def passover_ordinals(years) -> list[int]:
+    ''' '''
+
+    return [fixed_from_gregorian(year, *_pesach(year)) for year in years]
@@ -0,0 +1,227 @@
+import mmap
+import os
+import struct
+import tempfile
+import warnings
+from datetime import date, datetime, time, timedelta
+
+from .rd import is_gregorian_leap, is_julian_leap
+
+# Precomputed seasons, apsides and moon phases in a compact binary file, so
+# that fresh processes do not have to ask PyMeeus for them again.
+#
+# The file is a header followed by two tables of little-endian signed 64-bit
+# integers, each one being a moment counted in minutes from the start of
+# date.fromordinal(0) (the same minute resolution as spring() and friends):
+#
+#   header     magic, version, first year, last year, first k, last k
+#   years      spring, summer, autumn, winter, perihelion, aphelion
+#              for every year from the first to the last year
+#   lunations  new, first quarter, full, last quarter moons
+#              for every lunation number k (as in Meeus, k = 0 is the new
+#              moon of 2000-01-06) from the first to the last k
+#
+# The tables are read through mmap(), nothing is parsed up front.
+
+MAGIC = b'PAPRCAL\0'
+VERSION = 1
+HEADER = struct.Struct('<8sHxxiiii')
+MOMENT = struct.Struct('<q')
+SPRING, SUMMER, AUTUMN, WINTER, PERIHELION, APHELION = range(6)
+SEASONS_PER_YEAR = 6
+PHASES = ['new', 'first', 'full', 'last']
+MINUTES_PER_DAY = 24 * 60
+PHASE_LOOKBACK = 6  # days, see new_moon() and friends
+LUNATIONS_PER_YEAR = 12.3685  # as in Moon.moon_phase()
+DAY = timedelta(days=1)
+ENVIRONMENT = 'PAPER_CAL_EPHEMERIS'
+
+
+def to_minutes(moment: datetime) -> int:
+    ''' '''
+
+    return moment.toordinal() * MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+
+
+def from_minutes(minutes: int) -> datetime:
+    ''' '''
+
+    days, minutes = divmod(minutes, MINUTES_PER_DAY)
+    return datetime.fromordinal(days) + timedelta(minutes=minutes)
+
+
+def lunation(moon_date) -> int:
+    ''' '''
+
+    # Same lunation number that Moon.moon_phase() picks for new_moon() and
+    # friends, from the year and fraction of the year PHASE_LOOKBACK days
+    # earlier.  Like PyMeeus, the length of the year follows the Julian
+    # calendar before 1582.
+    moment = moon_date - timedelta(days=PHASE_LOOKBACK)
+    day = moment.timetuple().tm_yday
+    if isinstance(moment, datetime):
+        day += (moment - datetime.combine(moment, time(), moment.tzinfo)) / DAY
+    if (moment.year, moment.month) == (1582, 10) and 5 <= moment.day <= 14:
+        # PyMeeus reads the days the Gregorian calendar skipped as Gregorian
+        # and gives them back as the Julian days ten days earlier
+        day -= 10
+    if moment.year >= 1582:
+        days_in_year = 365 + is_gregorian_leap(moment.year)
+    else:
+        days_in_year = 365 + is_julian_leap(moment.year)
+    year = moment.year + day / days_in_year
+    return round((year - 2000) * LUNATIONS_PER_YEAR)
+
+
+class Ephemeris:
+    ''' '''
+
+    def __init__(self, path):
+        with open(path, 'rb') as table:
+            self.table = mmap.mmap(table.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, first_year, last_year, first_k, last_k = HEADER.unpack_from(
+            self.table
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{path} is not a paper_cal ephemeris table')
+
+        self.path = path
+        self.first_year, self.last_year = first_year, last_year
+        self.first_k, self.last_k = first_k, last_k
+        self.lunations = HEADER.size + MOMENT.size * SEASONS_PER_YEAR * (
+            last_year - first_year + 1
+        )
+
+    def season(self, year: int, which: int) -> datetime | None:
+        ''' '''
+
+        if not self.first_year <= year <= self.last_year:
+            return None
+        index = (year - self.first_year) * SEASONS_PER_YEAR + which
+        (minutes,) = MOMENT.unpack_from(self.table, HEADER.size + MOMENT.size * index)
+        return from_minutes(minutes)
+
+    def moon_phase(self, k: int, target: str) -> datetime | None:
+        ''' '''
+
+        if not self.first_k <= k <= self.last_k:
+            return None
+        index = (k - self.first_k) * len(PHASES) + PHASES.index(target)
+        (minutes,) = MOMENT.unpack_from(
+            self.table, self.lunations + MOMENT.size * index
+        )
+        return from_minutes(minutes)
+
+    def close(self) -> None:
+        ''' '''
+
+        self.table.close()
+
+
+_ephemeris = None
+
+
+def use_ephemeris(path=ENVIRONMENT) -> Ephemeris | None:
+    ''' '''
+
+    # Use None to go back to computing everything with PyMeeus.  By default
+    # the table is the one PAPER_CAL_EPHEMERIS names when this is called, and
+    # a table that cannot be read there is only worth a warning: PyMeeus
+    # gives the same moments, more slowly.
+    global _ephemeris
+
+    if _ephemeris is not None:
+        _ephemeris.close()
+    _ephemeris = None
+    if path is ENVIRONMENT:
+        path = os.environ.get(ENVIRONMENT)
+        if path:
+            try:
+                _ephemeris = Ephemeris(path)
+            except (OSError, ValueError, struct.error) as error:
+                warnings.warn(f'{ENVIRONMENT}: {error}, using PyMeeus instead')
+    elif path is not None:
+        _ephemeris = Ephemeris(path)
+    return _ephemeris
+
+
+def season(year: int, which: int) -> datetime | None:
+    ''' '''
+
+    if _ephemeris is None:
+        return None
+    return _ephemeris.season(year, which)
+
+
+def moon_phase(moon_date, target: str) -> datetime | None:
+    ''' '''
+
+    if _ephemeris is None:
+        return None
+    return _ephemeris.moon_phase(lunation(moon_date), target)
+
+
+def lunation_phase(k: int, target: str) -> datetime | None:
+    ''' '''
+
+    if _ephemeris is None:
+        return None
+    return _ephemeris.moon_phase(k, target)
+
+
+def build_ephemeris(path, first_year: int, last_year: int) -> None:
+    ''' '''
+
+    from .paper_cal import (
+        spring,
+        summer,
+        autumn,
+        winter,
+        perihelion,
+        aphelion,
+        new_moon,
+        first_moon,
+        full_moon,
+        last_moon,
+    )
+
+    # Every lunation that a moon_date of the span of years looks up, with the
+    # same lookback as new_moon() and friends
+    start = date(first_year, 1, 1)
+    first_k = lunation(start)
+    last_k = lunation(date(last_year, 12, 31))
+
+    # Written next to the table and renamed over it once complete, so that a
+    # process reading the table meanwhile never sees half of it
+    descriptor, temporary = tempfile.mkstemp(
+        prefix=f'.{os.path.basename(path)}.', dir=os.path.dirname(os.path.abspath(path))
+    )
+    try:
+        with os.fdopen(descriptor, 'wb') as table:
+            table.write(
+                HEADER.pack(MAGIC, VERSION, first_year, last_year, first_k, last_k)
+            )
+            for year in range(first_year, last_year + 1):
+                for function in (spring, summer, autumn, winter, perihelion, aphelion):
+                    table.write(MOMENT.pack(to_minutes(function(year))))
+
+            # Find a date inside each lunation by walking a synodic month at a time
+            moon_date = start
+            k = first_k
+            while k <= last_k:
+                if lunation(moon_date) < k:
+                    moon_date += timedelta(days=1)
+                    continue
+                for function in (new_moon, first_moon, full_moon, last_moon):
+                    table.write(MOMENT.pack(to_minutes(function(moon_date))))
+                moon_date += timedelta(days=29)
+                k += 1
+
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+use_ephemeris()
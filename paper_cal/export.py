@@ -0,0 +1,89 @@
+import csv
+import json
+
+from .rules import Event
+
+# Events written as CSV, TSV or JSON Lines for spreadsheets and warehouses:
+#
+#   date,time,name
+#   2024-07-01,,Canada Day
+#   2024-07-03,20:00:00,"Net control, Name1"
+#
+# Events are written as they come, so that merged() or parallel() over
+# centuries streams to disk in constant memory.  Quoting is left to the csv
+# module: names with spaces, commas, quotes or tabs come back unchanged.
+# Files should be opened with newline=''.
+
+FIELDS = ('date', 'time', 'name')
+
+
+def _row(event: Event) -> tuple[str, str, str]:
+    time = '' if event.time is None else event.time.isoformat()
+    return event.date.isoformat(), time, event.name
+
+
+def json_object(event: Event) -> dict:
+    ''' '''
+
+    return {
+        'date': event.date.isoformat(),
+        'name': event.name,
+        'time': None if event.time is None else event.time.isoformat(),
+    }
+
+
+def _json_time(event: Event) -> str:
+    return 'null' if event.time is None else f'"{event.time.isoformat()}"'
+
+
+def _write_delimited(events, out, dialect, header: bool) -> None:
+    writer = csv.writer(out, dialect)
+    if header:
+        writer.writerow(FIELDS)
+    writer.writerows(map(_row, events))
+
+
+def write_csv(events, out, header: bool = True) -> None:
+    ''' '''
+
+    _write_delimited(events, out, csv.excel, header)
+
+
+def write_tsv(events, out, header: bool = True) -> None:
+    ''' '''
+
+    _write_delimited(events, out, csv.excel_tab, header)
+
+
+def write_jsonl(events, out) -> None:
+    ''' '''
+
+    # One object per line, the same as json.dumps(json_object(event)) but
+    # only the name needs the encoder: dates and times have nothing to escape
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    out.writelines(
+        f'{{"date": "{event.date}", "name": {encode(event.name)}, '
+        f'"time": {_json_time(event)}}}\n'
+        for event in events
+    )
+
+
+def write_text(events, out) -> None:
+    ''' '''
+
+    # Same lines as holiday_all.py
+    out.writelines(f'{event}\n' for event in events)
+
+
+WRITERS = {
+    'text': write_text,
+    'csv': write_csv,
+    'tsv': write_tsv,
+    'jsonl': write_jsonl,
+}
+
+
+def write_events(events, out, format: str = 'text') -> None:
+    ''' '''
+
+    WRITERS[format](events, out)
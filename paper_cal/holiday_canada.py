@@ -0,0 +1,377 @@
+from .observance import NEXT_MONDAY
+from .paper_cal import *
+from .rules import Astronomical, Fixed, Observed, Weekday
+
+#   https://en.wikipedia.org/wiki/Public_holidays_in_Canada
+#   https://fr.wikipedia.org/wiki/F%C3%AAtes_et_jours_f%C3%A9ri%C3%A9s_au_Canada
+
+RULES = [
+    #   https://en.wikipedia.org/wiki/New_Year's_Eve
+    #   https://fr.wikipedia.org/wiki/R%C3%A9veillon_de_la_Saint-Sylvestre
+    #   https://en.wikipedia.org/wiki/New_Year's_Day
+    #   https://fr.wikipedia.org/wiki/Jour_de_l%27an
+    Fixed(month=DECEMBER, day=31, name='New Year\'s Eve'),  # Veille du Nouvel An
+    Fixed(
+        month=JANUARY,
+        day=1,
+        name='New Year\'s Day',
+        regions=('CA',),
+        tags=('statutory',),
+    ),  # Jour de l'an
+    Observed(
+        month=JANUARY,
+        day=1,
+        policy=NEXT_MONDAY,
+        name='New Year\'s Day Observed',
+        regions=('CA',),
+        tags=('statutory',),
+    ),  # Jour de l'an observé
+    #   https://en.wikipedia.org/wiki/National_Flag_of_Canada_Day
+    #   https://fr.wikipedia.org/wiki/Jour_du_drapeau_national_du_Canada
+    Fixed(month=FEBRUARY, day=15, name='Flag Day (CA)'),
+    # Jour du drapeau national du Canada
+    #   https://en.wikipedia.org/wiki/Family_Day
+    #   https://en.wikipedia.org/wiki/Family_Day_%28Canada%29
+    Weekday(
+        weekday=MONDAY,
+        month=FEBRUARY,
+        day=WEEK3,
+        name='Family Day (CA-AB, CA-BC, CA-NB, CA-ON, CA-SK)',
+        tags=('statutory',),
+    ),  # Fête de la famille (CA-AB, CA-BC, CA-NB, CA-ON, CA-SK)
+    Weekday(
+        weekday=MONDAY,
+        month=FEBRUARY,
+        day=WEEK3,
+        name='Louis Riel Day (CA-MB)',
+        tags=('statutory',),
+    ),
+    Weekday(
+        weekday=MONDAY,
+        month=FEBRUARY,
+        day=WEEK3,
+        name='Islander Day (CA-PE)',
+        tags=('statutory',),
+    ),
+    Weekday(
+        weekday=MONDAY,
+        month=FEBRUARY,
+        day=WEEK3,
+        name='Heritage Day (CA-NS)',
+        tags=('statutory',),
+    ),
+    # Journée Louis Riel (CA-MB)
+    # Fête des Insulaires (CA-PE)
+    # Fête du patrimoine (CA-NS)
+    # Heritage Day (CA-YT) is the Friday before the last Sunday in February
+    #   https://en.wikipedia.org/wiki/Family_Day_%28Canada%29
+    Weekday(
+        weekday=SUNDAY,
+        month=FEBRUARY,
+        day=WEEK4,
+        last=True,
+        offset=-2,
+        name='Heritage Day (CA-YT)',
+        tags=('statutory',),
+    ),  # Fête du patrimoine (CA-YT)
+    #   https://en.wikipedia.org/wiki/Commonwealth_Day
+    #   https://fr.wikipedia.org/wiki/Journ%C3%A9e_du_Commonwealth
+    Weekday(weekday=MONDAY, month=MARCH, day=WEEK2, name='Commonwealth Day'),
+    # Journée du Commonwealth
+    #   https://en.wikipedia.org/wiki/Spring_break
+    #   https://fr.wikipedia.org/wiki/Semaine_de_rel%C3%A2che
+    # March Break
+    # Spring Break
+    # Congé de mars
+    # Congé de printemps
+    # Semaine de relâche
+    #   https://en.wikipedia.org/wiki/March_equinox
+    #   https://fr.wikipedia.org/wiki/%C3%89quinoxe_de_mars
+    #   https://en.wikipedia.org/wiki/June_solstice
+    #   https://en.wikipedia.org/wiki/September_equinox
+    #   https://en.wikipedia.org/wiki/December_solstice
+    Astronomical(function=spring, name='First day of Spring'),
+    # Premier jour de printemps
+    Astronomical(function=summer, name='First day of Summer'),
+    # Premier jour d'été
+    Astronomical(function=autumn, name='First day of Fall'),
+    # Premier jour d'automne
+    Astronomical(function=winter, name='First day of Winter'),
+    # Premier jour d'hiver
+    Astronomical(function=perihelion, name='Perihelion'),  # Périhélie
+    Astronomical(function=aphelion, name='Aphelion'),  # Aphélie
+    #   https://en.wikipedia.org/wiki/Victoria_Day
+    #   https://en.wikipedia.org/wiki/National_Patriots%27_Day
+    #   https://fr.wikipedia.org/wiki/F%C3%AAte_de_la_Reine_(Canada)
+    # Victoria Day is the Monday before May 25th
+    # Not a statutory holiday in CA-NB, CA-NL, CA-NS, CA-PE or CA-QC
+    Weekday(
+        weekday=MONDAY,
+        month=MAY,
+        day=21,
+        name='Victoria Day (CA)',
+        regions=(
+            'CA-FED',
+            'CA-AB',
+            'CA-BC',
+            'CA-MB',
+            'CA-NT',
+            'CA-NU',
+            'CA-ON',
+            'CA-SK',
+            'CA-YT',
+        ),
+        tags=('statutory',),
+    ),
+    Weekday(
+        weekday=MONDAY,
+        month=MAY,
+        day=21,
+        name='National Patriot\'s Day (CA-QC)',
+        tags=('statutory',),
+    ),
+    # Fête de la Reine / Fête de Victoria (CA)
+    # Journée nationale des patriotes (CA-QC)
+    #   https://en.wikipedia.org/wiki/Armed_Forces_Day
+    #   https://fr.wikipedia.org/wiki/Jour_des_forces_arm%C3%A9es
+    Weekday(weekday=SUNDAY, month=JUNE, day=WEEK1, name='Armed Forces Day (CA)'),
+    # Journée des forces armées (CA)
+    # Journée des forces armées canadiennes (CA)
+    # Canadian Armed Forces Day
+    #   https://en.wikipedia.org/wiki/Upper_Canada
+    #   https://fr.wikipedia.org/wiki/Haut-Canada
+    #   https://en.wikipedia.org/wiki/Constitutional_history_of_Canada
+    #   https://fr.wikipedia.org/wiki/Histoire_constitutionnelle_du_Canada
+    #   https://www.ontario.ca/laws/statute/97u42
+    #   https://www.ontario.ca/fr/lois/loi/97u42
+    Fixed(month=JUNE, day=19, name='Loyalist Day (CA-ON)'),
+    #   https://en.wikipedia.org/wiki/National_Aboriginal_Day
+    #   https://en.wikipedia.org/wiki/National_Indigenous_Peoples_Day
+    #   https://fr.wikipedia.org/wiki/Journ%C3%A9e_nationale_des_peuples_autochtones
+    #   https://www.canada.ca/en/canadian-heritage/campaigns/indigenous-peoples-day.html
+    #   https://www.canada.ca/fr/patrimoine-canadien/campagnes/journee-peuples-autochtones.html
+    Fixed(month=JUNE, day=21, name='National Indigenous Peoples Day (CA)'),
+    # Journée nationale des peuples autochtones (CA)
+    # National Aboriginal Day (CA)
+    # Journée nationale des Autochthones (CA)
+    #   https://en.wikipedia.org/wiki/Discovery_Day
+    Weekday(weekday=MONDAY, month=JUNE, day=24, name='June Day (CA-NL)'),
+    #   https://en.wikipedia.org/wiki/Multiculturalism_in_Canada
+    #   https://www.canada.ca/en/canadian-heritage/campaigns/multiculturalism-day.html
+    #   https://www.canada.ca/fr/patrimoine-canadien/campagnes/journee-multiculturalisme.html
+    Fixed(month=JUNE, day=27, name='Canadian Multiculturalism Day', regions=('CA',)),
+    # Journée canadienne du multiculturalisme
+    #   https://en.wikipedia.org/wiki/Canada_Day
+    #   https://fr.wikipedia.org/wiki/F%C3%AAte_du_Canada
+    Fixed(
+        month=JULY, day=1, name='Canada Day', regions=('CA',), tags=('statutory',)
+    ),  # Fête du Canada
+    Observed(
+        month=JULY,
+        day=1,
+        policy=NEXT_MONDAY,
+        name='Canada Day Observed',
+        regions=('CA',),
+        tags=('statutory',),
+    ),  # Fête du Canada observé
+    #   https://en.wikipedia.org/wiki/Memorial_Day_(Newfoundland_and_Labrador)
+    Fixed(month=JULY, day=1, name='Memorial Day (CA-NL)'),
+    #   https://en.wikipedia.org/wiki/Nunavut_Day
+    Fixed(
+        month=JULY, day=9, name='Nunavut Day ᓄᓇᕗᑦ ᐅᓪᓗᖓ  (CA-NU)', tags=('statutory',)
+    ),
+    # Fête du Nunavut (CA-NU)
+    #   https://en.wikipedia.org/wiki/Construction_Holiday_%28Quebec%29
+    #   https://fr.wikipedia.org/wiki/Vacances_de_la_construction
+    #   https://www.ccq.org/en/avantages-sociaux/dates-conges-vacances
+    #   https://www.ccq.org/fr-CA/avantages-sociaux/dates-conges-vacances
+    # The Quebec Construction Holiday begins on the 2nd last Sunday of July and
+    # lasts for 2 weeks
+    Weekday(
+        weekday=SUNDAY,
+        month=JULY,
+        day=WEEK4,
+        last=True,
+        offset=-7,
+        name='Construction Holiday Begins (CA-QC)',
+    ),  # Début des vacances de la construction (CA-QC)
+    Weekday(
+        weekday=SUNDAY,
+        month=JULY,
+        day=WEEK4,
+        last=True,
+        offset=6,
+        name='Construction Holiday Ends (CA-QC)',
+    ),  # Fin des vacances de la construction (CA-QC)
+    #   https://en.wikipedia.org/wiki/Civic_Holiday
+    #   https://en.wikipedia.org/wiki/Public_holidays_in_Canada
+    #   https://fr.wikipedia.org/wiki/F%C3%AAtes_et_jours_f%C3%A9ri%C3%A9s_au_Canada
+    # XXX FIXME TODO  CA-ON Simcoe Day???
+    # Only a statutory holiday in CA-NT and CA-NU
+    Weekday(
+        weekday=MONDAY,
+        month=AUGUST,
+        day=WEEK1,
+        name='Civic Holiday (CA-NT, CA-NU)',
+        tags=('statutory',),
+    ),  # Jour férié
+    Weekday(
+        weekday=MONDAY, month=AUGUST, day=WEEK1, name='Civic Holiday (CA-NL, CA-ON)'
+    ),
+    # Premier lundi d'août
+    # Congé civique
+    Weekday(weekday=MONDAY, month=AUGUST, day=WEEK1, name='Heritage Day (CA-AB)'),
+    # Fête du patrimoine (CA-AB, CA-YT)
+    Weekday(
+        weekday=MONDAY,
+        month=AUGUST,
+        day=WEEK1,
+        name='British Columbia Day (CA-BC)',
+        tags=('statutory',),
+    ),  # Jour de la Colombie-Britannique (CA-BC)
+    Weekday(weekday=MONDAY, month=AUGUST, day=WEEK1, name='Terry Fox Day (CA-MB)'),
+    Weekday(
+        weekday=MONDAY,
+        month=AUGUST,
+        day=WEEK1,
+        name='New Brunswick Day (CA-NB)',
+        tags=('statutory',),
+    ),  # Jour de Nouveau Brunswick (CA-NB)
+    Weekday(weekday=MONDAY, month=AUGUST, day=WEEK1, name='Natal Day (CA-NS)'),
+    # Jour de la Fondation (CA-NS)
+    Weekday(
+        weekday=MONDAY,
+        month=AUGUST,
+        day=WEEK1,
+        name='Saskatchewan Day (CA-SK)',
+        tags=('statutory',),
+    ),  # Jour de Saskatchewan (CA-SK)
+    #   https://en.wikipedia.org/wiki/International_Day_of_the_World's_Indigenous_Peoples
+    #   https://fr.wikipedia.org/wiki/Journ%C3%A9e_internationale_des_populations_autochtones
+    Fixed(
+        month=AUGUST,
+        day=9,
+        name='International Day of the World\'s Indigenous Peoples',
+    ),  # Journée internationale des populations autochtones du monde
+    #   https://en.wikipedia.org/wiki/Discovery_Day
+    Weekday(
+        weekday=MONDAY,
+        month=AUGUST,
+        day=WEEK3,
+        name='Discovery Day (CA-YT)',
+        tags=('statutory',),
+    ),
+    # Journée de la Découverte (CA-YT)
+    Weekday(
+        weekday=FRIDAY, month=AUGUST, day=WEEK3, name='Gold Cup Parade Day (CA-PE)'
+    ),  # Défilé de la Coupe d'or (CA-PE)
+    #   https://en.wikipedia.org/wiki/Labour_Day
+    #   https://fr.wikipedia.org/wiki/F%C3%AAte_du_Travail
+    Weekday(
+        weekday=MONDAY,
+        month=SEPTEMBER,
+        day=WEEK1,
+        name='Labour Day',
+        regions=('CA',),
+        tags=('statutory',),
+    ),
+    # Fête du Travail
+    #   https://en.wikipedia.org/wiki/Orange_Shirt_Day
+    #   https://fr.wikipedia.org/wiki/Journ%C3%A9e_nationale_de_la_v%C3%A9rit%C3%A9_et_de_la_r%C3%A9conciliation
+    #   https://www.orangeshirtday.org/
+    # A statutory holiday for federally regulated workplaces (CA-FED) and in
+    # a few provinces and territories only
+    Fixed(
+        month=SEPTEMBER,
+        day=30,
+        name='National Day for Truth and Reconciliation (CA)',
+        regions=('CA-FED', 'CA-BC', 'CA-MB', 'CA-NT', 'CA-NU', 'CA-PE', 'CA-YT'),
+        tags=('statutory',),
+    ),
+    # Journée nationale de la vérité et de la réconciliation (CA)
+    # Orange Shirt Day (CA)
+    # Journée du chandail orange (CA)
+    #   https://en.wikipedia.org/wiki/Thanksgiving#Canada
+    #   https://fr.wikipedia.org/wiki/Action_de_gr%C3%A2ce_(Canada)
+    #   https://en.wikipedia.org/wiki/Oktoberfest
+    #   https://fr.wikipedia.org/wiki/Oktoberfest
+    # Oktoberfest (CA-ON) starts the Friday before Thanksgiving and ends the
+    # Saturday after
+    # Not a statutory holiday in CA-NB, CA-NL, CA-NS or CA-PE
+    Weekday(
+        weekday=MONDAY,
+        month=OCTOBER,
+        day=WEEK2,
+        name='Thanksgiving Day (CA)',
+        regions=(
+            'CA-FED',
+            'CA-AB',
+            'CA-BC',
+            'CA-MB',
+            'CA-NT',
+            'CA-NU',
+            'CA-ON',
+            'CA-QC',
+            'CA-SK',
+            'CA-YT',
+        ),
+        tags=('statutory',),
+    ),
+    # Action de grâce (CA)
+    Weekday(
+        weekday=MONDAY,
+        month=OCTOBER,
+        day=WEEK2,
+        offset=-3,
+        name='Oktoberfest Begins (CA-ON)',
+    ),  # Début de l'Oktoberfest (CA-ON)
+    Weekday(
+        weekday=MONDAY,
+        month=OCTOBER,
+        day=WEEK2,
+        offset=8,
+        name='Oktoberfest Ends (CA-ON)',
+    ),  # Fin de l'Oktoberfest (CA-ON)
+    #   https://en.wikipedia.org/wiki/Remembrance_Day
+    #   https://fr.wikipedia.org/wiki/Jour_du_Souvenir
+    #   https://en.wikipedia.org/wiki/Armistice_Day
+    #   https://fr.wikipedia.org/wiki/Jour_du_Souvenir
+    #   https://en.wikipedia.org/wiki/Merchant_Navy_(United_Kingdom)
+    # Not a statutory holiday in CA-MB, CA-ON or CA-QC
+    Fixed(
+        month=NOVEMBER,
+        day=11,
+        name='Rememberance Day',
+        regions=(
+            'CA-FED',
+            'CA-AB',
+            'CA-BC',
+            'CA-NB',
+            'CA-NL',
+            'CA-NS',
+            'CA-NT',
+            'CA-NU',
+            'CA-PE',
+            'CA-SK',
+            'CA-YT',
+        ),
+        tags=('statutory',),
+    ),  # Jour du Souvenir
+    Fixed(month=NOVEMBER, day=11, name='Armistice Day (CA-NL)'),
+    # Jour de l'Armistice (CA-NL)
+    Fixed(month=SEPTEMBER, day=3, name='Merchant Navy Day', regions=('CA',)),
+    # Merchant Navy Rememberance Day
+    # Jour de la marine marchande
+    #   https://en.wikipedia.org/wiki/Statute_of_Westminster_1931
+    #   https://fr.wikipedia.org/wiki/Statut_de_Westminster_de_1931
+    #   https://www.canada.ca/en/canadian-heritage/services/important-commemorative-days/anniversary-statute-westminster.html
+    #   https://www.canada.ca/fr/patrimoine-canadien/services/journees-importantes-commemoratives/anniversaire-statut-westminster.html
+    # The Statute of Westminster was enacted on December 11th, 1931
+    Fixed(
+        month=DECEMBER,
+        day=11,
+        since=1931,
+        name='Anniversary of the Statute of Westminster',
+        regions=('CA',),
+    ),  # Anniversaire du Statut de Westminster
+]
@@ -0,0 +1,367 @@
+from datetime import time, timezone
+
+from .observance import SUNDAY_TO_MONDAY
+from .paper_cal import *
+from .rules import Coincident, Easter, Fixed, Observed, Weekday, YearDay
+
+RULES = [
+    #   https://en.wikipedia.org/wiki/(137108)_1999_AN10
+    #   https://fr.wikipedia.org/wiki/(137108)_1999_AN10
+    #   https://en.wikipedia.org/wiki/(35396)_1997_XF11
+    #   https://fr.wikipedia.org/wiki/(35396)_1997_XF11
+    Fixed(
+        month=AUGUST,
+        day=7,
+        time=time(6, 48),
+        years=(2027,),
+        name='1999 AN10 Asteroid Pass',
+    ),
+    Fixed(
+        month=OCTOBER,
+        day=26,
+        time=time(6, 44),
+        years=(2028,),
+        name='1997 XF11 Asteroid Pass',
+    ),
+    #   https://en.wikipedia.org/wiki/Daylight_saving_time_by_country
+    #   https://en.wikipedia.org/wiki/Daylight_saving_time_in_Canada
+    #   https://www.timeanddate.com/time/zones/y
+    #   https://www.timeanddate.com/time/zones/r
+    #   https://www.timeanddate.com/time/zones/q
+    #   https://www.timeanddate.com/time/zones/z
+    #   https://www.timeanddate.com/time/zones/a
+    #   https://www.timeanddate.com/time/zones/b
+    #   https://www.timeanddate.com/time/zones/m
+    # DST Begins = "Spring forward"
+    # DST Ends = "Fall back"
+    #     UTC-12:00 -> Yankee
+    #     UTC-05:00 -> Romeo
+    #     UTC-04:00 -> Quebec
+    #     UTC+00:00 -> Zulu
+    #     UTC+01:00 -> Alpha
+    #     UTC+02:00 -> Bravo
+    #     UTC+12:00 -> Mike
+    Weekday(
+        weekday=SUNDAY,
+        month=MARCH,
+        day=WEEK2,
+        time=time(2, 0),
+        name='Daylight Savings Time Begins (CA, US)',
+    ),  # Heure d'éte commence (CA, US)
+    Weekday(
+        weekday=SUNDAY,
+        month=MARCH,
+        day=WEEK4,
+        last=True,
+        time=time(1, 0, tzinfo=timezone.utc),
+        name='Daylight Savings Time Begins (EU, UK)',
+    ),  # Heure d'éte commence (EU, UK)
+    Weekday(
+        weekday=SUNDAY,
+        month=NOVEMBER,
+        day=WEEK1,
+        time=time(2, 0),
+        name='Daylight Savings Time Ends (CA, US)',
+    ),  # Heure d'éte termine (CA, US)
+    Weekday(
+        weekday=SUNDAY,
+        month=OCTOBER,
+        day=WEEK4,
+        last=True,
+        time=time(1, 0, tzinfo=timezone.utc),
+        name='Daylight Savings Time Ends (EU, UK)',
+    ),  # Heure d'éte termine (EU, UK)
+    #   https://en.wikipedia.org/wiki/Friday_The_13th
+    #   https://fr.wikipedia.org/wiki/Vendredi_treize
+    Coincident(weekday=FRIDAY, day=13, name='Friday the 13th'),  # Vendredi treize
+    #   https://www.canada.ca/en/canadian-heritage/services/important-commemorative-days.html
+    #   https://www.canada.ca/fr/patrimoine-canadien/services/journees-importantes-commemoratives.html
+    #   https://www.canada.ca/en/canadian-heritage/news/2022/01/statement-by-minister-hussen-on-raoul-wallenberg-day.html
+    #   https://www.canada.ca/fr/patrimoine-canadien/nouvelles/2022/01/declaration-du-ministrehussen-a-loccasion-de-la-journee-raoulwallenberg.html
+    #   https://en.wikipedia.org/wiki/Raoul_Wallenberg
+    #   https://fr.wikipedia.org/wiki/Raoul_Wallenberg
+    Fixed(month=JANUARY, day=17, name='Raoul Wallenburg Day'),
+    # Journée Raoul Wallenberg
+    #   https://en.wikipedia.org/wiki/Martin_Luther_King_Jr._Day
+    #   https://fr.wikipedia.org/wiki/Martin_Luther_King_Day
+    Weekday(
+        weekday=MONDAY,
+        month=JANUARY,
+        day=WEEK3,
+        name='Martin Luther King Jr. Day (US)',
+    ),  # Journée de Martin Luther King Jr. (US)
+    # Inauguration Day (US) is January 20th or the 21st if the 20th is a Sunday
+    # every 4th year where "year mod 4 == 1" (2001, ..., 2013, 2017, 2021,
+    # 2025, 2029, etc.)
+    #   https://en.wikipedia.org/wiki/United_States_presidential_inauguration
+    Observed(
+        month=JANUARY,
+        day=20,
+        policy=SUNDAY_TO_MONDAY,
+        keep=True,
+        years=range(1, 10000, 4),
+        name='Inauguration Day (US)',
+    ),
+    # Jour d'inauguration (US)
+    #   https://en.wikipedia.org/wiki/Groundhog_Day
+    #   https://fr.wikipedia.org/wiki/Jour_de_la_marmotte
+    Fixed(month=FEBRUARY, day=2, name='Groundhog Day'),  # Jour de la marmotte
+    #   https://en.wikipedia.org/wiki/Washington's_Birthday
+    #   https://en.wikipedia.org/wiki/Presidents%27_Day
+    #   https://fr.wikipedia.org/wiki/Presidents_Day
+    Weekday(weekday=MONDAY, month=FEBRUARY, day=WEEK3, name='President\'s Day (US)'),
+    # Journée de la Présidence (US)
+    #   https://en.wikipedia.org/wiki/April_Fools'_Day
+    #   https://fr.wikipedia.org/wiki/Poisson_d%27avril
+    Fixed(month=APRIL, day=1, name='April Fool\'s Day'),  # Poisson d'avril
+    #   https://en.wikipedia.org/wiki/Tartan_Day
+    #   https://fr.wikipedia.org/wiki/Tartan_Day
+    Fixed(month=APRIL, day=6, name='Tartan Day'),  # Journée du Tartan
+    #   https://en.wikipedia.org/wiki/Earth_Day
+    #   https://fr.wikipedia.org/wiki/Jour_de_la_Terre
+    Fixed(month=APRIL, day=22, name='Earth Day'),  # Jour de la Terre
+    #   https://en.wikipedia.org/wiki/Anzac_Day
+    Fixed(month=APRIL, day=25, name='ANZAC Day (AU, NZ)'),
+    # Jour d'ANZAC (AU, NZ)
+    #   https://en.wikipedia.org/wiki/Mother's_Day
+    #   https://fr.wikipedia.org/wiki/F%C3%AAte_des_M%C3%A8res
+    #   https://en.wikipedia.org/wiki/Mothering_Sunday
+    # Mothering Sunday (UK) is 4th Sunday of Lent / exactly 3 weeks before Easter Sunday
+    Weekday(weekday=SUNDAY, month=MAY, day=WEEK2, name='Mother\'s Day'),
+    Easter(offset=-21, name='Mothering Sunday (UK)'),
+    # Fête des mères
+    #   https://en.wikipedia.org/wiki/Armed_Forces_Day
+    #   https://fr.wikipedia.org/wiki/Jour_des_forces_arm%C3%A9es
+    #   https://en.wikipedia.org/wiki/Memorial_Day
+    #   https://fr.wikipedia.org/wiki/Memorial_Day
+    Weekday(weekday=SATURDAY, month=MAY, day=WEEK2, name='Armed Forces Week (US)'),
+    Weekday(weekday=SATURDAY, month=MAY, day=WEEK3, name='Armed Forces Day (US)'),
+    # Journée des forces armées (US)
+    Weekday(weekday=MONDAY, month=MAY, day=WEEK4, last=True, name='Memorial Day (US)'),
+    #   https://en.wikipedia.org/wiki/Flag_Day_(United_States)
+    Fixed(month=JUNE, day=14, name='Flag Day (US)'),  # Jour du drapeau (US)
+    #   https://en.wikipedia.org/wiki/Father's_Day
+    #   https://fr.wikipedia.org/wiki/F%C3%AAte_des_P%C3%A8res
+    Weekday(weekday=SUNDAY, month=JUNE, day=WEEK3, name='Father\'s Day'),
+    # Fête des pères
+    #   https://en.wikipedia.org/wiki/Independence_Day_%28United_States%29
+    Fixed(month=JULY, day=4, name='Independence Day (US)'),
+    # Jour de l'indépendance (US)
+    #   https://en.wikipedia.org/wiki/Grandparents'_Day
+    #   https://fr.wikipedia.org/wiki/F%C3%AAte_des_grands-parents
+    # XXX FIXME TODO  2nd Sunday in September or 1st Sunday after Labour Day
+    # Weekday(weekday=SUNDAY, month=SEPTEMBER, day=WEEK2, name='Grandparents\' Day (US)'),
+    # Weekday(weekday=MONDAY, month=SEPTEMBER, day=WEEK1, offset=6, name='Grandparents\' Day (US)'),
+    # Fête des grands-parents (US)
+    # Journée nationale des grands-parents (US)
+    #   https://en.wikipedia.org/wiki/Columbus_Day
+    Weekday(weekday=MONDAY, month=OCTOBER, day=WEEK2, name='Columbus Day (US)'),
+    # Jour de Columbus (US)
+    #   https://en.wikipedia.org/wiki/Halloween
+    #   https://fr.wikipedia.org/wiki/Halloween
+    Fixed(month=OCTOBER, day=31, name='Hallowe\'en'),  # Halloween
+    #   https://en.wikipedia.org/wiki/Thanksgiving
+    #   https://en.wikipedia.org/wiki/Black_Friday_(shopping)
+    #   https://en.wikipedia.org/wiki/Cyber_Monday
+    Weekday(
+        weekday=THURSDAY, month=NOVEMBER, day=WEEK4, name='Thanksgiving Day (US)'
+    ),  # Action de Grâce (US)
+    Weekday(
+        weekday=THURSDAY,
+        month=NOVEMBER,
+        day=WEEK4,
+        offset=1,
+        name='Black Friday (US)',
+    ),  # Vendredi Noir (US)
+    Weekday(
+        weekday=THURSDAY,
+        month=NOVEMBER,
+        day=WEEK4,
+        offset=3,
+        name='Cyber Monday (US)',
+    ),  # Cyber Lundi (US)
+    #   https://uk-public-holidays.com/early-may-bank-holiday/
+    #   https://uk-public-holidays.com/spring-bank-holiday/
+    #   https://uk-public-holidays.com/summer-bank-holiday/
+    Weekday(
+        weekday=MONDAY, month=MAY, day=WEEK1, name='Early May Bank Holiday (UK)'
+    ),  # May Day
+    Fixed(month=JUNE, day=2, years=(2022,), name='Spring Bank Holiday (UK)'),
+    Fixed(month=JUNE, day=3, years=(2022,), name='Platinum Jubilee Bank Holiday (UK)'),
+    Weekday(
+        weekday=MONDAY,
+        month=MAY,
+        day=WEEK4,
+        last=True,
+        skip=(2022,),
+        name='Spring Bank Holiday (UK)',
+    ),
+    Weekday(
+        weekday=MONDAY,
+        month=AUGUST,
+        day=WEEK4,
+        last=True,
+        name='Summer Bank Holiday (UK)',
+    ),
+    #   https://en.wikipedia.org/wiki/Guy_Fawkes_Night
+    Fixed(month=NOVEMBER, day=5, name='Guy Fawkes Day (UK)'),
+    # Journée de Guy Fawkes (UK)
+    #   https://en.wikipedia.org/wiki/Veterans_Day
+    #   https://fr.wikipedia.org/wiki/Veterans_Day
+    #   https://en.wikipedia.org/wiki/Armistice_Day
+    #   https://fr.wikipedia.org/wiki/Jour_de_l%27Armistice
+    Fixed(month=NOVEMBER, day=11, name='Veterans Day (US)'),
+    # Journée des anciens combattants (US)
+    Fixed(month=NOVEMBER, day=11, name='Armistice Day (UK)'),
+    # Jour de l'Armistice (UK)
+    #   https://en.wikipedia.org/wiki/National_Pearl_Harbor_Remembrance_Day
+    Fixed(month=DECEMBER, day=7, name='Pearl Harbor Day (US)'),
+    #   https://en.wikipedia.org/wiki/Kwanzaa
+    #   https://fr.wikipedia.org/wiki/Kwanzaa
+    Fixed(month=DECEMBER, day=26, name='Kwanzaa Begins'),
+    Fixed(month=JANUARY, day=1, name='Kwanzaa Ends'),
+    # Début de Kwanzaa
+    # Fin de Kwanzaa
+    #   https://en.wikipedia.org/wiki/Hogmanay
+    #   https://fr.wikipedia.org/wiki/Hogmanay
+    Fixed(month=DECEMBER, day=31, name='Hogmanay (UK)'),
+    #   https://es.wikipedia.org/wiki/Reyes_Magos
+    #   https://es.wikipedia.org/wiki/Viernes_Santo
+    #   https://es.wikipedia.org/wiki/Pascua
+    #   https://es.wikipedia.org/wiki/D%C3%ADa_Internacional_de_los_Trabajadores
+    #   https://es.wikipedia.org/wiki/Fiesta_de_San_Juan
+    #   https://es.wikipedia.org/wiki/Asunci%C3%B3n_de_Mar%C3%ADa
+    #   https://es.wikipedia.org/wiki/D%C3%ADa_de_Catalu%C3%B1a
+    #   https://es.wikipedia.org/wiki/Fiesta_Nacional_de_Espa%C3%B1a
+    #   https://es.wikipedia.org/wiki/D%C3%ADa_de_Todos_los_Santos
+    #   https://es.wikipedia.org/wiki/D%C3%ADa_de_la_Constituci%C3%B3n_(Espa%C3%B1a)
+    #   https://es.wikipedia.org/wiki/Inmaculada_Concepci%C3%B3n
+    #   https://es.wikipedia.org/wiki/Navidad
+    #   https://es.wikipedia.org/wiki/D%C3%ADa_de_San_Esteban
+    Fixed(month=JANUARY, day=6, name='Reyes (ES)'),
+    Fixed(month=APRIL, day=7, name='Viernes Santo (ES)'),
+    Fixed(month=APRIL, day=10, name='Pascua (ES)'),
+    Fixed(month=MAY, day=1, name='Fiesta del Trabajo (ES)'),
+    Fixed(month=JUNE, day=24, name='San Juan (CAT)'),
+    Fixed(month=AUGUST, day=15, name='La Asunción (ES)'),
+    Fixed(month=SEPTEMBER, day=11, name='Diada Nacional de Catalunya (ES)'),
+    Fixed(month=OCTOBER, day=12, name='Fiesta Nacional de España (ES)'),
+    Fixed(month=NOVEMBER, day=1, name='Todos los Santos (ES)'),
+    Fixed(month=DECEMBER, day=6, name='Dia de la Constitución (ES)'),
+    Fixed(month=DECEMBER, day=8, name='La Inmaculada (ES)'),
+    Fixed(month=DECEMBER, day=25, name='Navidad (ES)'),
+    Fixed(month=DECEMBER, day=26, name='San Esteban (CAT)'),
+    #   https://en.wikipedia.org/wiki/List_of_minor_secular_observances
+    #   https://en.wikipedia.org/wiki/Employee_Appreciation_Day
+    Weekday(
+        weekday=FRIDAY,
+        month=MARCH,
+        day=WEEK1,
+        name='Employee Appreciation Day (CA, US)',
+    ),
+    #   https://en.wikipedia.org/wiki/International_Cat_Day
+    #   https://fr.wikipedia.org/wiki/Journ%C3%A9e_internationale_du_chat
+    #   https://en.wikipedia.org/wiki/National_Cat_Day
+    #   https://fr.wikipedia.org/wiki/Journ%C3%A9e_nationale_du_chat
+    # Caturday!!!
+    Fixed(month=FEBRUARY, day=17, name='National Cat Day (BR, IT)'),
+    Fixed(month=FEBRUARY, day=22, name='National Cat Day (JP)'),
+    Fixed(month=MARCH, day=1, name='National Cat Day (RU)'),
+    Fixed(month=AUGUST, day=8, name='National Cat Day (CA)'),
+    Fixed(month=AUGUST, day=8, name='International Cat Day'),
+    Fixed(month=OCTOBER, day=29, name='National Cat Day (US)'),
+    #   https://en.wikipedia.org/wiki/Caps_lock#International_Caps_Lock_Day
+    Fixed(month=JUNE, day=28, name='INTERNATIONAL CAPS LOCK DAY'),
+    Fixed(month=OCTOBER, day=22, name='INTERNATIONAL CAPS LOCK DAY'),
+    # JOURNÉE INTERNATIONALE DU VERROUILLAGE DES MAJUSCULES
+    #   https://en.wikipedia.org/wiki/Day_of_the_Programmer
+    YearDay(day=256, name='Day of the Programmer 256th day'),
+    # Jour du programmeur 256e jour
+    #   https://en.wikipedia.org/wiki/Software_Freedom_Day
+    Weekday(
+        weekday=SATURDAY, month=SEPTEMBER, day=WEEK3, name='Software Freedom Day'
+    ),  # Journée de la liberté des logiciels
+    #   http://worldradioday.org
+    Fixed(month=FEBRUARY, day=13, name='World Radio Day'),
+    # Journée mondiale de la radio
+    #   http://iaru.org/world-amateur-radio-day.html
+    Fixed(month=APRIL, day=18, name='World Amateur Radio Day'),
+    # Journée de la radio amateur
+    #   https://en.wikipedia.org/wiki/Pi_Day
+    #   https://fr.wikipedia.org/wiki/Journ%C3%A9e_de_pi
+    #   https://piday.org/
+    #   https://tauday.com/
+    #   https://piapproximationday.com/
+    Fixed(month=MARCH, day=14, name='Pi Day 3.14'),  # Journée de pi 3.14
+    Fixed(month=JUNE, day=28, name='Tau Day 6.28'),  # Journée de tau 6.28
+    Fixed(month=JULY, day=22, name='Pi Approximation Day 22/7'),
+    YearDay(day=314, name='Pi Approximation Day 314th day'),
+    # Journée d'approximation pi 22/7
+    # Journée d'approximation pi 314e jour
+    #   https://en.wikipedia.org/wiki/Nikola_Tesla
+    #   https://fr.wikipedia.org/wiki/Nikola_Tesla
+    #   https://nikolatesladay.com/
+    Fixed(month=JULY, day=10, name='Nikola Tesla Day'),
+    #   https://en.wikipedia.org/wiki/Ada_Lovelace_Day
+    #   http://findingada.com/about/when-is-ald/
+    Weekday(weekday=TUESDAY, month=OCTOBER, day=WEEK2, name='Ada Lovelace Day'),
+    # Journée de Ada Lovelace
+    #   https://en.wikipedia.org/wiki/Darwin_Day
+    #   https://fr.wikipedia.org/wiki/Journ%C3%A9e_Darwin
+    Fixed(month=FEBRUARY, day=12, name='Darwin Day'),
+    # Journée de Darwin
+    #   https://en.wikipedia.org/wiki/International_Lefthanders_Day
+    #   https://fr.wikipedia.org/wiki/Journ%C3%A9e_internationale_des_gauchers
+    Fixed(month=AUGUST, day=13, name='Left-Handers\' Day'),
+    # Journée internationale des gauchers
+    Fixed(month=FEBRUARY, day=20, since=1991, name='Birthday of Python'),
+    Fixed(month=FEBRUARY, day=-1, since=2012, name='Birthday of Raspberry Pi'),
+    Fixed(month=MARCH, day=11, since=2002, name='Birthday of Arch'),
+    Fixed(month=MARCH, day=15, since=2013, name='Birthday of Docker'),
+    Fixed(month=MARCH, day=18, since=1985, name='Birthday of GNU Manifesto'),
+    Fixed(month=MARCH, day=21, since=1993, name='Birthday of NetBSD'),
+    Fixed(month=APRIL, day=3, since=2005, name='Birthday of Git'),
+    Fixed(month=APRIL, day=16, since=1971, name='Birthday of FTP'),
+    Fixed(month=JUNE, day=1, since=1969, name='Birthday of Unix'),
+    Fixed(month=JUNE, day=19, since=1984, name='Birthday of X-Windows'),
+    Fixed(month=JUNE, day=19, since=1993, name='Birthday of FreeBSD'),
+    Fixed(month=JUNE, day=7, since=2014, name='Birthday of Kubernetes'),
+    Fixed(month=JULY, day=16, since=1993, name='Birthday of Slackware'),
+    Fixed(month=AUGUST, day=1, since=1998, name='Birthday of IRC'),
+    Fixed(month=AUGUST, day=15, since=1997, name='Birthday of GNOME'),
+    Fixed(month=AUGUST, day=16, since=1993, name='Birthday of Debian'),
+    Fixed(month=AUGUST, day=25, since=1991, name='Birthday of Linux'),
+    Fixed(month=SEPTEMBER, day=27, since=1983, name='Birthday of GNU'),
+    Fixed(month=SEPTEMBER, day=28, since=2010, name='Birthday of LibreOffice'),
+    Fixed(month=OCTOBER, day=18, since=1995, name='Birthday of OpenBSD'),
+    Fixed(month=OCTOBER, day=19, since=2009, name='Birthday of Alpine'),
+    Fixed(month=OCTOBER, day=20, since=2004, name='Birthday of Ubuntu'),
+    Fixed(month=NOVEMBER, day=21, since=1995, name='Birthday of GIMP'),
+    Fixed(month=MARCH, day=21, name='Aries Rises'),  # Ascension du bélier
+    Fixed(month=APRIL, day=19, name='Aries Sets'),  # Descension du bélier
+    Fixed(month=APRIL, day=20, name='Taurus Rises'),  # Ascension du taureau
+    Fixed(month=MAY, day=20, name='Taurus Sets'),  # Descension du taureau
+    Fixed(month=MAY, day=21, name='Gemini Rises'),  # Ascension des gémeaux
+    Fixed(month=JUNE, day=20, name='Gemini Sets'),  # Descension des gémeaux
+    Fixed(month=JUNE, day=21, name='Cancer Rises'),  # Ascension du cancer
+    Fixed(month=JULY, day=22, name='Cancer Sets'),  # Descension du cancer
+    Fixed(month=JULY, day=23, name='Leo Rises'),  # Ascension du lion
+    Fixed(month=AUGUST, day=22, name='Leo Sets'),  # Descension du lion
+    Fixed(month=AUGUST, day=23, name='Virgo Rises'),  # Ascension de la vierge
+    Fixed(month=SEPTEMBER, day=22, name='Virgo Sets'),  # Descension de la vierge
+    Fixed(month=SEPTEMBER, day=23, name='Libra Rises'),  # Ascension de la balance
+    Fixed(month=OCTOBER, day=22, name='Libra Sets'),  # Descension de la balance
+    Fixed(month=OCTOBER, day=23, name='Scorpio Rises'),  # Ascension du scorpion
+    Fixed(month=NOVEMBER, day=21, name='Scorpio Sets'),  # Descension du scorpion
+    Fixed(month=NOVEMBER, day=22, name='Sagittarius Rises'),
+    # Ascension du sagittaire
+    Fixed(month=DECEMBER, day=21, name='Sagittarius Sets'),
+    # Descension du sagittaire
+    Fixed(month=DECEMBER, day=22, name='Capricorn Rises'),
+    # Ascension du capricorne
+    Fixed(month=JANUARY, day=19, name='Capricorn Sets'),  # Descension du capricorne
+    Fixed(month=JANUARY, day=20, name='Aquarius Rises'),  # Ascension du verseau
+    Fixed(month=FEBRUARY, day=18, name='Aquarius Sets'),  # Descension du verseau
+    Fixed(month=FEBRUARY, day=19, name='Pisces Rises'),  # Ascension des poissons
+    Fixed(month=MARCH, day=20, name='Pisces Sets'),  # Descension des poissons
+]
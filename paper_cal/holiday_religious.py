@@ -0,0 +1,276 @@
+from .observance import NEXT_MONDAY
+from .paper_cal import *
+from .rules import (
+    Astronomical,
+    Easter,
+    Fixed,
+    Hebrew,
+    Islamic,
+    Lunar,
+    MoonPhase,
+    Observed,
+    Weekday,
+)
+
+RULES = [
+    MoonPhase(phase=NEW_MOON, name='New Moon'),
+    MoonPhase(phase=FIRST_QUARTER_MOON, name='First Moon'),
+    MoonPhase(phase=FULL_MOON, name='Full Moon'),
+    MoonPhase(phase=LAST_QUARTER_MOON, name='Last Moon'),
+    #   https://en.wikipedia.org/wiki/Epiphany_(holiday)
+    #   https://fr.wikipedia.org/wiki/%C3%89piphanie
+    #   https://en.wikipedia.org/wiki/Baptism_of_the_Lord
+    # Baptism of the Lord is the 1st Sunday after January 6th
+    # Jesus
+    Fixed(month=JANUARY, day=6, name='Epiphany'),  # Epiphanie
+    Weekday(weekday=SUNDAY, month=JANUARY, day=10, name='Baptism of the Lord'),
+    #   https://en.wikipedia.org/wiki/Conversion_of_Paul_the_Apostle
+    #   https://fr.wikipedia.org/wiki/Conversion_de_Paul
+    Fixed(month=JANUARY, day=25, name='Conversion of St. Paul'),
+    # Conversion de Paul
+    #   https://en.wikipedia.org/wiki/Valentine%27s_Day
+    #   https://fr.wikipedia.org/wiki/Saint-Valentin
+    Fixed(month=FEBRUARY, day=14, name='St. Valentine\'s Day'),  # Saint-Valentin
+    #   https://en.wikipedia.org/wiki/Saint_David%27s_Day
+    #   https://fr.wikipedia.org/wiki/Saint_David%27s_Day
+    #   https://en.wikipedia.org/wiki/Saint_Patrick%27s_Day
+    #   https://fr.wikipedia.org/wiki/F%C3%AAte_de_la_Saint-Patrick
+    #   https://en.wikipedia.org/wiki/Saint_George%27s_Day
+    #   https://fr.wikipedia.org/wiki/Sant_Jordi
+    #   https://en.wikipedia.org/wiki/Saint_Andrew%27s_Day
+    #   https://fr.wikipedia.org/wiki/F%C3%AAte_de_la_Saint-Andr%C3%A9
+    # St. Patrick's Day (CA-NL) is the Monday nearest March 17th
+    # St. George's Day (CA-NL) is the Monday nearest April 23rd
+    Fixed(month=MARCH, day=1, name='St. David\'s Day'),
+    Fixed(month=MARCH, day=17, name='St. Patrick\'s Day'),
+    Weekday(weekday=MONDAY, month=MARCH, day=17, name='St. Patrick\'s Day (CA-NL)'),
+    Weekday(weekday=MONDAY, month=APRIL, day=23, name='St. George\'s Day (CA-NL)'),
+    Fixed(month=APRIL, day=23, name='St. George\'s Day'),
+    Fixed(month=NOVEMBER, day=30, name='St. Andrew\'s Day'),
+    # Fête de la Saint-David (UK)
+    # Fête de la Saint-Patrick
+    # Fête de la Saint-Patrick (CA-NL)
+    # Fête de la Saint-Georges (CA-NL) (UK)
+    # Fête de la Saint-André (UK)
+    #   https://en.wikipedia.org/wiki/Annunciation
+    #   https://fr.wikipedia.org/wiki/Annonciation
+    Fixed(month=MARCH, day=25, name='Annunciation'),  # Annonciation
+    #   https://en.wikipedia.org/wiki/Ecclesiastical_full_moon
+    #   https://en.wikipedia.org/wiki/Computus
+    #   https://en.wikipedia.org/wiki/Date_of_Easter
+    #   https://fr.wikipedia.org/wiki/Calcul_de_la_date_de_P%C3%A2ques
+    #   https://en.wikipedia.org/wiki/Shrove_Tuesday
+    #   https://fr.wikipedia.org/wiki/Mardi_gras
+    #   https://en.wikipedia.org/wiki/Ash_Wednesday
+    #   https://fr.wikipedia.org/wiki/Mercredi_des_Cendres
+    #   https://en.wikipedia.org/wiki/Lent
+    #   https://fr.wikipedia.org/wiki/Car%C3%AAme
+    #   https://en.wikipedia.org/wiki/Palm_Sunday
+    #   https://fr.wikipedia.org/wiki/Dimanche_des_Rameaux
+    #   https://en.wikipedia.org/wiki/Holy_Wednesday
+    #   https://fr.wikipedia.org/wiki/Mercredi_saint
+    #   https://en.wikipedia.org/wiki/Maundy_Thursday
+    #   https://fr.wikipedia.org/wiki/Jeudi_saint
+    #   https://en.wikipedia.org/wiki/Good_Friday
+    #   https://fr.wikipedia.org/wiki/Vendredi_saint
+    #   https://en.wikipedia.org/wiki/Holy_Saturday
+    #   https://fr.wikipedia.org/wiki/Samedi_saint
+    #   https://en.wikipedia.org/wiki/Easter
+    #   https://fr.wikipedia.org/wiki/P%C3%A2ques
+    #   https://en.wikipedia.org/wiki/Easter_Saturday
+    #   https://en.wikipedia.org/wiki/Feast_of_the_Ascension
+    #   https://fr.wikipedia.org/wiki/Ascension_(f%C3%AAte)
+    #   https://en.wikipedia.org/wiki/Pentecost
+    #   https://fr.wikipedia.org/wiki/Pentec%C3%B4te
+    #   https://www.timeanddate.com/holidays/common/carnival-wednesday
+    #   https://www.timeanddate.com/holidays/common/palm-sunday
+    #   https://www.timeanddate.com/holidays/common/maundy-thursday
+    #   https://www.timeanddate.com/holidays/common/good-friday
+    #   https://www.timeanddate.com/holidays/common/holy-saturday
+    #   https://www.timeanddate.com/holidays/common/easter-monday
+    #   https://www.timeanddate.com/holidays/common/ascension-day
+    #   https://www.timeanddate.com/holidays/common/whit-sunday
+    #   https://www.timeanddate.com/holidays/common/whit-monday
+    #   https://www.timeanddate.com/holidays/common/trinity
+    #   https://www.timeanddate.com/holidays/common/corpus-christi
+    Easter(offset=-47, name='Shrove/Pancake Tuesday'),  # Mardi Gras
+    Easter(offset=-46, name='Carnival/Ash Wednesday'),  # Mercredi des Cendres
+    # Lent / Carême
+    Easter(offset=-7, name='Palm Sunday'),  # Dimanche des Rameaux
+    Easter(offset=-4, name='Holy Wednesday'),  # Mercredi saint
+    Easter(offset=-3, name='Maundy Thursday'),  # Jeudi saint
+    Easter(
+        offset=-2, name='Good Friday', regions=('CA', 'UK'), tags=('statutory',)
+    ),  # Vendredi saint
+    Easter(offset=-1, name='Holy Saturday'),  # Samedi saint
+    Easter(name='Easter Sunday'),  # Dimanche de Pâques
+    Easter(offset=1, name='Easter Monday'),  # Lundi de Pâques
+    Easter(offset=6, name='Easter Saturday'),
+    Easter(offset=39, name='Ascension Day'),  # Ascension
+    Easter(offset=49, name='Whit Sunday/Pentecost Sunday'),  # Pentecôte
+    Easter(offset=50, name='Whit Monday/Pentecost Monday'),
+    Easter(offset=56, name='Trinity Sunday'),
+    Easter(offset=60, name='Corpus Christi'),
+    # XXX FIXME TODO  Palm Sunday Orthodox???
+    #   https://en.wikipedia.org/wiki/Nowruz
+    #   https://fr.wikipedia.org/wiki/Norouz
+    # Persian/Zoroastrian/Baha'i
+    Astronomical(function=spring, timed=False, name='Nowruz'),  # Norouz
+    #   https://en.wikipedia.org/wiki/South_and_Southeast_Asian_solar_New_Year
+    #   https://en.wikipedia.org/wiki/New_Year%27s_Day#New_Year's_Days_in_other_calendars
+    #   https://en.wikipedia.org/wiki/Pahela_Baishakh
+    # Fixed(month=APRIL, day=13, name=''),
+    # 10th day of the 7th month (Ashvin) on the Hindu calendar
+    #   https://en.wikipedia.org/wiki/Dasara
+    #   https://en.wikipedia.org/wiki/Vijayadashami
+    #   https://fr.wikipedia.org/wiki/Dussehra
+    # in 7th month (Ashvin) on the Hindu calendar
+    #   https://en.wikipedia.org/wiki/Navaratri
+    #   https://fr.wikipedia.org/wiki/Navratri
+    # 20 days after Vijayadashami/Dussehra/Dasara/Dasain
+    #   https://en.wikipedia.org/wiki/Diwali
+    #   https://fr.wikipedia.org/wiki/Divali
+    Lunar(function=new_moon, month=OCTOBER, offset=-4, name='Diwali'),
+    #   https://en.wikipedia.org/wiki/Lunar_New_Year#Middle_East
+    #   https://fr.wikipedia.org/wiki/Nouvel_An_lunaire#Calendrier_h%C3%A9bra%C3%AFque
+    #   https://en.wikipedia.org/wiki/Nisan
+    #   https://fr.wikipedia.org/wiki/Nissan_(mois)
+    Hebrew(month=NISAN, day=1, name='Aviv'),
+    #   https://en.wikipedia.org/wiki/Passover
+    #   https://fr.wikipedia.org/wiki/Pessa%27h
+    #   https://en.wikipedia.org/wiki/Pascha
+    #   https://en.wikipedia.org/wiki/Passover_(Christian_holiday)
+    #   https://en.wikipedia.org/wiki/Passover_Seder
+    #   https://fr.wikipedia.org/wiki/S%C3%A9der_de_Pessa%27h
+    #   https://en.wikipedia.org/wiki/Nisan
+    #   https://fr.wikipedia.org/wiki/Nissan_(mois)
+    # Passover begins on 14 or 15 Nisan and goes until 21 or 22 Nisan
+    Hebrew(month=NISAN, day=14, name='Passover Begins'),  # Pessa'h
+    Hebrew(month=NISAN, day=22, name='Passover Ends'),
+    # Début de Pâque des Juifs
+    # Fin de Pâque des Juifs
+    # Passover = Pesach = Pascha = Jewish Easter
+    #   https://en.wikipedia.org/wiki/Shavuot
+    #   https://fr.wikipedia.org/wiki/Chavouot
+    #   XXX FIXME TODO  Add more links!!!
+    # Shauvot or Pentecost is 6 and 7 Sivan or the Sunday following
+    Hebrew(month=SIVAN, day=6, name='Shauvot'),  # Chavouot
+    # Hebrew(month=SIVAN, day=6, name='Shauvot Begins'),  # Début de Chavouot
+    # Hebrew(month=SIVAN, day=7, name='Shauvot Ends'),  # Fin de Chavouot
+    #   https://en.wikipedia.org/wiki/Rosh_Hashanah
+    #   https://fr.wikipedia.org/wiki/Roch_Hachana
+    #   https://en.wikipedia.org/wiki/Tishrei
+    #   https://fr.wikipedia.org/wiki/Tishri
+    Hebrew(month=TISHREI, day=1, name='Rosh Hashanah'),
+    # Hebrew(month=TISHREI, day=1, name='Rosh Hashanah Begins'),  # Début de Roch Hachana
+    # Hebrew(month=TISHREI, day=2, name='Rosh Hashanah Ends'),  # Fin de Roch Hachana
+    # Jewish New Year
+    #   https://en.wikipedia.org/wiki/Yom_Kippur
+    #   https://fr.wikipedia.org/wiki/Yom_Kippour
+    #   https://en.wikipedia.org/wiki/Tishrei
+    #   https://fr.wikipedia.org/wiki/Tishri
+    Hebrew(month=TISHREI, day=10, name='Yom Kippur'),  # Yom Kippour
+    #   https://en.wikipedia.org/wiki/Sukkot
+    #   https://fr.wikipedia.org/wiki/Souccot
+    #   https://en.wikipedia.org/wiki/Tishrei
+    #   https://fr.wikipedia.org/wiki/Tishri
+    Hebrew(month=TISHREI, day=15, name='Sukkot Begins'),  # Début de Souccot
+    Hebrew(month=TISHREI, day=21, name='Sukkot Ends'),  # Fin de Souccot
+    # a.k.a. Tabernacles
+    #   https://en.wikipedia.org/wiki/Hanukkah
+    #   https://fr.wikipedia.org/wiki/Hanoucca
+    #   XXX FIXME TODO  Add more links!!!
+    Hebrew(month=KISLEV, day=25, name='Hanukkah Begins'),
+    Hebrew(month=TEVET, day=2, name='Hanukkah Ends'),
+    # Début de Hanoucca
+    # Fin de Hanoucca
+    #   https://en.wikipedia.org/wiki/Purim
+    #   https://fr.wikipedia.org/wiki/Pourim
+    #   XXX FIXME TODO  Add more links!!!
+    #   XXX FIXME TODO  What happens when the year is "short"???
+    # Hebrew(month=ADAR, day=14, name='Purim'),  # Pourim
+    #   https://en.wikipedia.org/wiki/Ramadan
+    #   https://fr.wikipedia.org/wiki/Ramadan
+    #   https://en.wikipedia.org/wiki/Eid_al-Fitr
+    #   https://fr.wikipedia.org/wiki/A%C3%AFd_el-Fitr
+    #   https://en.wikipedia.org/wiki/Ramadan_(calendar_month)
+    #   https://en.wikipedia.org/wiki/Shawwal
+    #   https://fr.wikipedia.org/wiki/Chawwal
+    Islamic(month=RAMADAN, day=1, name='Month of Ramadan Begins'),
+    Islamic(month=SHAWWAL, day=1, name='Eid al-Fitr Begins'),
+    #   https://en.wikipedia.org/wiki/Eid_al-Adha
+    #   https://fr.wikipedia.org/wiki/A%C3%AFd_al-Adha
+    #   https://en.wikipedia.org/wiki/Dhu_al-Hijjah
+    #   https://fr.wikipedia.org/wiki/Dhou_al-hijja
+    Islamic(month=DHU_AL_HIJJAH, day=10, name='Eid al-Adha Begins'),
+    #   https://en.wikipedia.org/wiki/Saint-Jean-Baptiste_Day
+    #   https://fr.wikipedia.org/wiki/F%C3%AAte_nationale_du_Qu%C3%A9bec
+    #   https://en.wikipedia.org/wiki/John_the_Baptist
+    #   https://fr.wikipedia.org/wiki/Jean_le_Baptiste
+    #   https://en.wikipedia.org/wiki/Nativity_of_St_John_the_Baptist
+    Fixed(
+        month=JUNE,
+        day=24,
+        name='Saint-Jean-Baptiste Day',
+        regions=('CA-QC',),
+        tags=('statutory',),
+    ),
+    # Fête nationale du Québec
+    # St. John the Baptist's Day
+    # Fête de la Saint-Jean-Baptiste
+    # Nativity of St. John the Baptist
+    # Nativité de saint Jean-Baptiste
+    #   https://en.wikipedia.org/wiki/Orangemen%27s_Day
+    #   https://fr.wikipedia.org/wiki/Orange_Day
+    #   https://en.wikipedia.org/wiki/The_Twelfth#The_Twelfth_outside_Northern_Ireland
+    Weekday(weekday=MONDAY, month=JULY, day=12, name='Orangemen\'s Day (CA-NL)'),
+    # Battle of the Boyne???
+    # Fête des Orangistes (CA-NL)
+    #   https://en.wikipedia.org/wiki/All_Saints%27_Day
+    #   https://fr.wikipedia.org/wiki/Toussaint
+    #   https://en.wikipedia.org/wiki/All_Souls%27_Day
+    #   https://fr.wikipedia.org/wiki/Comm%C3%A9moration_des_fid%C3%A8les_d%C3%A9funts
+    Fixed(month=NOVEMBER, day=1, name='All Saints\' Day'),  # Toussaint
+    Fixed(month=NOVEMBER, day=2, name='All Souls\' Day'),  # Fête des Morts
+    #   https://en.wikipedia.org/wiki/Christmas_Eve
+    #   https://fr.wikipedia.org/wiki/R%C3%A9veillon_de_No%C3%ABl
+    #   https://en.wikipedia.org/wiki/Christmas
+    #   https://fr.wikipedia.org/wiki/No%C3%ABl
+    #   https://en.wikipedia.org/wiki/Boxing_Day
+    #   https://fr.wikipedia.org/wiki/Boxing_Day
+    Fixed(month=DECEMBER, day=24, name='Christmas Eve'),  # Veille de Noël
+    Fixed(
+        month=DECEMBER,
+        day=25,
+        name='Christmas Day',
+        regions=('CA', 'UK'),
+        tags=('statutory',),
+    ),  # Noël
+    Fixed(
+        month=DECEMBER,
+        day=26,
+        name='Boxing Day',
+        regions=('CA-FED', 'CA-ON', 'UK'),  # not a statutory holiday elsewhere
+        tags=('statutory',),
+    ),  # Le jour des boîtes
+    # Lendemain de Noël
+    # Après-Noël
+    Observed(
+        month=DECEMBER,
+        day=25,
+        policy=NEXT_MONDAY,
+        group=((DECEMBER, 26),),
+        name='Christmas Day Observed',
+        regions=('CA', 'UK'),
+        tags=('statutory',),
+    ),  # Noël observé
+    Observed(
+        month=DECEMBER,
+        day=26,
+        policy=NEXT_MONDAY,
+        group=((DECEMBER, 25),),
+        name='Boxing Day Observed',
+        regions=('CA-FED', 'CA-ON', 'UK'),
+        tags=('statutory',),
+    ),  # Le jour des boîtes observé
+]
@@ -0,0 +1,214 @@
+import hashlib
+from datetime import datetime, timezone
+
+from .incremental import fingerprint
+from .rules import Coincident, Event, Fixed, Rule, Weekday, YearDay, evaluate
+
+# iCalendar (RFC 5545) text written straight from events, one line at a time,
+# so that a feed of any size goes out without building a vobject tree first.
+#
+#   https://www.rfc-editor.org/rfc/rfc5545
+#
+# Events without a time are all-day events (DTSTART;VALUE=DATE, lasting one
+# day).  Naive times are floating times, times with a time zone are written
+# in UTC.  UIDs are derived from the event itself so that the same holiday
+# keeps the same UID from one export to the next.
+#
+# Exporting rules instead of events gives one VEVENT per rule: an RRULE for
+# the rules a yearly (or monthly) recurrence can describe, such as "the first
+# Monday of September" or "the Monday between 18 and 24 May", and otherwise a
+# DTSTART followed by an RDATE list of the other days (Easter, seasons, moon
+# phases).  Rules whose name changes from one year to the next (anniversaries)
+# still get one VEVENT per event.
+
+PRODID = '-//paper_cal//Holidays//EN'
+LINE_LENGTH = 75  # octets, not counting the line break
+CRLF = '\r\n'
+BYDAY = ['MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU']
+SHORTEST_MONTH = [-1, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+
+
+def fold(line: str) -> str:
+    ''' '''
+
+    # Long lines go on with a space at the start of the next line, without
+    # ever cutting a UTF-8 sequence in two
+    encoded = line.encode()
+    if len(encoded) <= LINE_LENGTH:
+        return line + CRLF
+
+    parts = []
+    start, limit = 0, LINE_LENGTH
+    while len(encoded) - start > limit:
+        end = start + limit
+        while encoded[end] & 0xC0 == 0x80:  # continuation byte
+            end -= 1
+        parts.append(encoded[start:end].decode())
+        start, limit = end, LINE_LENGTH - 1  # room for the leading space
+    parts.append(encoded[start:].decode())
+    return (CRLF + ' ').join(parts) + CRLF
+
+
+def escape(text: str) -> str:
+    ''' '''
+
+    return (
+        text.replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\n', '\\n')
+    )
+
+
+def uid(event: Event, domain: str = 'paper-cal') -> str:
+    ''' '''
+
+    digest = hashlib.blake2b(str(event).encode(), digest_size=16).hexdigest()
+    return f'{digest}@{domain}'
+
+
+def _value(event: Event) -> str:
+    if event.time is None:
+        return f'{event.date:%Y%m%d}'
+    moment = datetime.combine(event.date, event.time)
+    if event.time.tzinfo is None:
+        return f'{moment:%Y%m%dT%H%M%S}'
+    return f'{moment.astimezone(timezone.utc):%Y%m%dT%H%M%SZ}'
+
+
+def _date_type(event: Event) -> str:
+    return ';VALUE=DATE' if event.time is None else ''
+
+
+def rrule(rule: Rule) -> str | None:
+    ''' '''
+
+    # The RRULE (without COUNT) giving every day of the rule, or None when
+    # there is no such RRULE.  The day must not move when converted to UTC.
+    if rule.years is not None or rule.skip:
+        return None
+    if rule.time is not None and rule.time.utcoffset():
+        return None
+
+    if isinstance(rule, Fixed) and not rule.offset:
+        return f'FREQ=YEARLY;BYMONTH={rule.month};BYMONTHDAY={rule.day}'
+    if isinstance(rule, YearDay) and not rule.offset and 0 < rule.day <= 365:
+        return f'FREQ=YEARLY;BYYEARDAY={rule.day}'
+    if isinstance(rule, Coincident) and not rule.offset:
+        return f'FREQ=MONTHLY;BYDAY={BYDAY[rule.weekday % 7]};BYMONTHDAY={rule.day}'
+    if isinstance(rule, Weekday):
+        weekday = BYDAY[(rule.weekday + rule.offset) % 7]
+        if rule.last:
+            if rule.offset:
+                return None
+            return f'FREQ=YEARLY;BYMONTH={rule.month};BYDAY=-1{weekday}'
+
+        # closest_date() finds the weekday within 3 days of the given day, a
+        # week that has to stay inside the month every year
+        first = rule.day - 3 + rule.offset
+        if first < 1 or first + 6 > SHORTEST_MONTH[rule.month]:
+            return None
+        if first % 7 == 1:
+            return f'FREQ=YEARLY;BYMONTH={rule.month};BYDAY={first // 7 + 1}{weekday}'
+        days = ','.join(str(day) for day in range(first, first + 7))
+        return f'FREQ=YEARLY;BYMONTH={rule.month};BYDAY={weekday};BYMONTHDAY={days}'
+    return None
+
+
+def _events_properties(events, domain: str):
+    for event in events:
+        yield [
+            f'UID:{uid(event, domain)}',
+            f'DTSTART{_date_type(event)}:{_value(event)}',
+            f'SUMMARY:{escape(event.name)}',
+        ]
+
+
+def _rules_properties(rules, years, domain: str):
+    if isinstance(years, int):
+        years = [years]
+    years = sorted(years)
+    # An RRULE cannot skip years
+    contiguous = len(years) == len(set(years)) and (
+        not years or years[-1] - years[0] == len(years) - 1
+    )
+
+    for rule in rules:
+        events = evaluate([rule], years)
+        if not events:
+            continue
+
+        # A name or a kind of day that changes needs events of its own
+        first = events[0]
+        names = {event.name for event in events}
+        timed = {event.time is not None for event in events}
+        if len(names) > 1 or len(timed) > 1:
+            yield from _events_properties(events, domain)
+            continue
+
+        properties = [
+            f'UID:{fingerprint(rule)}@{domain}',
+            f'DTSTART{_date_type(first)}:{_value(first)}',
+            f'SUMMARY:{escape(first.name)}',
+        ]
+        recurrence = rrule(rule) if contiguous else None
+        if recurrence is not None:
+            properties.append(f'RRULE:{recurrence};COUNT={len(events)}')
+        elif len(events) > 1:
+            properties.append(
+                f'RDATE{_date_type(first)}:'
+                + ','.join(_value(event) for event in events[1:])
+            )
+        yield properties
+
+
+def _calendar(components, stamp: datetime | None):
+    # Every line of the calendar, folded and ending with CRLF
+    if stamp is None:
+        stamp = datetime.now(timezone.utc)
+    dtstamp = f'DTSTAMP:{stamp.astimezone(timezone.utc):%Y%m%dT%H%M%SZ}' + CRLF
+
+    yield 'BEGIN:VCALENDAR' + CRLF
+    yield 'VERSION:2.0' + CRLF
+    yield f'PRODID:{PRODID}' + CRLF
+    yield 'CALSCALE:GREGORIAN' + CRLF
+    for properties in components:
+        yield 'BEGIN:VEVENT' + CRLF
+        yield fold(properties[0])  # UID
+        yield dtstamp
+        for line in properties[1:]:
+            yield fold(line)
+        yield 'END:VEVENT' + CRLF
+    yield 'END:VCALENDAR' + CRLF
+
+
+def ical_lines(events, stamp: datetime | None = None, domain: str = 'paper-cal'):
+    ''' '''
+
+    # One VEVENT per event
+    return _calendar(_events_properties(events, domain), stamp)
+
+
+def recurring_lines(
+    rules, years, stamp: datetime | None = None, domain: str = 'paper-cal'
+):
+    ''' '''
+
+    # One VEVENT per rule, with the same days as evaluate(rules, years)
+    return _calendar(_rules_properties(rules, years, domain), stamp)
+
+
+def write_ical(events, out, stamp: datetime | None = None, domain='paper-cal') -> None:
+    ''' '''
+
+    # out is a text file opened with newline='' (or a socket's makefile()),
+    # lines are written as they come
+    out.writelines(ical_lines(events, stamp, domain))
+
+
+def write_recurring(
+    rules, years, out, stamp: datetime | None = None, domain='paper-cal'
+) -> None:
+    ''' '''
+
+    out.writelines(recurring_lines(rules, years, stamp, domain))
@@ -0,0 +1,96 @@
+import hashlib
+from collections import Counter
+from dataclasses import fields
+from datetime import date
+
+from .rules import Event, Rule
+
+# Evaluate a set of rules once and keep the events of every rule for every
+# year, so that when the rules change (someone edited a line of a rule file)
+# only the rules that are new get evaluated again.  Rules are told apart by a
+# fingerprint of their contents, so reloading a file gives back the same
+# fingerprints for every line that did not change.  update() also says which
+# days changed, so that only the outputs covering them (a year of text, an
+# iCal feed, a page of the calendar) need to be rendered again.
+
+
+def _stable(value) -> str:
+    # Functions are named rather than repr()'d, which holds their address
+    if callable(value) and hasattr(value, '__qualname__'):
+        return f'{value.__module__}.{value.__qualname__}'
+    return repr(value)
+
+
+def fingerprint(rule: Rule) -> str:
+    ''' '''
+
+    # Rules are frozen dataclasses: the same text as their repr(), which holds
+    # every field, but the same from one process to the next
+    text = ', '.join(
+        f'{field.name}={_stable(getattr(rule, field.name))}'
+        for field in fields(rule)
+        if field.repr
+    )
+    text = f'{type(rule).__qualname__}({text})'
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+class Incremental:
+    ''' '''
+
+    def __init__(self, rules=()):
+        self.rules = {}  # fingerprint to rule
+        self.order = []  # fingerprints in the order of the rules
+        self.occurrences = {}  # fingerprint to {year: events}
+        self.years = set()  # years evaluated so far
+        self.update(rules)
+
+    def _events(self, key: str, year: int) -> tuple[Event, ...]:
+        found = self.occurrences.setdefault(key, {})
+        if year not in found:
+            found[year] = tuple(self.rules[key].evaluate(year))
+        return found[year]
+
+    def evaluate(self, years) -> list[Event]:
+        ''' '''
+
+        # Same events, in the same order, as evaluate(rules, years)
+        if isinstance(years, int):
+            years = [years]
+
+        events = []
+        for year in years:
+            self.years.add(year)
+            for key in self.order:
+                events.extend(self._events(key, year))
+        return events
+
+    def update(self, rules) -> set[date]:
+        ''' '''
+
+        # Swap in a new set of rules, keeping what is known about the ones
+        # that did not change, and return the days whose events changed in
+        # the years evaluated so far
+        new_rules = {}
+        order = []
+        for rule in rules:
+            key = fingerprint(rule)
+            new_rules.setdefault(key, rule)
+            order.append(key)
+
+        # A line can be repeated, what matters is how many times each rule is
+        # there
+        before, after = Counter(self.order), Counter(order)
+        touched = {key for key in before | after if before[key] != after[key]}
+        self.rules.update((key, new_rules[key]) for key in touched - before.keys())
+
+        changed = set()
+        for key in touched:
+            for year in self.years:
+                changed.update(event.date for event in self._events(key, year))
+        for key in before.keys() - after.keys():
+            del self.rules[key]
+            self.occurrences.pop(key, None)
+
+        self.order = order
+        return changed
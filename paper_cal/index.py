@@ -0,0 +1,66 @@
+from collections import defaultdict
+
+from .rules import Rule
+
+# Which rules apply to a region or carry a tag, without going through every
+# rule of every source.  A region also gets the rules of its country, so that
+# CA-NS has the rules for CA-NS and those for CA.  Rules without regions
+# (Easter, seasons, moon phases) are in no region at all.  Source names are
+# tags of every rule of that source.
+
+
+def country(region: str) -> str:
+    ''' '''
+
+    # CA for CA-NS, CA for CA
+    return region.split('-', 1)[0]
+
+
+def _positions(table: dict, keys) -> set[int]:
+    found = set()
+    for key in keys:
+        found.update(table.get(key, ()))
+    return found
+
+
+class RuleIndex:
+    ''' '''
+
+    def __init__(self, sources=None):
+        self.rules = []  # every rule, in the order they were added
+        self.regions = defaultdict(list)  # code to positions in rules
+        self.tags = defaultdict(list)  # tag to positions in rules
+        for source, rules in (sources or {}).items():
+            self.add(source, rules)
+
+    def add(self, source: str, rules) -> None:
+        ''' '''
+
+        for rule in rules:
+            position = len(self.rules)
+            self.rules.append(rule)
+            for region in rule.regions:
+                self.regions[region].append(position)
+            for tag in {source, *rule.tags}:
+                self.tags[tag].append(position)
+
+    def lookup(self, region=None, tag=None, sources=None) -> list[Rule]:
+        ''' '''
+
+        # Rules matching every one of region, tag and sources that is given
+        found = []
+        if region is not None:
+            found.append(_positions(self.regions, {region, country(region)}))
+        if tag is not None:
+            found.append(_positions(self.tags, [tag]))
+        if sources is not None:
+            found.append(_positions(self.tags, sources))
+        if not found:
+            return list(self.rules)
+        return [self.rules[position] for position in sorted(set.intersection(*found))]
+
+    def known(self, region: str) -> bool:
+        ''' '''
+
+        # Only codes some rule was given: CA-NS, but not a made up CA-XX
+        return region in self.regions
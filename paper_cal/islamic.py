@@ -0,0 +1,118 @@
+from bisect import bisect_right
+from datetime import date
+
+from .rd import MONTHS_IN_YEAR, fixed_from_islamic, islamic_new_year
+
+# Islamic month starts for a span of Islamic years, kept as one sorted list of
+# proleptic Gregorian ordinals (date.toordinal()) so that any day can be
+# placed in its Islamic month with a bisect, and every Gregorian date of an
+# Islamic month and day between two dates found without converting back and
+# forth.  An Islamic year is 354 or 355 days long, so a given Islamic date
+# happens once or twice in every Gregorian year.
+#
+# Where the months start comes from an algorithm: any function taking an
+# Islamic year and returning the ordinals of its 12 month starts followed by
+# the start of the next year.  The default is the tabular (arithmetic) civil
+# calendar, which is what Epoch.moslem2gregorian() computes (Meeus,
+# Astronomical Algorithms, pages 73-75).  Something like an Umm al-Qura table
+# can be plugged in instead.
+
+FIRST_YEAR = -640  # covers 1 January 1
+LAST_YEAR = 9666  # covers 31 December 9999
+
+
+def tabular_months(isl_year: int) -> list[int]:
+    ''' '''
+
+    months = [
+        fixed_from_islamic(isl_year, month, 1) for month in range(1, MONTHS_IN_YEAR + 1)
+    ]
+    return months + [islamic_new_year(isl_year + 1)]
+
+
+class IslamicTable:
+    ''' '''
+
+    def __init__(
+        self,
+        first_year: int = FIRST_YEAR,
+        last_year: int = LAST_YEAR,
+        algorithm=tabular_months,
+    ):
+        self.first_year, self.last_year = first_year, last_year
+        self.algorithm = algorithm
+
+        # The start of every month, then the end of the last one
+        starts = []
+        for isl_year in range(first_year, last_year + 1):
+            months = algorithm(isl_year)
+            starts.extend(months[:MONTHS_IN_YEAR])
+        starts.append(months[MONTHS_IN_YEAR])
+        self.starts = starts
+
+    def month_start(self, isl_year: int, isl_month: int) -> int:
+        ''' '''
+
+        if not self.first_year <= isl_year <= self.last_year:
+            raise ValueError(f'{isl_year} is outside of the Islamic table')
+        return self.starts[
+            (isl_year - self.first_year) * MONTHS_IN_YEAR + isl_month - 1
+        ]
+
+    def from_ordinal(self, ordinal: int) -> tuple[int, int, int]:
+        ''' '''
+
+        index = bisect_right(self.starts, ordinal) - 1
+        if not 0 <= index < len(self.starts) - 1:
+            raise ValueError(f'{date.fromordinal(ordinal)} is outside of the table')
+        isl_year, month = divmod(index, MONTHS_IN_YEAR)
+        return self.first_year + isl_year, month + 1, ordinal - self.starts[index] + 1
+
+    def ordinals(self, isl_month: int, isl_day: int, start: int, end: int) -> list[int]:
+        ''' '''
+
+        # Every ordinal from start (inclusive) to end (exclusive) falling on
+        # this Islamic month and day, months too short for the day are skipped
+        starts = self.starts
+        index = max(bisect_right(starts, start - isl_day + 1) - 1, 0)
+        index += (isl_month - 1 - index) % MONTHS_IN_YEAR
+
+        found = []
+        while index < len(starts) - 1 and starts[index] + isl_day - 1 < end:
+            ordinal = starts[index] + isl_day - 1
+            if ordinal >= start and ordinal < starts[index + 1]:
+                found.append(ordinal)
+            index += MONTHS_IN_YEAR
+        return found
+
+
+_table = None
+
+
+def use_islamic_table(
+    first_year: int = FIRST_YEAR, last_year: int = LAST_YEAR, algorithm=tabular_months
+) -> IslamicTable:
+    ''' '''
+
+    global _table
+
+    _table = IslamicTable(first_year, last_year, algorithm)
+    return _table
+
+
+def islamic_table() -> IslamicTable:
+    ''' '''
+
+    # Only built the first time it is needed
+    if _table is None:
+        return use_islamic_table()
+    return _table
+
+
+def islamic_dates(isl_month: int, isl_day: int, start: date, end: date) -> list[date]:
+    ''' '''
+
+    ordinals = islamic_table().ordinals(
+        isl_month, isl_day, start.toordinal(), end.toordinal()
+    )
+    return [date.fromordinal(ordinal) for ordinal in ordinals]
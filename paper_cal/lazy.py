@@ -0,0 +1,28 @@
+from importlib import import_module
+
+
+class LazyImport:
+    ''' '''
+
+    # Stands in for a module (or for something inside of it) and only imports
+    # it the first time it gets used, so that `import paper_cal` stays cheap
+    # for callers that never need PyMeeus or Pyluach
+
+    def __init__(self, module: str, name: str | None = None):
+        self._module = module
+        self._name = name
+        self._target = None
+
+    def _resolve(self):
+        if self._target is None:
+            target = import_module(self._module)
+            if self._name is not None:
+                target = getattr(target, self._name)
+            self._target = target
+        return self._target
+
+    def __getattr__(self, attr):
+        return getattr(self._resolve(), attr)
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
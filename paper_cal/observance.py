@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+
+from .paper_cal import LENGTH_OF_WEEK, MONDAY, SATURDAY, SUNDAY
+
+# When a holiday is observed on another day than its own: on the Monday
+# after a weekend, on the closest weekday, on the closest Monday...  A policy
+# says how many days a holiday falling on each day of the week moves, and
+# substitute() applies it to a group of holidays of the same year (Christmas
+# and Boxing Day) so that they never land on the same day: the ones that did
+# not move keep their day, the others go to the next free weekday.
+#
+#   Christmas on Saturday, Boxing Day on Sunday:  Monday 27, Tuesday 28
+#   Christmas on Sunday, Boxing Day on Monday:    Tuesday 27
+#
+# Everything works on ordinals (date.toordinal(), day 1 is a Monday), so that
+# the batch evaluation can apply policies to many years at once.
+
+WEEKEND = (SATURDAY, SUNDAY)
+
+
+def weekday(ordinal: int) -> int:
+    ''' '''
+
+    return (ordinal + 6) % LENGTH_OF_WEEK
+
+
+def closest(desired_weekday: int, from_weekday: int) -> int:
+    ''' '''
+
+    # Days closest_date() moves from a day to the desired weekday, -3 to 3
+    return (desired_weekday - from_weekday + 3) % LENGTH_OF_WEEK - 3
+
+
+@dataclass(frozen=True)
+class Policy:
+    ''' '''
+
+    # Days added to a holiday falling on each weekday, Monday first
+    shifts: tuple[int, ...]
+
+    def observe(self, ordinal: int) -> int:
+        ''' '''
+
+        return ordinal + self.shifts[weekday(ordinal)]
+
+    def moves(self, ordinal: int) -> bool:
+        ''' '''
+
+        return self.shifts[weekday(ordinal)] != 0
+
+
+def weekend_policy(saturday: int | None = None, sunday: int | None = None) -> Policy:
+    ''' '''
+
+    # Holidays on a Saturday or a Sunday move to the closest given weekday
+    shifts = [0] * LENGTH_OF_WEEK
+    if saturday is not None:
+        shifts[SATURDAY] = closest(saturday, SATURDAY)
+    if sunday is not None:
+        shifts[SUNDAY] = closest(sunday, SUNDAY)
+    return Policy(tuple(shifts))
+
+
+NEXT_MONDAY = weekend_policy(saturday=MONDAY, sunday=MONDAY)
+NEAREST_WEEKDAY = weekend_policy(saturday=SATURDAY - 1, sunday=MONDAY)
+SUNDAY_TO_MONDAY = weekend_policy(sunday=MONDAY)
+NEAREST_MONDAY = Policy(tuple(closest(MONDAY, day) for day in range(LENGTH_OF_WEEK)))
+
+
+def substitute(ordinals, policy: Policy, weekend=WEEKEND) -> list[int]:
+    ''' '''
+
+    # The observed day of every holiday of a group, in the same order
+    taken = {ordinal for ordinal in ordinals if not policy.moves(ordinal)}
+    observed = {}
+    for ordinal in sorted(set(ordinals)):
+        if not policy.moves(ordinal):
+            observed[ordinal] = ordinal
+            continue
+
+        # Chained: keep going the same way until a free weekday
+        step = 1 if policy.shifts[weekday(ordinal)] > 0 else -1
+        found = policy.observe(ordinal)
+        while found in taken or weekday(found) in weekend:
+            found += step
+        taken.add(found)
+        observed[ordinal] = found
+    return [observed[ordinal] for ordinal in ordinals]
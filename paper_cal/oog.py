@@ -0,0 +1,168 @@
+import hashlib
+import pickle
+import re
+from datetime import time
+from pathlib import Path
+
+from . import paper_cal
+from .rules import Fixed, Rule, Weekday
+
+# Rules written as data, one per line, in the format of the `oog` file:
+#
+#   [WEEKDAY] MONTH DAY [YEAR] [HH:MM] Name of the event
+#
+#   MAY 25 Towel Day                            every 25 May
+#   SUNDAY MAY WEEK1 CN Cycle for CHEO          the Sunday closest to 4 May
+#   SATURDAY NOVEMBER 31 Tall Pines Rally       past the end of the month,
+#                                               the last Saturday of November
+#   JULY 20 1969 Anniversary of First Lunar...  "55th Anniversary of..."
+#   FEBRUARY 7 2036 01:28 NTP Timestamp...      a timed year is a one-off
+#
+# Weekdays and months are spelled out or abbreviated (MON, JAN), DAY is a
+# number or WEEK1 to WEEK4.  Anything after " #" is a comment, as are lines
+# starting with "#".  Lines ending with "\" carry on to the next one.  Other
+# lines (notes, tables, calendar(1) FSET functions) are skipped, or raise a
+# ValueError when parsing strictly.
+#
+# Compiled rules are pickled in a __pycache__ directory next to the file and
+# reused as long as the file has the same modification time and size, or
+# failing that, the same contents.
+
+WEEKDAYS = {
+    name: getattr(paper_cal, name)
+    for name in (
+        *('MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY', 'SATURDAY'),
+        *('SUNDAY', 'MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT', 'SUN'),
+    )
+}
+MONTHS = {
+    name: getattr(paper_cal, name)
+    for name in (
+        *('JANUARY', 'FEBRUARY', 'MARCH', 'APRIL', 'MAY', 'JUNE', 'JULY'),
+        *('AUGUST', 'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER'),
+        *('JAN', 'FEB', 'MAR', 'APR', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV'),
+        'DEC',
+    )
+}
+DAYS = {name: getattr(paper_cal, name) for name in ('WEEK1', 'WEEK2', 'WEEK3', 'WEEK4')}
+LONGEST_MONTH = [-1, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+YEAR = re.compile(r'\d{1,4}')
+TIME = re.compile(r'(\d{1,2}):(\d{2})')
+CACHE_VERSION = 2
+
+
+def _lines(text: str):
+    # Logical lines with their line numbers, continuations joined
+    pending, start = '', None
+    for number, line in enumerate(text.splitlines(), start=1):
+        if start is None:
+            start = number
+        if line.endswith('\\'):
+            pending += line[:-1] + ' '
+            continue
+        yield start, pending + line
+        pending, start = '', None
+    if start is not None:
+        yield start, pending
+
+
+def parse_line(line: str) -> Rule | None:
+    ''' '''
+
+    tokens = line.split(' #', 1)[0].split()
+    if not tokens or tokens[0].startswith('#'):
+        return None
+
+    weekday = WEEKDAYS.get(tokens[0])
+    if weekday is not None:
+        tokens = tokens[1:]
+    if len(tokens) < 3 or tokens[0] not in MONTHS:
+        raise ValueError(f'expected [WEEKDAY] MONTH DAY Name: {line.strip()[:60]}')
+    month, day, tokens = MONTHS[tokens[0]], tokens[1], tokens[2:]
+
+    if day in DAYS:
+        day = DAYS[day]
+    elif day.isdigit() and int(day) > 0:
+        day = int(day)
+    else:
+        raise ValueError(f'expected a day or WEEK1 to WEEK4: {line.strip()[:60]}')
+
+    details = {}
+    if len(tokens) > 1 and YEAR.fullmatch(tokens[0]):
+        details['since'], tokens = int(tokens[0]), tokens[1:]
+    if len(tokens) > 1 and TIME.fullmatch(tokens[0]):
+        hour, minute = map(int, TIME.fullmatch(tokens[0]).groups())
+        details['time'], tokens = time(hour, minute), tokens[1:]
+        if 'since' in details:
+            # Something happening at a given moment of a given year
+            details['years'] = (details.pop('since'),)
+    details['name'] = ' '.join(tokens)
+
+    if weekday is None:
+        if day > LONGEST_MONTH[month]:
+            raise ValueError(
+                f'day {day} is past the end of the month: {line.strip()[:60]}'
+            )
+        return Fixed(month=month, day=day, **details)
+    if day > LONGEST_MONTH[month]:
+        return Weekday(weekday=weekday, month=month, day=1, last=True, **details)
+    return Weekday(weekday=weekday, month=month, day=day, **details)
+
+
+def parse_oog(text: str, strict: bool = False) -> list[Rule]:
+    ''' '''
+
+    rules = []
+    for number, line in _lines(text):
+        try:
+            rule = parse_line(line)
+        except ValueError as error:
+            if strict:
+                raise ValueError(f'line {number}: {error}') from None
+            continue
+        if rule is not None:
+            rules.append(rule)
+    return rules
+
+
+def _cache_path(path: Path) -> Path:
+    return path.parent / '__pycache__' / f'{path.name}.rules.pickle'
+
+
+def load_oog(path, strict: bool = False, cache: bool = True) -> list[Rule]:
+    ''' '''
+
+    path = Path(path)
+    stat = path.stat()
+    key = (CACHE_VERSION, strict, stat.st_mtime_ns, stat.st_size)
+    cached = None
+    if cache:
+        try:
+            with open(_cache_path(path), 'rb') as compiled:
+                cached = pickle.load(compiled)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+        if cached is not None and cached['key'] == key:
+            return cached['rules']
+
+    text = path.read_bytes()
+    digest = hashlib.sha256(text).hexdigest()
+    if (
+        cached is not None
+        and cached['key'][:2] == key[:2]
+        and cached['digest'] == digest
+    ):
+        # Touched but not changed
+        rules = cached['rules']
+    else:
+        rules = parse_oog(text.decode('utf-8'), strict)
+
+    if cache:
+        try:
+            _cache_path(path).parent.mkdir(exist_ok=True)
+            with open(_cache_path(path), 'wb') as compiled:
+                pickle.dump({'key': key, 'digest': digest, 'rules': rules}, compiled)
+        except OSError:
+            # A read-only directory just means no cache
+            pass
+    return rules
@@ -1,10 +1,18 @@
-from datetime import date, datetime, timedelta
+import math
+from datetime import MAXYEAR, MINYEAR, date, datetime, timedelta
+from functools import wraps
+from typing import NamedTuple
 
-from pymeeus.Epoch import Epoch
-from pymeeus.Sun import Sun
-from pymeeus.Earth import Earth
-from pymeeus.Moon import Moon
-from pyluach import dates
+from . import ephemeris, rd
+from .computus import easter_ordinals, passover_ordinals
+from .islamic import islamic_dates, islamic_table
+from .cache import memoize
+from .lazy import LazyImport
+
+Epoch = LazyImport('pymeeus.Epoch', 'Epoch')
+Sun = LazyImport('pymeeus.Sun', 'Sun')
+Earth = LazyImport('pymeeus.Earth', 'Earth')
+Moon = LazyImport('pymeeus.Moon', 'Moon')
 
 
 (
@@ -43,6 +51,8 @@ LENGTH_OF_WEEK = 7  # days
     ADAR,  # a.k.a. Adar Bet, Adar Sheni, Adar II, Ve'Adar
 ) = range(1, 14)
 DAYS_IN_HEB_MONTH = [-1, 30, 29, 30, 29, 30, 29, 30, 29, 30, 29, 30, 30, 29]
+HEB_YEAR_OFFSET = 3760  # 1 January always falls in Hebrew year + 3760
+HEBREW_CACHE_SIZE = 512  # Hebrew years
 
 (
     MUHARRAM,
@@ -60,7 +70,17 @@ DAYS_IN_HEB_MONTH = [-1, 30, 29, 30, 29, 30, 29, 30, 29, 30, 29, 30, 30, 29]
 ) = range(1, 13)
 
 LENGTH_OF_LUNAR_MONTH = 30
+SYNODIC_MONTH = 29.530588861  # days
+MEAN_NEW_MOON = 2451550.09766  # Julian ephemeris day of the new moon k = 0
+JULIAN_DAY_OF_ORDINAL = 1721424.5  # from date.toordinal() at midnight
+ASTRONOMY_CACHE_SIZE = 512  # years per function
 (NEW_MOON, FIRST_QUARTER_MOON, FULL_MOON, LAST_QUARTER_MOON) = (0, 8, 15, 22)
+MOON_PHASES = {
+    NEW_MOON: 'new',
+    FIRST_QUARTER_MOON: 'first',
+    FULL_MOON: 'full',
+    LAST_QUARTER_MOON: 'last',
+}
 
 MOON_GLYPHS = [
     '🌑',  #  0 new moon
@@ -96,28 +116,102 @@ MOON_GLYPHS = [
 ]
 
 
-def is_leap(year: int = date.today().year) -> bool:
+class Clock:
     ''' '''
 
-    # return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
-    return Epoch.is_leap(year)
+    # Where "today" comes from whenever a date or a year is left out.  It is
+    # asked on every call, so long running processes move on after midnight.
+
+    def today(self) -> date:
+        ''' '''
+
+        return date.today()
+
+
+class FixedClock(Clock):
+    ''' '''
+
+    # Always the same day, handy for tests and for rendering another year
+
+    def __init__(self, fixed_date: date):
+        self.fixed_date = fixed_date
+
+    def today(self) -> date:
+        ''' '''
+
+        return self.fixed_date
+
+
+_clock = Clock()
+
+
+def set_clock(clock: Clock | None = None) -> Clock:
+    ''' '''
+
+    # Use None to go back to the system clock, the previous clock is returned
+    # so that it can be put back afterwards
+    global _clock
+
+    previous, _clock = _clock, Clock() if clock is None else clock
+    return previous
 
 
-def days_in_month(month: int = date.today().month, year: int = date.today().year) -> int:
+def today() -> date:
     ''' '''
 
+    return _clock.today()
+
+
+def this_year(function):
+    ''' '''
+
+    # Fill in the current year when it is left out, before any cache in
+    # function gets to see the call
+    @wraps(function)
+    def wrapper(year: int | None = None):
+        return function(today().year if year is None else year)
+
+    return wrapper
+
+
+def is_leap(year: int | None = None) -> bool:
+    ''' '''
+
+    if year is None:
+        year = today().year
+
+    # Same as Epoch.is_leap(), which switches to the Julian calendar before
+    # 1582, without having to import PyMeeus
+    if year >= 1582:
+        return rd.is_gregorian_leap(year)
+    return rd.is_julian_leap(year)
+
+
+def days_in_month(month: int | None = None, year: int | None = None) -> int:
+    ''' '''
+
+    if month is None:
+        month = today().month
+    if year is None:
+        year = today().year
+
     DAYS_IN_MONTH = [-1, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
     FEBRUARY_LEAP_YEAR = 29
 
-    if month == FEBRUARY and is_leap(year=year):
+    # Months of datetime.date, which is proleptic Gregorian all the way back
+    # (is_leap() follows PyMeeus and is Julian before 1582)
+    if month == FEBRUARY and rd.is_gregorian_leap(year):
         return FEBRUARY_LEAP_YEAR
     else:
         return DAYS_IN_MONTH[month]
 
 
-def closest_date(desired_weekday: int, nearby_date=date.today(), last: bool = False):
+def closest_date(desired_weekday: int, nearby_date=None, last: bool = False):
     ''' '''
 
+    if nearby_date is None:
+        nearby_date = today()
+
     # Jump straight to the end of the current month
     if last:
         nearby_date = date(
@@ -145,10 +239,10 @@ def closest_date(desired_weekday: int, nearby_date=date.today(), last: bool = Fa
         return found_date
 
 
-def repeat_date(start_date=date.today(), skip: int = LENGTH_OF_WEEK):
+def repeat_date(start_date=None, skip: int = LENGTH_OF_WEEK):
     ''' '''
 
-    date_tracker = start_date
+    date_tracker = today() if start_date is None else start_date
     while True:
         yield date_tracker
         date_tracker += timedelta(skip)
@@ -178,37 +272,86 @@ def ordinal(number: int, lang: str = 'en') -> str:
 
 
 def heb_date(
-    heb_month: int = dates.HebrewDate.today().month,
-    heb_day: int = dates.HebrewDate.today().day,
-    greg_year: int = date.today().year,
+    heb_month: int | None = None,
+    heb_day: int | None = None,
+    greg_year: int | None = None,
 ):
     ''' '''
 
+    # Default to today's Hebrew month and day
+    if heb_month is None or heb_day is None:
+        _, month, day = rd.hebrew_from_fixed(today().toordinal())
+        if heb_month is None:
+            heb_month = month
+        if heb_day is None:
+            heb_day = day
+    if greg_year is None:
+        greg_year = today().year
+
     # Find out if this date falls into a new year or not
     if heb_month >= TISHREI:
-        heb_year = dates.HebrewDate.from_pydate(date(greg_year, JANUARY, 1)).year + 1
+        heb_year = greg_year + HEB_YEAR_OFFSET + 1
     else:
-        heb_year = dates.HebrewDate.from_pydate(date(greg_year, JANUARY, 1)).year
+        heb_year = greg_year + HEB_YEAR_OFFSET
 
-    return dates.HebrewDate(year=heb_year, month=heb_month, day=heb_day).to_pydate()
+    if not NISAN <= heb_month <= ADAR:
+        raise ValueError(f'{heb_month} is not a Hebrew month')
+    structure = hebrew_year(heb_year)
+    if structure.month_starts[heb_month] is None:
+        raise ValueError(f'{heb_year} is not a leap year')
+    if not 1 <= heb_day <= structure.month_lengths[heb_month]:
+        days = structure.month_lengths[heb_month]
+        raise ValueError(f'Given month has {days} days.')
 
+    return date.fromordinal(structure.month_starts[heb_month] + heb_day - 1)
 
-def isl_date(
-    isl_month: int = Epoch.gregorian2moslem(
-        date.today().year, date.today().month, date.today().day
-    )[1],
-    isl_day: int = Epoch.gregorian2moslem(
-        date.today().year, date.today().month, date.today().day
-    )[2],
-    greg_year: int = date.today().year,
-):
+
+class HebrewYear(NamedTuple):
+    new_year: int  # ordinal of 1 Tishrei
+    length: int  # 353 to 355 days, or 383 to 385 in leap years
+    leap: bool
+    month_starts: tuple  # ordinals, by month number (None for missing Adar II)
+    month_lengths: tuple  # days, by month number
+
+
+@memoize(maxsize=HEBREW_CACHE_SIZE)
+def hebrew_year(heb_year: int) -> HebrewYear:
     ''' '''
 
-    isl_year, _, _ = Epoch.gregorian2moslem(greg_year, JANUARY, 16)
+    new_year = rd.hebrew_new_year(heb_year)
+    length = rd.hebrew_new_year(heb_year + 1) - new_year
+    month_starts = rd.hebrew_month_starts(heb_year)
+    month_lengths = rd.hebrew_month_lengths(heb_year)
+    leap = rd.is_hebrew_leap(heb_year)
 
-    _, greg_month, greg_day = Epoch.moslem2gregorian(isl_year, isl_month, isl_day)
+    return HebrewYear(new_year, length, leap, tuple(month_starts), tuple(month_lengths))
 
-    return date(year=greg_year, month=greg_month, day=greg_day)
+
+def isl_date(
+    isl_month: int | None = None,
+    isl_day: int | None = None,
+    greg_year: int | None = None,
+):
+    ''' '''
+
+    # Default to today's Islamic month and day
+    if isl_month is None or isl_day is None:
+        _, month, day = islamic_table().from_ordinal(today().toordinal())
+        if isl_month is None:
+            isl_month = month
+        if isl_day is None:
+            isl_day = day
+    if greg_year is None:
+        greg_year = today().year
+
+    # An Islamic date happens once or twice in a Gregorian year, this is the
+    # first one (see islamic_dates() for all of them)
+    found = islamic_dates(
+        isl_month, isl_day, date(greg_year, JANUARY, 1), date(greg_year + 1, JANUARY, 1)
+    )
+    if not found:
+        raise ValueError(f'{isl_month}/{isl_day} does not happen in {greg_year}')
+    return found[0]
 
 
 # Easter is the Sunday after the full moon after the March (vernal) equinox
@@ -229,110 +372,244 @@ def isl_date(
 # December Solstice is the 1st day of Winter/hiver in the Northern Hemisphere
 
 
-def easter(year: int = date.today().year):
+@this_year
+def easter(year: int):
     ''' '''
 
-    month, day = Epoch.easter(year)
-    return date(year=year, month=month, day=day)
+    # Same as Epoch.easter(), see computus.py
+    (found,) = easter_ordinals((year,))
+    return date.fromordinal(found)
 
 
-def passover(year: int = date.today().year):
+@this_year
+def passover(year: int):
     ''' '''
 
-    month, day = Epoch.jewish_pesach(year)
-    return date(year=year, month=month, day=day)
+    # Same as Epoch.jewish_pesach(), see computus.py
+    (found,) = passover_ordinals((year,))
+    return date.fromordinal(found)
 
 
-def perihelion(year: int = date.today().year):
+@this_year
+@memoize(maxsize=ASTRONOMY_CACHE_SIZE)
+def perihelion(year: int):
     ''' '''
 
+    found = ephemeris.season(year, ephemeris.PERIHELION)
+    if found is not None:
+        return found
+
     _, month, day, hour, minute, _ = Earth.perihelion_aphelion(
         Epoch(date(year, JANUARY, 1)), perihelion=True
     ).get_full_date()
     return datetime(year=year, month=month, day=day, hour=hour, minute=minute)
 
 
-def aphelion(year: int = date.today().year):
+@this_year
+@memoize(maxsize=ASTRONOMY_CACHE_SIZE)
+def aphelion(year: int):
     ''' '''
 
+    found = ephemeris.season(year, ephemeris.APHELION)
+    if found is not None:
+        return found
+
     _, month, day, hour, minute, _ = Earth.perihelion_aphelion(
         Epoch(date(year, JULY, 1)), perihelion=False
     ).get_full_date()
     return datetime(year=year, month=month, day=day, hour=hour, minute=minute)
 
 
-def spring(year: int = date.today().year):
+@this_year
+@memoize(maxsize=ASTRONOMY_CACHE_SIZE)
+def spring(year: int):
     ''' '''
 
+    found = ephemeris.season(year, ephemeris.SPRING)
+    if found is not None:
+        return found
+
     _, month, day, hour, minute, _ = Sun.get_equinox_solstice(
         year, target='spring'
     ).get_full_date()
     return datetime(year=year, month=month, day=day, hour=hour, minute=minute)
 
 
-def summer(year: int = date.today().year):
+@this_year
+@memoize(maxsize=ASTRONOMY_CACHE_SIZE)
+def summer(year: int):
     ''' '''
 
+    found = ephemeris.season(year, ephemeris.SUMMER)
+    if found is not None:
+        return found
+
     _, month, day, hour, minute, _ = Sun.get_equinox_solstice(
         year, target='summer'
     ).get_full_date()
     return datetime(year=year, month=month, day=day, hour=hour, minute=minute)
 
 
-def autumn(year: int = date.today().year):
+@this_year
+@memoize(maxsize=ASTRONOMY_CACHE_SIZE)
+def autumn(year: int):
     ''' '''
 
+    found = ephemeris.season(year, ephemeris.AUTUMN)
+    if found is not None:
+        return found
+
     _, month, day, hour, minute, _ = Sun.get_equinox_solstice(
         year, target='autumn'
     ).get_full_date()
     return datetime(year=year, month=month, day=day, hour=hour, minute=minute)
 
 
-def winter(year: int = date.today().year):
+@this_year
+@memoize(maxsize=ASTRONOMY_CACHE_SIZE)
+def winter(year: int):
     ''' '''
 
+    found = ephemeris.season(year, ephemeris.WINTER)
+    if found is not None:
+        return found
+
     _, month, day, hour, minute, _ = Sun.get_equinox_solstice(
         year, target='winter'
     ).get_full_date()
     return datetime(year=year, month=month, day=day, hour=hour, minute=minute)
 
 
-def new_moon(moon_date=date.today()):
+def new_moon(moon_date=None):
     ''' '''
 
+    if moon_date is None:
+        moon_date = today()
+
+    found = ephemeris.moon_phase(moon_date, 'new')
+    if found is not None:
+        return found
+
     year, month, day, hour, minute, _ = Moon.moon_phase(
         Epoch(moon_date - timedelta(days=6)), target='new'
     ).get_full_date()
     return datetime(year=year, month=month, day=day, hour=hour, minute=minute)
 
 
-def first_moon(moon_date=date.today()):
+def first_moon(moon_date=None):
     ''' '''
 
+    if moon_date is None:
+        moon_date = today()
+
+    found = ephemeris.moon_phase(moon_date, 'first')
+    if found is not None:
+        return found
+
     year, month, day, hour, minute, _ = Moon.moon_phase(
         Epoch(moon_date - timedelta(days=6)), target='first'
     ).get_full_date()
     return datetime(year=year, month=month, day=day, hour=hour, minute=minute)
 
 
-def full_moon(moon_date=date.today()):
+def full_moon(moon_date=None):
     ''' '''
 
+    if moon_date is None:
+        moon_date = today()
+
+    found = ephemeris.moon_phase(moon_date, 'full')
+    if found is not None:
+        return found
+
     year, month, day, hour, minute, _ = Moon.moon_phase(
         Epoch(moon_date - timedelta(days=6)), target='full'
     ).get_full_date()
     return datetime(year=year, month=month, day=day, hour=hour, minute=minute)
 
 
-def last_moon(moon_date=date.today()):
+def last_moon(moon_date=None):
     ''' '''
 
+    if moon_date is None:
+        moon_date = today()
+
+    found = ephemeris.moon_phase(moon_date, 'last')
+    if found is not None:
+        return found
+
     year, month, day, hour, minute, _ = Moon.moon_phase(
         Epoch(moon_date - timedelta(days=6)), target='last'
     ).get_full_date()
     return datetime(year=year, month=month, day=day, hour=hour, minute=minute)
 
 
+def _lunation_epoch(k: int):
+    # Moon.moon_phase() works k out from the calendar date of the epoch it is
+    # given, which drifts away from the mean new moons by up to half a
+    # lunation over a few thousand years: move the epoch a week at a time
+    # until it reads as k
+    jde = MEAN_NEW_MOON + SYNODIC_MONTH * k
+    while True:
+        epoch = Epoch(jde)
+        year, month, day = epoch.get_date()
+        try:
+            day_of_year = Epoch.get_doy(year, month, day)
+        except ValueError:
+            # February 29 of a Julian leap year, that PyMeeus cannot count
+            jde += 1
+            continue
+        days_in_year = 366.0 if Epoch.is_leap(year) else 365.0
+        found = round((year + day_of_year / days_in_year - 2000.0) * 12.3685)
+        if found == k:
+            return epoch
+        jde += (k - found) * LENGTH_OF_WEEK
+
+
+def lunations(start=None, end=None):
+    ''' '''
+
+    if start is None:
+        start = today()
+
+    # Walk through every moon phase from start (inclusive) to end (exclusive)
+    # one lunation at a time.  PyMeeus numbers lunations with k (k = 0 is the
+    # new moon of 2000-01-06), so each phase is looked up from its own
+    # lunation and can neither be missed nor found twice.  The walk starts
+    # from the last mean new moon more than a lunation before start, and
+    # stops where datetime does.
+    julian_day = start.toordinal() + JULIAN_DAY_OF_ORDINAL
+    k = math.floor((julian_day - MEAN_NEW_MOON) / SYNODIC_MONTH) - 1
+    while True:
+        for phase, target in MOON_PHASES.items():
+            found = ephemeris.lunation_phase(k, target)
+            if found is None:
+                year, month, day, hour, minute, _ = Moon.moon_phase(
+                    _lunation_epoch(k), target=target
+                ).get_full_date()
+                if year < MINYEAR:
+                    continue
+                if year > MAXYEAR:
+                    return
+                found = datetime(
+                    year=year, month=month, day=day, hour=hour, minute=minute
+                )
+
+            if end is not None and found.date() >= end:
+                return
+            if found.date() >= start:
+                yield found, phase
+        k += 1
+
+
+@this_year
+@memoize(maxsize=ASTRONOMY_CACHE_SIZE)
+def moon_phases(year: int) -> tuple:
+    ''' '''
+
+    return tuple(lunations(date(year, JANUARY, 1), date(year + 1, JANUARY, 1)))
+
+
 # Chinese/Lunar New Year is the 2nd new moon after the December solstice
 # January 21st is the earliest date when Lunar New Year may occur
 # February 20th is the latest date when Lunar New Year may occur
@@ -344,7 +621,8 @@ def last_moon(moon_date=date.today()):
 #   https://humanoriginproject.com/the-chinese-calendar-how-to-calculate-chinese-new-year/
 
 
-def spin(year: int = date.today().year) -> str:
+@this_year
+def spin(year: int) -> str:
     ''' '''
 
     # even numbered years are yang, odd numbered years are yin
@@ -359,7 +637,8 @@ def spin(year: int = date.today().year) -> str:
     return SPINS[year % 2]
 
 
-def stem(year: int = date.today().year) -> str:
+@this_year
+def stem(year: int) -> str:
     ''' '''
 
     HEAVENLY_STEMS = [
@@ -378,7 +657,8 @@ def stem(year: int = date.today().year) -> str:
     return HEAVENLY_STEMS[year % 10]
 
 
-def branch(year: int = date.today().year) -> str:
+@this_year
+def branch(year: int) -> str:
     ''' '''
 
     EARTHLY_BRANCHES = [
@@ -401,7 +681,8 @@ def branch(year: int = date.today().year) -> str:
     return EARTHLY_BRANCHES[year % 12]
 
 
-def element(year: int = date.today().year) -> str:
+@this_year
+def element(year: int) -> str:
     ''' '''
 
     MAJOR_ELEMENTS = [
@@ -422,7 +703,8 @@ def element(year: int = date.today().year) -> str:
     return MAJOR_ELEMENTS[year % 10]
 
 
-def animal(year: int = date.today().year) -> str:
+@this_year
+def animal(year: int) -> str:
     ''' '''
 
     CHINESE_ZODIAC = [
@@ -445,7 +727,8 @@ def animal(year: int = date.today().year) -> str:
     return CHINESE_ZODIAC[year % 12]
 
 
-def correlation(year: int = date.today().year) -> str:
+@this_year
+def correlation(year: int) -> str:
     ''' '''
 
     CORRELATIONS = [
@@ -0,0 +1,214 @@
+# Fixed day numbers (Rata Die, or RD): day 1 is 1 January 1 on the proleptic
+# Gregorian calendar, exactly like date.toordinal().  Every calendar is
+# converted to and from RD with integer arithmetic only, following
+# Reingold & Dershowitz, Calendrical Calculations, so that the rest of
+# paper_cal can work on plain ints and only build date objects when handing
+# results back.
+#
+# Years are astronomical: 1 BCE is year 0, 2 BCE is year -1 and so on.
+
+GREGORIAN_EPOCH = 1  # 1 January 1 (Gregorian)
+JULIAN_EPOCH = -1  # 1 January 1 (Julian), 30 December 0 (Gregorian)
+HEBREW_EPOCH = -1373427  # 1 Tishrei 1 AM, 7 October 3761 BCE (Julian)
+ISLAMIC_EPOCH = 227015  # 1 Muharram 1 AH, 16 July 622 (Julian)
+
+DAYS_BEFORE_MONTH = [-1, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334]
+MONTHS_IN_YEAR = 12
+TISHREI, ADAR, ADAR_II = 7, 12, 13  # Hebrew months are numbered from Nisan
+
+
+# Gregorian
+
+
+def is_gregorian_leap(year: int) -> bool:
+    ''' '''
+
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def fixed_from_gregorian(year: int, month: int, day: int) -> int:
+    ''' '''
+
+    before = year - 1
+    leap_day = month > 2 and is_gregorian_leap(year)
+    return (
+        GREGORIAN_EPOCH
+        - 1
+        + 365 * before
+        + before // 4
+        - before // 100
+        + before // 400
+        + DAYS_BEFORE_MONTH[month]
+        + leap_day
+        + day
+    )
+
+
+def gregorian_from_fixed(rd: int) -> tuple[int, int, int]:
+    ''' '''
+
+    d0 = rd - GREGORIAN_EPOCH
+    n400, d1 = divmod(d0, 146097)
+    n100, d2 = divmod(d1, 36524)
+    n4, d3 = divmod(d2, 1461)
+    n1 = d3 // 365
+    year = 400 * n400 + 100 * n100 + 4 * n4 + n1
+    if n100 != 4 and n1 != 4:
+        year += 1
+
+    prior_days = rd - fixed_from_gregorian(year, 1, 1)
+    if rd >= fixed_from_gregorian(year, 3, 1):
+        prior_days += 1 if is_gregorian_leap(year) else 2
+    month = (12 * prior_days + 373) // 367
+    return year, month, rd - fixed_from_gregorian(year, month, 1) + 1
+
+
+# Julian
+
+
+def is_julian_leap(year: int) -> bool:
+    ''' '''
+
+    return year % 4 == 0
+
+
+def fixed_from_julian(year: int, month: int, day: int) -> int:
+    ''' '''
+
+    before = year - 1
+    leap_day = month > 2 and is_julian_leap(year)
+    return (
+        JULIAN_EPOCH
+        - 1
+        + 365 * before
+        + before // 4
+        + DAYS_BEFORE_MONTH[month]
+        + leap_day
+        + day
+    )
+
+
+def julian_from_fixed(rd: int) -> tuple[int, int, int]:
+    ''' '''
+
+    year = (4 * (rd - JULIAN_EPOCH) + 1464) // 1461
+    prior_days = rd - fixed_from_julian(year, 1, 1)
+    if rd >= fixed_from_julian(year, 3, 1):
+        prior_days += 1 if is_julian_leap(year) else 2
+    month = (12 * prior_days + 373) // 367
+    return year, month, rd - fixed_from_julian(year, month, 1) + 1
+
+
+# Hebrew
+
+
+def is_hebrew_leap(year: int) -> bool:
+    ''' '''
+
+    # 7 leap years (with Adar II) in every 19 years cycle
+    return (7 * year + 1) % 19 < 7
+
+
+def _elapsed_days(year: int) -> int:
+    # Days from the epoch to the molad of Tishrei, in days and parts (there
+    # are 25920 parts in a day), pushed back a day when Rosh Hashanah would
+    # fall on a Sunday, a Wednesday or a Friday
+    months_elapsed = (235 * year - 234) // 19
+    parts_elapsed = 12084 + 13753 * months_elapsed
+    days = 29 * months_elapsed + parts_elapsed // 25920
+    if (3 * (days + 1)) % 7 < 3:
+        days += 1
+    return days
+
+
+def _year_length_correction(year: int) -> int:
+    # Keep every year between 353 and 355 (383 and 385) days long
+    this_year, next_year = _elapsed_days(year), _elapsed_days(year + 1)
+    if next_year - this_year == 356:
+        return 2
+    if this_year - _elapsed_days(year - 1) == 382:
+        return 1
+    return 0
+
+
+def hebrew_new_year(year: int) -> int:
+    ''' '''
+
+    return HEBREW_EPOCH + _elapsed_days(year) + _year_length_correction(year)
+
+
+def hebrew_month_lengths(year: int) -> list[int]:
+    ''' '''
+
+    # Days in each month, by month number (0 for Adar II in common years)
+    length = hebrew_new_year(year + 1) - hebrew_new_year(year)
+    months = [0, 30, 29, 30, 29, 30, 29, 30, 29, 30, 29, 30, 29, 0]
+    months[8] = 30 if length % 10 == 5 else 29  # Cheshvan, long in complete years
+    months[9] = 29 if length % 10 == 3 else 30  # Kislev, short in deficient years
+    if is_hebrew_leap(year):
+        months[ADAR], months[ADAR_II] = 30, 29
+    return months
+
+
+def hebrew_month_starts(year: int) -> list[int | None]:
+    ''' '''
+
+    # RD of the 1st of each month, by month number (None for Adar II in
+    # common years).  The year starts with Tishrei, Nisan comes 7th.
+    lengths = hebrew_month_lengths(year)
+    last = ADAR_II if is_hebrew_leap(year) else ADAR
+    starts = [None] * len(lengths)
+    start = hebrew_new_year(year)
+    for month in [*range(TISHREI, last + 1), *range(1, TISHREI)]:
+        starts[month] = start
+        start += lengths[month]
+    return starts
+
+
+def fixed_from_hebrew(year: int, month: int, day: int) -> int:
+    ''' '''
+
+    return hebrew_month_starts(year)[month] + day - 1
+
+
+def hebrew_from_fixed(rd: int) -> tuple[int, int, int]:
+    ''' '''
+
+    # The average year is 35975351 / 98496 days long
+    year = (rd - HEBREW_EPOCH) * 98496 // 35975351 + 1
+    while hebrew_new_year(year) > rd:
+        year -= 1
+    while hebrew_new_year(year + 1) <= rd:
+        year += 1
+
+    starts = hebrew_month_starts(year)
+    month = max(
+        (start, month) for month, start in enumerate(starts) if start and start <= rd
+    )[1]
+    return year, month, rd - starts[month] + 1
+
+
+# Islamic (arithmetic, civil epoch)
+
+
+def islamic_new_year(year: int) -> int:
+    ''' '''
+
+    # 11 leap years (of 355 days) in every 30 years cycle
+    return ISLAMIC_EPOCH + (year - 1) * 354 + (3 + 11 * year) // 30
+
+
+def fixed_from_islamic(year: int, month: int, day: int) -> int:
+    ''' '''
+
+    # Months alternate between 30 and 29 days, the leap day goes at the end
+    return islamic_new_year(year) + (59 * (month - 1) + 1) // 2 + day - 1
+
+
+def islamic_from_fixed(rd: int) -> tuple[int, int, int]:
+    ''' '''
+
+    year = (30 * (rd - ISLAMIC_EPOCH) + 10646) // 10631
+    prior_days = rd - islamic_new_year(year)
+    month = min((11 * prior_days + 330) // 325, MONTHS_IN_YEAR)
+    return year, month, rd - fixed_from_islamic(year, month, 1) + 1
@@ -0,0 +1,110 @@
+import heapq
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from itertools import count, repeat
+
+from . import holiday_canada, holiday_other, holiday_religious
+from .index import RuleIndex
+from .rules import Event, evaluate
+
+# Every source of holidays by name, so that callers can evaluate any mix of
+# them in-process instead of running the holiday_*.py scripts
+REGISTRY = {
+    'canada': holiday_canada.RULES,
+    'religious': holiday_religious.RULES,
+    'other': holiday_other.RULES,
+}
+INDEX = RuleIndex(REGISTRY)
+
+SHARDS_PER_JOB = 4  # smaller shards keep every process busy until the end
+
+
+def register(source: str, rules: list) -> None:
+    ''' '''
+
+    rules = list(rules)
+    REGISTRY.setdefault(source, []).extend(rules)
+    INDEX.add(source, rules)
+
+
+def rules_for(sources=None, region=None, tag=None) -> list:
+    ''' '''
+
+    if sources is None:
+        sources = REGISTRY
+    if region is None and tag is None:
+        return [rule for source in sources for rule in REGISTRY[source]]
+    # Only the rules for the region (or with the tag) get evaluated
+    return INDEX.lookup(region, tag, sources)
+
+
+def holidays(years, sources=None, region=None, tag=None) -> list[Event]:
+    ''' '''
+
+    return evaluate(rules_for(sources, region, tag), years)
+
+
+def _in_order(batches) -> Iterator[Event]:
+    # Batches of events come a year (or a span of years) at a time, with the
+    # last year they cover.  A rule can land a few days outside of its own
+    # year (offsets, observed days), so events wait in a heap until no later
+    # batch can come before them anymore.
+    pending = []
+    tiebreak = count()
+    for last_year, events in batches:
+        for event in events:
+            heapq.heappush(pending, (str(event), next(tiebreak), event))
+        done = str(date(last_year, 1, 1))
+        while pending and pending[0][0] < done:
+            yield heapq.heappop(pending)[-1]
+    while pending:
+        yield heapq.heappop(pending)[-1]
+
+
+def _stream(rules, years) -> Iterator[Event]:
+    # One source in order, a year at a time
+    return _in_order((year, evaluate(rules, year)) for year in sorted(years))
+
+
+def merged(years, sources=None, region=None, tag=None) -> Iterator[Event]:
+    ''' '''
+
+    # Same lines as `( ./holiday_canada.py ; ... ) | sort` for every year, as
+    # a k-way merge of the sources streamed one event at a time
+    if isinstance(years, int):
+        years = [years]
+    if sources is None:
+        sources = REGISTRY
+
+    streams = [_stream(rules_for([source], region, tag), years) for source in sources]
+    return heapq.merge(*streams, key=str)
+
+
+def parallel(
+    years,
+    sources=None,
+    jobs: int | None = None,
+    region=None,
+    tag=None,
+    mp_context=None,
+) -> Iterator[Event]:
+    ''' '''
+
+    # Same events as merged(), with the years split in contiguous shards
+    # evaluated by a pool of processes (jobs=None uses every CPU).  Shards
+    # come back in order and go through the same reordering heap as a single
+    # source.  The rules are picked here and sent to the workers, which do
+    # not see sources registered at run time unless they were forked.
+    if isinstance(years, int):
+        years = [years]
+
+    rules = rules_for(sources, region, tag)
+    years = sorted(years)
+    jobs = jobs or os.cpu_count()
+    size = -(-len(years) // (jobs * SHARDS_PER_JOB)) or 1
+    shards = [years[i : i + size] for i in range(0, len(years), size)]
+    with ProcessPoolExecutor(jobs, mp_context=mp_context) as pool:
+        results = pool.map(evaluate, repeat(rules), shards)
+        yield from _in_order(zip((shard[-1] for shard in shards), results))
@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Container
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import NamedTuple
+
+from .paper_cal import (
+    JANUARY,
+    FRIDAY,
+    LENGTH_OF_WEEK,
+    closest_date,
+    days_in_month,
+    easter,
+    heb_date,
+    moon_phases,
+    ordinal,
+)
+from .islamic import islamic_dates
+from .observance import Policy, substitute, weekend_policy
+
+# Each holiday is described by a rule object instead of a print() call, so
+# that a whole calendar can be evaluated in-process for any year (or range of
+# years) and handed around as typed event records
+#
+# Rules carry the regions they apply to as codes from the list in README.rst.
+# Unless given, they are read from the end of the name ("Family Day (CA-AB,
+# CA-BC)"), which is how they have always been written.
+
+REGIONS = re.compile(r' \(([A-Z]{2,3}(?:-[A-Z]{2})?(?:, [A-Z]{2,3}(?:-[A-Z]{2})?)*)\)$')
+
+
+class Event(NamedTuple):
+    date: date
+    name: str
+    time: time | None = None
+
+    def __str__(self) -> str:
+        if self.time is None:
+            return f'{self.date} {self.name}'
+        if self.time.tzinfo is not None and not self.time.utcoffset():
+            return f'{self.date} {self.time.strftime("%H:%M")}Z {self.name}'
+        return f'{self.date} {self.time.strftime("%H:%M")} {self.name}'
+
+
+@dataclass(frozen=True, kw_only=True)
+class Rule:
+    ''' '''
+
+    name: str
+    time: time | None = None
+    offset: int = 0  # days added after the rule has been resolved
+    since: int | None = None  # prefix the name with the ordinal anniversary
+    years: Container | None = None  # only occurs in these years
+    skip: tuple = ()  # never occurs in these years
+    regions: tuple[str, ...] | None = None  # read from the name when None
+    tags: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        if self.regions is None:
+            found = REGIONS.search(self.name)
+            regions = tuple(found[1].split(', ')) if found else ()
+            object.__setattr__(self, 'regions', regions)
+
+    def occurs(self, year: int) -> bool:
+        ''' '''
+
+        if year in self.skip:
+            return False
+        return self.years is None or year in self.years
+
+    def label(self, year: int) -> str:
+        ''' '''
+
+        if self.since is None:
+            return self.name
+        return f'{ordinal(year - self.since)} {self.name}'
+
+    def dates(self, year: int) -> list:
+        ''' '''
+
+        raise NotImplementedError
+
+    def evaluate(self, year: int) -> list[Event]:
+        ''' '''
+
+        if not self.occurs(year):
+            return []
+
+        events = []
+        for found in self.dates(year):
+            found_time = self.time
+            if isinstance(found, datetime):
+                if found_time is None:
+                    found_time = found.time()
+                found = found.date()
+            events.append(
+                Event(found + timedelta(days=self.offset), self.label(year), found_time)
+            )
+        return events
+
+
+@dataclass(frozen=True, kw_only=True)
+class Fixed(Rule):
+    ''' '''
+
+    month: int
+    day: int  # negative days count back from the end of the month
+
+    def dates(self, year: int) -> list:
+        ''' '''
+
+        if self.day < 0:
+            return [
+                date(year, self.month, days_in_month(self.month, year) + 1 + self.day)
+            ]
+        # February 29 only occurs in leap years
+        if self.day > days_in_month(self.month, year):
+            return []
+        return [date(year, self.month, self.day)]
+
+
+@dataclass(frozen=True, kw_only=True)
+class YearDay(Rule):
+    ''' '''
+
+    day: int  # 1st day of the year is day 1
+
+    def dates(self, year: int) -> list:
+        ''' '''
+
+        return [date(year, JANUARY, 1) + timedelta(days=self.day - 1)]
+
+
+@dataclass(frozen=True, kw_only=True)
+class Weekday(Rule):
+    ''' '''
+
+    weekday: int
+    month: int
+    day: int
+    last: bool = False
+
+    def dates(self, year: int) -> list:
+        ''' '''
+
+        if not self.last and self.day > days_in_month(self.month, year):
+            return []
+        return [closest_date(self.weekday, date(year, self.month, self.day), self.last)]
+
+
+@dataclass(frozen=True, kw_only=True)
+class Coincident(Rule):
+    ''' '''
+
+    # Every time a given day of the month lands on a given weekday (Friday the
+    # 13th)
+    weekday: int = FRIDAY
+    day: int = 13
+
+    def dates(self, year: int) -> list:
+        ''' '''
+
+        found = []
+        for month in range(1, 13):
+            nearby_date = date(year, month, self.day)
+            if nearby_date.weekday() == self.weekday % LENGTH_OF_WEEK:
+                found.append(nearby_date)
+        return found
+
+
+@dataclass(frozen=True, kw_only=True)
+class Observed(Rule):
+    ''' '''
+
+    # The day a holiday is observed on when a policy moves it (see
+    # observance.py), without landing on the day of a holiday of `group`.
+    # Without a policy, weekend holidays get moved to the closest
+    # `saturday`/`sunday` weekday.
+    month: int
+    day: int
+    policy: Policy | None = None
+    group: tuple[tuple[int, int], ...] = ()  # (month, day) of the others
+    saturday: int | None = None
+    sunday: int | None = None
+    keep: bool = False  # also occurs when it was not moved
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        if self.policy is None:
+            policy = weekend_policy(self.saturday, self.sunday)
+            object.__setattr__(self, 'policy', policy)
+
+    def dates(self, year: int) -> list:
+        ''' '''
+
+        ordinal = date(year, self.month, self.day).toordinal()
+        if self.group:
+            others = [date(year, *day).toordinal() for day in self.group]
+            found = substitute([ordinal, *others], self.policy)[0]
+        else:
+            found = self.policy.observe(ordinal)
+        if found != ordinal or self.keep:
+            return [date.fromordinal(found)]
+        return []
+
+
+@dataclass(frozen=True, kw_only=True)
+class Easter(Rule):
+    ''' '''
+
+    def dates(self, year: int) -> list:
+        ''' '''
+
+        return [easter(year)]
+
+
+@dataclass(frozen=True, kw_only=True)
+class Hebrew(Rule):
+    ''' '''
+
+    month: int
+    day: int
+
+    def dates(self, year: int) -> list:
+        ''' '''
+
+        return [heb_date(self.month, self.day, year)]
+
+
+@dataclass(frozen=True, kw_only=True)
+class Islamic(Rule):
+    ''' '''
+
+    month: int
+    day: int
+
+    def dates(self, year: int) -> list:
+        ''' '''
+
+        # Once or twice a year, an Islamic year being 11 days shorter
+        return islamic_dates(
+            self.month, self.day, date(year, JANUARY, 1), date(year + 1, JANUARY, 1)
+        )
+
+
+@dataclass(frozen=True, kw_only=True)
+class Astronomical(Rule):
+    ''' '''
+
+    # `function` is one of spring(), summer(), autumn(), winter(),
+    # perihelion() or aphelion()
+    function: Callable
+    timed: bool = True
+
+    def dates(self, year: int) -> list:
+        ''' '''
+
+        found = self.function(year)
+        if self.timed:
+            return [found]
+        return [found.date()]
+
+
+@dataclass(frozen=True, kw_only=True)
+class MoonPhase(Rule):
+    ''' '''
+
+    # Every NEW_MOON, FIRST_QUARTER_MOON, FULL_MOON or LAST_QUARTER_MOON of the
+    # year, including the 13th (blue) moon some years have
+    phase: int
+
+    def dates(self, year: int) -> list:
+        ''' '''
+
+        return [
+            found.date() for found, phase in moon_phases(year) if phase == self.phase
+        ]
+
+
+@dataclass(frozen=True, kw_only=True)
+class Lunar(Rule):
+    ''' '''
+
+    # `function` is one of new_moon(), first_moon(), full_moon() or
+    # last_moon(), looked up around the middle of `month` (or of every month)
+    function: Callable
+    month: int | None = None
+
+    def dates(self, year: int) -> list:
+        ''' '''
+
+        months = range(1, 13) if self.month is None else [self.month]
+        return [self.function(date(year, month, 16)).date() for month in months]
+
+
+def evaluate(rules, years) -> list[Event]:
+    ''' '''
+
+    if isinstance(years, int):
+        years = [years]
+
+    events = []
+    for year in years:
+        for rule in rules:
+            events.extend(rule.evaluate(year))
+    return events
@@ -0,0 +1,187 @@
+import gzip
+import hashlib
+import io
+import json
+import re
+from datetime import datetime, timezone
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import NamedTuple
+
+from .cache import memoize
+from .export import json_object, write_csv
+from .registry import INDEX, REGISTRY, merged
+from .ical import write_ical
+
+# Holiday feeds over HTTP, for calendar clients to subscribe to:
+#
+#   /holidays/{region}/{year}.ics
+#   /holidays/{region}/{year}.json
+#   /holidays/{region}/{year}.csv
+#
+# where region is a region code (CA-NS, which includes CA), a source of the
+# REGISTRY, or "all" for every source.
+# Rendered bodies (and their gzipped copies) are kept in an LRU, so that the
+# constant polling of calendar clients is answered from memory, most of the
+# time with a 304 since ETags only depend on the body.  Call
+# response.cache_clear() after registering rules while the server runs.
+
+FORMATS = {
+    'ics': 'text/calendar; charset=utf-8',
+    'json': 'application/json',
+    'csv': 'text/csv; charset=utf-8',
+}
+FEED = re.compile(r'/holidays/([\w.-]+)/(\d{1,4})\.(\w+)')
+RESPONSE_CACHE_SIZE = 512
+MAX_AGE = 3600  # seconds
+
+
+class Response(NamedTuple):
+    body: bytes
+    gzipped: bytes
+    etag: str  # of the body, the gzipped body has "-gzip" added
+    content_type: str
+
+
+def _events(region: str, year: int):
+    if region == 'all':
+        return merged(year)
+    if region in REGISTRY:
+        return merged(year, [region])
+    if INDEX.known(region):
+        return merged(year, region=region)
+    raise KeyError(region)
+
+
+def _known(region: str) -> bool:
+    return region == 'all' or region in REGISTRY or INDEX.known(region)
+
+
+def render(region: str, year: int, format: str) -> bytes:
+    ''' '''
+
+    events = _events(region, year)
+    out = io.StringIO(newline='')
+    if format == 'ics':
+        # DTSTAMP is left the same for every render, so that the body (and
+        # the ETag) only change when the events do
+        write_ical(events, out, stamp=datetime(year, 1, 1, tzinfo=timezone.utc))
+    elif format == 'json':
+        json.dump([json_object(event) for event in events], out, ensure_ascii=False)
+    elif format == 'csv':
+        write_csv(events, out)
+    else:
+        raise KeyError(format)
+    return out.getvalue().encode()
+
+
+@memoize(maxsize=RESPONSE_CACHE_SIZE)
+def response(region: str, year: int, format: str) -> Response:
+    ''' '''
+
+    body = render(region, year, format)
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    return Response(
+        body=body,
+        gzipped=gzip.compress(body, mtime=0),
+        etag=f'"{digest}"',
+        content_type=FORMATS[format],
+    )
+
+
+def _accepts_gzip(header: str | None) -> bool:
+    for coding in (header or '').split(','):
+        name, _, parameters = coding.partition(';')
+        if name.strip().lower() not in ('gzip', 'x-gzip'):
+            continue
+        weight = parameters.replace(' ', '').removeprefix('q=') or '1'
+        try:
+            return float(weight) > 0
+        except ValueError:
+            return False
+    return False
+
+
+def _matches(header: str | None, etag: str) -> bool:
+    # Weak comparison, which is the one for If-None-Match
+    if header is None:
+        return False
+    if header.strip() == '*':
+        return True
+    for tag in header.split(','):
+        tag = tag.strip().removeprefix('W/')
+        if tag in (etag, etag[:-1] + '-gzip"'):
+            return True
+    return False
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    ''' '''
+
+    server_version = 'paper_cal'
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        ''' '''
+
+        self._respond(head=False)
+
+    def do_HEAD(self) -> None:
+        ''' '''
+
+        self._respond(head=True)
+
+    def _respond(self, head: bool) -> None:
+        found = FEED.fullmatch(self.path.split('?', 1)[0])
+        if found is None or found[3] not in FORMATS:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        region, year, format = found[1], int(found[2]), found[3]
+        if not 1 <= year <= 9999 or not _known(region):
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        try:
+            cached = response(region, year, format)
+        except (ValueError, OverflowError) as error:
+            # A year some rule cannot be worked out for (PyMeeus only finds
+            # equinoxes and solstices up to 3000, Islamic dates look into
+            # the next year...)
+            self.send_error(HTTPStatus.NOT_FOUND, explain=str(error))
+            return
+        compressed = _accepts_gzip(self.headers.get('Accept-Encoding'))
+        etag = cached.etag[:-1] + '-gzip"' if compressed else cached.etag
+        if _matches(self.headers.get('If-None-Match'), cached.etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._common_headers(etag)
+            self.end_headers()
+            return
+
+        body = cached.gzipped if compressed else cached.body
+        self.send_response(HTTPStatus.OK)
+        self._common_headers(etag)
+        self.send_header('Content-Type', cached.content_type)
+        if compressed:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def _common_headers(self, etag: str) -> None:
+        self.send_header('ETag', etag)
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Cache-Control', f'public, max-age={MAX_AGE}')
+
+    def log_request(self, code='-', size='-') -> None:
+        ''' '''
+
+        # Polling clients would fill the terminal, errors are still logged
+        pass
+
+
+def serve(host: str = '127.0.0.1', port: int = 8000) -> ThreadingHTTPServer:
+    ''' '''
+
+    # Call serve_forever() on the result, or shutdown() from another thread
+    return ThreadingHTTPServer((host, port), FeedHandler)
@@ -0,0 +1,139 @@
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date
+from threading import Lock
+from typing import NamedTuple
+
+from .cache import memoize
+from .registry import rules_for
+from .index import country
+from .rules import Event
+
+# The events of a span of years evaluated once and kept sorted by day, so
+# that "what is on between these two days" is two binary searches and a
+# slice, O(log n + k), instead of evaluating every rule for every year the
+# days touch.  Every region has its own sorted column (with the events of its
+# country), so region queries do not skip over the other regions' events.
+#
+# Multi-day holidays (Hanukkah, the Construction Holiday) are written as
+# separate "Begins" and "Ends" events, which is what the store holds too.
+#
+# A store is never changed once built and can be shared between threads,
+# event_store() keeps one per span of years for the whole process.
+
+STORE_CACHE_SIZE = 4
+STATUTORY = 'statutory'
+
+
+class Column(NamedTuple):
+    ordinals: tuple[int, ...]
+    events: tuple[Event, ...]
+
+
+class EventStore:
+    ''' '''
+
+    def __init__(self, years, sources=None, region=None, tag=None):
+        if isinstance(years, int):
+            years = [years]
+        first, last = min(years), max(years)
+        self.start = date(first, 1, 1)
+        self.end = date(last, 12, 31)
+
+        # A rule can land in the next or previous year (offsets, observed
+        # days), so that every day of the span gets all of its events
+        rules = rules_for(sources, region, tag)
+        found = []
+        for year in range(first - 1, last + 2):
+            for rule in rules:
+                for event in rule.evaluate(year):
+                    if self.start <= event.date <= self.end:
+                        found.append((str(event), event, rule))
+        found.sort(key=lambda entry: entry[0])  # same order as merged()
+
+        events = [event for _, event, _ in found]
+        self.all = _column(events)
+        by_region = defaultdict(set)
+        days_off = defaultdict(set)  # None for every region
+        for position, (_, event, rule) in enumerate(found):
+            for code in rule.regions:
+                by_region[code].add(position)
+            if STATUTORY in rule.tags:
+                for code in (None, *rule.regions):
+                    days_off[code].add(self.all.ordinals[position])
+        self.regions = {}  # code to the column of that region
+        for code, positions in by_region.items():
+            positions = positions | by_region.get(country(code), set())
+            self.regions[code] = _column([events[i] for i in sorted(positions)])
+        self.days_off = {None: frozenset(days_off.pop(None, ()))}
+        for code, days in days_off.items():
+            self.days_off[code] = frozenset(days | days_off.get(country(code), set()))
+
+    def _check(self, day: date) -> None:
+        if not self.start <= day <= self.end:
+            raise ValueError(f'{day} is outside of {self.start} to {self.end}')
+
+    def _select(self, region: str | None) -> Column:
+        if region is None:
+            return self.all
+        if region in self.regions:
+            return self.regions[region]
+        return self.regions.get(country(region), EMPTY)
+
+    def between(self, start: date, end: date, region: str | None = None) -> list:
+        ''' '''
+
+        # Events from start to end, both included
+        self._check(start)
+        self._check(end)
+        column = self._select(region)
+        low = bisect_left(column.ordinals, start.toordinal())
+        high = bisect_right(column.ordinals, end.toordinal())
+        return list(column.events[low:high])
+
+    def on(self, day: date, region: str | None = None) -> list[Event]:
+        ''' '''
+
+        return self.between(day, day, region)
+
+    def is_holiday(self, day: date, region: str | None = None) -> bool:
+        ''' '''
+
+        # A day off of the region, or of any region when region is None: the
+        # day of a rule tagged "statutory", not any event (moon phases,
+        # observances...)
+        self._check(day)
+        if region is not None and region not in self.days_off:
+            region = country(region)
+        return day.toordinal() in self.days_off.get(region, ())
+
+
+def _column(events) -> Column:
+    return Column(tuple(event.date.toordinal() for event in events), tuple(events))
+
+
+EMPTY = _column([])
+
+_lock = Lock()
+
+
+@memoize(maxsize=STORE_CACHE_SIZE)
+def _shared(first: int, last: int) -> EventStore:
+    return EventStore(range(first, last + 1))
+
+
+def event_store(first: int, last: int) -> EventStore:
+    ''' '''
+
+    # The store of every source from first to last, built once per process:
+    # threads asking for it at the same time wait for a single build.  Call
+    # event_store.cache_clear() after registering rules.
+    try:
+        return _shared.cache_get(first, last)
+    except KeyError:
+        pass
+    with _lock:
+        return _shared(first, last)
+
+
+event_store.cache_clear = _shared.cache_clear
@@ -1,11 +1,14 @@
 #!/usr/bin/env python
 
 
-from datetime import date, timedelta
+import sys
+from datetime import date, time, timedelta
 
 import click
 
 from paper_cal import *
+from paper_cal import Event
+from paper_cal.export import WRITERS, write_events
 
 
 def get_assignment():
@@ -30,39 +33,42 @@ def get_assignment():
             yield f'{name}'
 
 
-@click.command()
-@click.option(
-    '--year',
-    '-y',
-    default=date.today().year,
-    help='Year to show',
-)
-def main(year):
+def get_nets(year):
     ''' '''
 
     assignment = get_assignment()
     # Lanark North Leeds ARES nets are every Wednesday of each month at
     # 20:00.
     for month in range(1, 13):
-        print(
-            f'{closest_date(WEDNESDAY, date(year, month, WEEK1))} 20:00 {next(assignment)}'
-        )
-        print(
-            f'{closest_date(WEDNESDAY, date(year, month, WEEK2))} 20:00 {next(assignment)}'
-        )
-        print(
-            f'{closest_date(WEDNESDAY, date(year, month, WEEK3))} 20:00 {next(assignment)}'
-        )
-        print(
-            f'{closest_date(WEDNESDAY, date(year, month, WEEK4))} 20:00 {next(assignment)}'
-        )
+        for week in (WEEK1, WEEK2, WEEK3, WEEK4):
+            day = closest_date(WEDNESDAY, date(year, month, week))
+            yield Event(day, next(assignment), time(20, 0))
         # Wednesdays sometimes happen in the 5th week of the month
         if closest_date(WEDNESDAY, date(year, month, WEEK4)) != closest_date(
             WEDNESDAY, date(year, month, WEEK4), last=True
         ):
-            print(
-                f'{closest_date(WEDNESDAY, date(year, month, WEEK4), last=True)} 20:00 {next(assignment)}'
-            )
+            day = closest_date(WEDNESDAY, date(year, month, WEEK4), last=True)
+            yield Event(day, next(assignment), time(20, 0))
+
+
+@click.command()
+@click.option(
+    '--year',
+    '-y',
+    default=date.today().year,
+    help='Year to show',
+)
+@click.option(
+    '--format',
+    '-F',
+    default='text',
+    type=click.Choice(sorted(WRITERS)),
+    help='Output format',
+)
+def main(year, format):
+    ''' '''
+
+    write_events(get_nets(year), sys.stdout, format)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+
+
+import click
+
+from paper_cal.server import serve
+
+
+@click.command()
+@click.option(
+    '--host',
+    '-h',
+    default='127.0.0.1',
+    help='Address to listen on',
+)
+@click.option(
+    '--port',
+    '-p',
+    default=8000,
+    help='Port to listen on',
+)
+def main(host, port):
+    ''' '''
+
+    # Feeds are at /holidays/{region}/{year}.ics (or .json or .csv)
+    server = serve(host, port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,45 @@
-from datetime import date, timedelta
+import os
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
 
 import pytest
 
 from paper_cal import *
+from paper_cal import (
+    REGISTRY,
+    Incremental,
+    Astronomical,
+    Coincident,
+    BusinessDays,
+    Easter,
+    EventStore,
+    Event,
+    Fixed,
+    Lunar,
+    MoonPhase,
+    Observed,
+    Weekday,
+    YearDay,
+    batch,
+    business_days,
+    closest_dates,
+    closest_ordinals,
+    evaluate,
+    event_store,
+    fingerprint,
+    holidays,
+    load_oog,
+    merged,
+    parallel,
+    ordinals,
+    RuleIndex,
+    write_csv,
+    write_events,
+    write_ical,
+    write_jsonl,
+    write_tsv,
+    parse_oog,
+)
 
 
 class TestDays:
@@ -50,6 +87,10 @@ class TestDays:
         assert days_in_month(FEB, 2023) == 28
         assert days_in_month(FEB, 2024) == 29
 
+        # datetime.date has no February 29 in 1500, Julian leap year or not
+        assert days_in_month(FEBRUARY, 1500) == 28
+        assert days_in_month(FEBRUARY, 1600) == 29
+
     def test_some_nearby_days(self):
         assert closest_date(SATURDAY, date(2020, JANUARY, 30), last=True) == date(
             2020, JANUARY, 25
@@ -159,11 +200,1072 @@ class TestDays:
         for year in range(1, 5000):
             assert easter(year).month == MARCH or easter(year).month == APRIL
 
+    def test_easter_ordinals_match_pymeeus(self):
+        from pymeeus.Epoch import Epoch
+
+        years = range(1, 10000)
+        assert easter_ordinals(years) == [
+            date(year, *Epoch.easter(year)).toordinal() for year in years
+        ]
+        assert passover_ordinals(range(1, 3000)) == [
+            date(year, *Epoch.jewish_pesach(year)).toordinal()
+            for year in range(1, 3000)
+        ]
+
+    def test_orthodox_easter(self):
+        assert [
+            date.fromordinal(found)
+            for found in orthodox_easter_ordinals([2023, 2024, 2025])
+        ] == [date(2023, APRIL, 16), date(2024, MAY, 5), date(2025, APRIL, 20)]
+
+    def test_hebrew_years(self):
+        from pyluach import dates
+
+        for greg_year in range(2020, 2030):
+            for heb_month in (NISAN, SIVAN, TISHREI, KISLEV, TEVET, ADAR_I):
+                heb_year = greg_year + 3760 + (heb_month >= TISHREI)
+                assert (
+                    heb_date(heb_month, 14, greg_year)
+                    == dates.HebrewDate(heb_year, heb_month, 14).to_pydate()
+                )
+        assert hebrew_year(5784).leap and hebrew_year(5784).length == 383
+        assert hebrew_year(5785).month_starts[ADAR] is None
+        with pytest.raises(ValueError):
+            heb_date(ADAR, 14, 2024)
+        with pytest.raises(ValueError):
+            heb_date(CHESHVAN, 30, 2023)
+
+    def test_islamic_dates(self):
+        assert isl_date(RAMADAN, 1, 2024) == date(2024, MARCH, 11)
+        assert isl_date(RAMADAN, 1, 1999) == date(1999, DECEMBER, 9)
+        assert islamic_dates(RAMADAN, 1, date(2030, 1, 1), date(2031, 1, 1)) == [
+            date(2030, JANUARY, 6),
+            date(2030, DECEMBER, 26),
+        ]
+        table = IslamicTable(1440, 1450)
+        assert table.from_ordinal(date(2024, MARCH, 11).toordinal()) == (1445, 9, 1)
+        with pytest.raises(ValueError):
+            table.month_start(1451, RAMADAN)
+
+    def test_islamic_table_matches_pymeeus(self):
+        from pymeeus.Epoch import Epoch
+
+        table = IslamicTable(1000, 1500)
+        for isl_year in range(1000, 1500, 7):
+            for isl_month in range(1, 13):
+                found = date(*Epoch.moslem2gregorian(isl_year, isl_month, 1))
+                assert table.month_start(isl_year, isl_month) == found.toordinal()
+
     def test_passover(self):
         assert passover(2022) - timedelta(days=1) == heb_date(NISAN, 14, 2022)
         assert passover(2022) + timedelta(days=7) == heb_date(NISAN, 22, 2022)
 
 
+class TestDayNumbers:
+    def test_gregorian_and_julian(self):
+        from paper_cal import rd
+
+        for ordinal in range(1, date.max.toordinal(), 997):
+            found = date.fromordinal(ordinal)
+            assert rd.gregorian_from_fixed(ordinal) == (
+                found.year,
+                found.month,
+                found.day,
+            )
+            assert rd.fixed_from_gregorian(*rd.gregorian_from_fixed(ordinal)) == ordinal
+            assert rd.fixed_from_julian(*rd.julian_from_fixed(ordinal)) == ordinal
+        assert rd.fixed_from_julian(1582, OCTOBER, 5) == date(1582, 10, 15).toordinal()
+
+    def test_hebrew_and_islamic(self):
+        from pyluach import dates
+
+        from paper_cal import rd
+
+        for ordinal in range(date(1, 1, 1).toordinal(), date.max.toordinal(), 4999):
+            hebrew = dates.HebrewDate.from_pydate(date.fromordinal(ordinal))
+            found = rd.hebrew_from_fixed(ordinal)
+            assert found == (hebrew.year, hebrew.month, hebrew.day)
+            assert rd.fixed_from_hebrew(*found) == ordinal
+            assert rd.fixed_from_islamic(*rd.islamic_from_fixed(ordinal)) == ordinal
+        assert rd.hebrew_new_year(5785) == date(2024, OCTOBER, 3).toordinal()
+        assert rd.islamic_from_fixed(date(2024, MARCH, 11).toordinal()) == (1445, 9, 1)
+
+
+class TestRules:
+    def test_some_rules(self):
+        assert Fixed(month=JULY, day=1, name='Canada Day').evaluate(2024) == [
+            Event(date(2024, JULY, 1), 'Canada Day')
+        ]
+        assert Fixed(month=FEBRUARY, day=-1, name='x').dates(2024) == [
+            date(2024, FEBRUARY, 29)
+        ]
+        assert Weekday(weekday=MONDAY, month=MAY, day=21, name='x').dates(2024) == [
+            date(2024, MAY, 20)
+        ]
+        assert Easter(offset=-2, name='Good Friday').evaluate(2024) == [
+            Event(date(2024, MARCH, 29), 'Good Friday')
+        ]
+        assert len(Coincident(weekday=FRIDAY, day=13, name='x').dates(2026)) == 3
+        assert YearDay(day=256, name='x').dates(2024) == [date(2024, SEPTEMBER, 12)]
+
+    def test_some_observed_rules(self):
+        rule = Observed(month=JULY, day=1, saturday=MONDAY, sunday=MONDAY, name='x')
+        assert rule.dates(2023) == [date(2023, JULY, 3)]
+        assert rule.dates(2024) == []
+
+    def test_some_restricted_rules(self):
+        rule = Fixed(month=JANUARY, day=20, years=range(1, 10000, 4), name='x')
+        assert rule.evaluate(2024) == []
+        assert rule.evaluate(2025) == [Event(date(2025, JANUARY, 20), 'x')]
+        assert Fixed(month=JUNE, day=1, skip=(2022,), name='x').evaluate(2022) == []
+
+    def test_some_labels(self):
+        rule = Fixed(month=DECEMBER, day=11, since=1931, name='Anniversary')
+        assert str(rule.evaluate(2031)[0]) == '2031-12-11 100th Anniversary'
+
+    def test_the_registry(self):
+        events = holidays(2024, sources=['canada'])
+        assert Event(date(2024, JULY, 1), 'Canada Day') in events
+        assert Event(date(2024, SEPTEMBER, 2), 'Labour Day') in events
+        assert str(events[0]) == '2024-12-31 New Year\'s Eve'
+
+    def test_merged_sources(self):
+        events = list(merged(range(2020, 2026)))
+        assert events == sorted(holidays(range(2020, 2026)), key=str)
+        assert [str(event) for event in merged(2024, ['canada'])][0] == (
+            '2024-01-01 New Year\'s Day'
+        )
+
+    def test_parallel_export(self):
+        years = range(2019, 2031)
+        assert list(parallel(years, jobs=2)) == list(merged(years))
+
+    def test_parallel_spawn(self):
+        import subprocess
+        import sys
+
+        # Spawned workers do not see sources registered at run time
+        script = '''if True:
+            from multiprocessing import get_context
+            from paper_cal import merged, parallel, parse_oog, register
+
+            register('local', parse_oog('JULY 14 Tape Measure Day'))
+            found = parallel(range(2020, 2024), ['local', 'canada'], 2,
+                             mp_context=get_context('spawn'))
+            assert list(found) == list(merged(range(2020, 2024), ['local', 'canada']))
+            found = parallel(range(2020, 2024), ['local'], 2,
+                             mp_context=get_context('spawn'))
+            print(*found, sep=chr(10))
+        '''
+        result = subprocess.run(
+            [sys.executable, '-c', script], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.splitlines() == [
+            f'{year}-07-14 Tape Measure Day' for year in range(2020, 2024)
+        ]
+
+
+class TestRegions:
+    def test_regions(self):
+        family_day = Weekday(
+            weekday=MONDAY,
+            month=FEBRUARY,
+            day=WEEK3,
+            name='Family Day (CA-AB, CA-BC, CA-NB, CA-ON, CA-SK)',
+        )
+        assert family_day.regions == ('CA-AB', 'CA-BC', 'CA-NB', 'CA-ON', 'CA-SK')
+        assert Fixed(month=APRIL, day=1, name='April Fool\'s Day').regions == ()
+        assert Fixed(month=MAY, day=4, name='Star Wars Day (NOT A CODE)').regions == ()
+        canada_day = Fixed(month=JULY, day=1, name='Canada Day', regions=('CA',))
+        assert canada_day.regions == ('CA',)
+        assert canada_day.evaluate(2024)[0].name == 'Canada Day'
+
+    def test_lookup(self):
+        rules = [rule for source in REGISTRY for rule in REGISTRY[source]]
+        index = RuleIndex(REGISTRY)
+
+        found = index.lookup('CA-NS')
+        assert found == [rule for rule in rules if {'CA', 'CA-NS'} & set(rule.regions)]
+        assert all(rule.regions for rule in found)
+        assert index.lookup('CA') == [rule for rule in rules if 'CA' in rule.regions]
+        assert index.lookup(tag='religious') == REGISTRY['religious']
+        assert index.lookup('CA', sources=['other']) == [
+            rule for rule in REGISTRY['other'] if 'CA' in rule.regions
+        ]
+        assert index.lookup('ZZ') == []
+        assert index.known('CA-NS') and index.known('UK') and not index.known('ZZ')
+        assert not index.known('CA-XX')
+
+    def test_holidays(self):
+        found = holidays(range(2030, 2033), region='CA-NS')
+        assert found == [
+            event
+            for event in holidays(range(2030, 2033))
+            if (
+                event.name.endswith(('(CA-NS)', '(CA)', ', CA-NS)', '(CA, US)'))
+                # Not statutory holidays in Nova Scotia
+                and not event.name.startswith(
+                    ('Victoria Day', 'Thanksgiving', 'National Day for Truth')
+                )
+            )
+            or event.name
+            in (
+                'New Year\'s Day',
+                'New Year\'s Day Observed',
+                'Canadian Multiculturalism Day',
+                'Canada Day',
+                'Canada Day Observed',
+                'Labour Day',
+                'Rememberance Day',
+                'Merchant Navy Day',
+                'Good Friday',
+                'Christmas Day',
+                'Christmas Day Observed',
+            )
+            or event.name.endswith('Anniversary of the Statute of Westminster')
+        ]
+        assert list(merged(2031, region='CA-NS')) == sorted(
+            holidays(2031, region='CA-NS'), key=str
+        )
+        assert list(parallel(range(2030, 2033), jobs=2, region='US')) == list(
+            merged(range(2030, 2033), region='US')
+        )
+
+
+class TestStore:
+    def test_between(self):
+        store = EventStore(range(2023, 2026))
+        events = list(merged(range(2022, 2027)))
+        assert list(store.all.events) == [
+            event for event in events if 2023 <= event.date.year <= 2025
+        ]
+
+        start, end = date(2024, 12, 20), date(2025, 1, 10)
+        assert store.between(start, end) == [
+            event for event in events if start <= event.date <= end
+        ]
+        assert store.between(start, end, 'CA-NS') == [
+            event
+            for event in merged(range(2022, 2027), region='CA-NS')
+            if start <= event.date <= end
+        ]
+        assert store.on(date(2024, 7, 1), 'CA-NS') == [
+            Event(date(2024, 7, 1), 'Canada Day')
+        ]
+        assert store.between(end, start) == []
+        with pytest.raises(ValueError):
+            store.between(date(2022, 12, 31), end)
+
+    def test_is_holiday(self):
+        store = event_store(2024, 2024)
+        assert store is event_store(2024, 2024)
+        assert store.is_holiday(date(2024, 2, 19), 'CA-NS')  # Heritage Day
+        assert store.is_holiday(date(2024, 2, 19), 'CA-ON')  # Family Day
+        assert not store.is_holiday(date(2024, 2, 19), 'CA-QC')
+        assert store.is_holiday(date(2024, 9, 2), 'CA-XX')  # Labour Day
+        assert not store.is_holiday(date(2024, 9, 4), 'CA-NS')
+        assert not store.is_holiday(date(2024, 9, 2), 'ZZ')
+        # Days off of any region, not moon phases, seasons or zodiac signs
+        assert store.on(date(2024, 1, 25))  # Full Moon
+        assert not store.is_holiday(date(2024, 1, 25))
+        assert not store.is_holiday(date(2024, 3, 20))  # Spring, Pisces Sets
+        assert store.is_holiday(date(2024, 7, 1))
+        with pytest.raises(ValueError):
+            store.is_holiday(date(2025, 1, 1))
+
+
+class TestBusinessDays:
+    def test_ontario(self):
+        ontario = BusinessDays('CA-ON', range(2024, 2026))
+        assert not ontario.is_business_day(date(2024, 2, 19))  # Family Day
+        assert ontario.is_business_day(date(2024, 8, 5))  # Civic Holiday
+        assert ontario.is_business_day(date(2024, 9, 30))  # Truth and Reconciliation
+        assert ontario.is_business_day(date(2024, 11, 11))  # Remembrance Day
+        assert not ontario.is_business_day(date(2024, 12, 25))
+        assert ontario.is_business_day(date(2024, 12, 24))
+        assert ontario.is_business_day(date(2024, 6, 24))  # only in Quebec
+
+        assert ontario.add(date(2024, 12, 20), 1) == date(2024, 12, 23)
+        assert ontario.add(date(2024, 12, 20), 10) == date(2025, 1, 8)
+        assert ontario.add(date(2025, 1, 8), -10) == date(2024, 12, 20)
+        assert ontario.add(date(2024, 12, 25), 0) == date(2024, 12, 27)
+        assert ontario.count(date(2024, 12, 1), date(2025, 1, 1)) == 20
+        assert ontario.count(date(2025, 1, 1), date(2024, 1, 1)) == 0
+        with pytest.raises(ValueError):
+            ontario.add(date(2025, 12, 31), 1)
+        with pytest.raises(ValueError):
+            ontario.count(date(2023, 12, 1), date(2024, 1, 1))
+
+    def test_observed(self):
+        # Canada Day on a Sunday, Christmas and Boxing Day on a weekend
+        canada = business_days('CA-FED', 2021, 2023)
+        assert canada is business_days('CA-FED', 2021, 2023)
+        assert not canada.is_business_day(date(2023, 7, 3))
+        assert not canada.is_business_day(date(2021, 12, 27))
+        assert not canada.is_business_day(date(2021, 12, 28))
+        assert canada.is_business_day(date(2021, 12, 29))
+
+    def test_known_counts(self):
+        # 262 weekdays in 2024, less the statutory holidays on weekdays: New
+        # Year's Day, Good Friday, Canada Day, Labour Day, Thanksgiving and
+        # Christmas Day, with Family Day, Victoria Day and Boxing Day in
+        # Ontario, and National Patriots' Day and Saint-Jean-Baptiste Day in
+        # Quebec
+        start, end = date(2024, 1, 1), date(2025, 1, 1)
+        assert BusinessDays('CA-ON', [2024]).count(start, end) == 262 - 9
+        quebec = BusinessDays('CA-QC', [2024])
+        assert quebec.count(start, end) == 262 - 8
+        assert quebec.is_business_day(date(2024, 12, 26))
+        assert quebec.is_business_day(date(2024, 11, 11))
+        assert not quebec.is_business_day(date(2024, 6, 24))
+        federal = BusinessDays('CA-FED', [2024])
+        assert not federal.is_business_day(date(2024, 9, 30))
+        assert not federal.is_business_day(date(2024, 11, 11))
+        assert not federal.is_business_day(date(2024, 12, 26))
+
+    def test_against_one_day_at_a_time(self):
+        quebec = BusinessDays('CA-QC', range(2030, 2032))
+        days_off = {
+            event.date
+            for event in holidays(range(2029, 2033), region='CA-QC', tag='statutory')
+        }
+        day = date(2030, 1, 1)
+        while day.year < 2032:
+            expected = day.weekday() < SATURDAY and day not in days_off
+            assert quebec.is_business_day(day) == expected
+            day += timedelta(days=1)
+
+
+class TestOog:
+    def test_some_oog_rules(self):
+        rules = parse_oog('''
+    # A comment
+    SATURDAY NOVEMBER 31 Tall Pines Rally
+    SUNDAY MAY WEEK1 CN Cycle for CHEO
+    MAY 3 1993 Anniversary of Founding of RAC
+    FEBRUARY 7 2036 01:28 NTP Timestamp 32-bit Overflow
+    MARCH 10 MAR10 Day  # Jour MAR10
+    Quadrantids                 28 Dec to 12 Jan   4 Jan
+''')
+        assert [str(event) for event in evaluate(rules, 2024)] == [
+            '2024-11-30 Tall Pines Rally',
+            '2024-05-05 CN Cycle for CHEO',
+            '2024-05-03 31st Anniversary of Founding of RAC',
+            '2024-03-10 MAR10 Day',
+        ]
+        assert str(evaluate(rules, 2036)[3]) == (
+            '2036-02-07 01:28 NTP Timestamp 32-bit Overflow'
+        )
+        with pytest.raises(ValueError):
+            parse_oog('Quadrantids 28 Dec to 12 Jan', strict=True)
+
+    def test_february_29(self, tmp_path):
+        path = tmp_path / 'leap.oog'
+        path.write_text('FEBRUARY 29 Leap Day\nSATURDAY FEBRUARY 29 Leap Saturday\n')
+        rules = load_oog(path, strict=True)
+        assert evaluate(rules, 2025) == []
+        assert [str(event) for event in evaluate(rules, 2024)] == [
+            '2024-02-29 Leap Day',
+            '2024-03-02 Leap Saturday',
+        ]
+        years = range(1896, 1906)
+        assert batch(rules, years) == sorted(
+            evaluate(rules, years), key=lambda event: event.date
+        )
+
+    def test_the_oog_file(self, tmp_path):
+        path = tmp_path / 'oog'
+        path.write_text((Path(__file__).parent.parent / 'oog').read_text())
+        rules = load_oog(path)
+        assert len(rules) == 50
+        assert (tmp_path / '__pycache__' / 'oog.rules.pickle').exists()
+        assert load_oog(path) == rules
+
+        path.write_text('JULY 14 Tape Measure Day\n')
+        assert [rule.name for rule in load_oog(path)] == ['Tape Measure Day']
+
+
+class TestIncremental:
+    def test_fingerprints_across_processes(self):
+        import subprocess
+        import sys
+
+        # Astronomical and Lunar rules hold functions, whose repr() changes
+        # from one process to the next
+        script = (
+            'from paper_cal import REGISTRY, Astronomical, Lunar, fingerprint;'
+            'print(*(fingerprint(rule) for rules in REGISTRY.values() '
+            'for rule in rules if isinstance(rule, (Astronomical, Lunar))))'
+        )
+        runs = [
+            subprocess.run(
+                [sys.executable, '-c', script],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.split()
+            for _ in range(2)
+        ]
+        assert runs[0] == runs[1]
+        assert len(set(runs[0])) == len(runs[0]) > 0
+
+    def test_only_changed_rules(self):
+        rules = parse_oog('MAY 25 Towel Day\nJULY 14 Tape Measure Day\n')
+        incremental = Incremental(rules)
+        assert incremental.evaluate(range(2023, 2025)) == evaluate(
+            rules, range(2023, 2025)
+        )
+
+        edited = parse_oog('MAY 26 Towel Day\nJULY 14 Tape Measure Day\n')
+        tape_measure = incremental.occurrences[incremental.order[1]]
+        assert incremental.update(edited) == {
+            date(2023, MAY, 25),
+            date(2023, MAY, 26),
+            date(2024, MAY, 25),
+            date(2024, MAY, 26),
+        }
+        assert incremental.occurrences[incremental.order[1]] is tape_measure
+        assert incremental.evaluate(range(2023, 2025)) == evaluate(
+            edited, range(2023, 2025)
+        )
+        assert incremental.update(edited + edited[1:]) == {
+            date(2023, JULY, 14),
+            date(2024, JULY, 14),
+        }
+
+
+class TestObservance:
+    def test_policies(self):
+        from paper_cal.observance import (
+            NEAREST_MONDAY,
+            NEAREST_WEEKDAY,
+            NEXT_MONDAY,
+            weekend_policy,
+        )
+
+        days = [date(2024, JUNE, 1) + timedelta(n) for n in range(14)]
+        for policy, desired in (
+            (NEXT_MONDAY, {SATURDAY: MONDAY, SUNDAY: MONDAY}),
+            (NEAREST_WEEKDAY, {SATURDAY: FRIDAY, SUNDAY: MONDAY}),
+            (weekend_policy(sunday=TUESDAY), {SUNDAY: TUESDAY}),
+        ):
+            for day in days:
+                expected = day
+                if day.weekday() in desired:
+                    expected = closest_date(desired[day.weekday()], day)
+                found = date.fromordinal(policy.observe(day.toordinal()))
+                assert found == expected
+        for day in days:
+            found = date.fromordinal(NEAREST_MONDAY.observe(day.toordinal()))
+            assert found == closest_date(MONDAY, day)
+
+    def test_chained(self):
+        from paper_cal.observance import NEXT_MONDAY, substitute
+
+        def observed(*days):
+            ordinals = [day.toordinal() for day in days]
+            return [date.fromordinal(o) for o in substitute(ordinals, NEXT_MONDAY)]
+
+        # Christmas on Saturday, Sunday and Friday
+        assert observed(date(2021, 12, 25), date(2021, 12, 26)) == [
+            date(2021, 12, 27),
+            date(2021, 12, 28),
+        ]
+        assert observed(date(2022, 12, 25), date(2022, 12, 26)) == [
+            date(2022, 12, 27),
+            date(2022, 12, 26),
+        ]
+        assert observed(date(2026, 12, 25), date(2026, 12, 26)) == [
+            date(2026, 12, 25),
+            date(2026, 12, 28),
+        ]
+
+    def test_observed_rules(self):
+        christmas, boxing_day = REGISTRY['religious'][-2:]
+        assert boxing_day.name == 'Boxing Day Observed'
+        assert christmas.dates(2022) == [date(2022, 12, 27)]
+        assert boxing_day.dates(2022) == []
+        assert boxing_day.dates(2026) == [date(2026, 12, 28)]
+
+        legacy = Observed(month=JULY, day=4, saturday=FRIDAY, sunday=MONDAY, name='')
+        for year in range(2020, 2030):
+            day = date(year, JULY, 4)
+            assert legacy.dates(year) == (
+                [closest_date(FRIDAY if day.weekday() == SATURDAY else MONDAY, day)]
+                if day.weekday() in (SATURDAY, SUNDAY)
+                else []
+            )
+
+    def test_batch(self):
+        rules = [
+            rule
+            for source in REGISTRY
+            for rule in REGISTRY[source]
+            if isinstance(rule, Observed)
+        ]
+        years = range(1900, 2100)
+        assert batch(rules, years) == sorted(
+            evaluate(rules, years), key=lambda event: event.date
+        )
+
+
+class TestBatch:
+    def test_batch_matches_evaluate(self):
+        # Every rule that does not need an ephemeris, over the years
+        # datetime.date can hold for all of them
+        rules = [
+            rule
+            for rules in REGISTRY.values()
+            for rule in rules
+            if not isinstance(rule, (Astronomical, Lunar, MoonPhase))
+        ]
+        years = range(1, 5001)
+        assert batch(rules, years) == sorted(
+            evaluate(rules, years), key=lambda event: event.date
+        )
+
+    def test_some_ordinals(self):
+        rule = Weekday(weekday=MONDAY, month=MAY, day=WEEK4, last=True, name='x')
+        for year, found in zip(range(1600, 2400), ordinals(rule, range(1600, 2400))):
+            assert date.fromordinal(found) == closest_date(
+                MONDAY, date(year, MAY, WEEK4), last=True
+            )
+        rule = Fixed(month=FEBRUARY, day=-1, name='x')
+        assert ordinals(rule, [2023, 2024]) == [
+            date(2023, FEBRUARY, 28).toordinal(),
+            date(2024, FEBRUARY, 29).toordinal(),
+        ]
+        rule = Easter(offset=49, name='x')
+        assert ordinals(rule, [2024]) == [date(2024, MAY, 19).toordinal()]
+
+    def test_closest_dates_match_closest_date(self):
+        nearby_dates = [date(2023, JANUARY, 1) + timedelta(n) for n in range(800)]
+        for desired_weekday in range(-1, 8):
+            for last in (False, True):
+                assert closest_dates(desired_weekday, nearby_dates, last) == [
+                    closest_date(desired_weekday, nearby_date, last)
+                    for nearby_date in nearby_dates
+                ]
+
+    def test_closest_ordinals_per_anchor(self):
+        nearby_dates = [date(2024, FEBRUARY, 10), date(2024, MAY, 1)]
+        weekdays, lasts = [SATURDAY, MONDAY], [True, False]
+        assert closest_ordinals(
+            weekdays, [d.toordinal() for d in nearby_dates], lasts
+        ) == [date(2024, FEBRUARY, 24).toordinal(), date(2024, APRIL, 29).toordinal()]
+        assert closest_dates(weekdays, nearby_dates, lasts) == [
+            closest_date(w, d, l) for w, d, l in zip(weekdays, nearby_dates, lasts)
+        ]
+
+
+class TestCache:
+    def test_some_cached_seasons(self):
+        spring.cache_clear()
+        assert spring(2024) == spring(year=2024) == spring(2024)
+        assert spring.cache_info().hits == 2
+        assert spring.cache_info().misses == 1
+
+    def test_some_evictions(self):
+        from paper_cal.cache import memoize
+
+        @memoize(maxsize=2)
+        def square(number):
+            return number * number
+
+        assert [square(n) for n in (1, 2, 3, 1)] == [1, 4, 9, 1]
+        assert square.cache_info().evictions == 2
+        assert square.cache_info().currsize == 2
+
+
+class TestEphemeris:
+    def test_the_table_matches_pymeeus(self, tmp_path):
+        moon_dates = [date(2024, month, 16) for month in range(1, 13)]
+        live_moons = [full_moon(moon_date) for moon_date in moon_dates]
+        live_winters = [winter(year) for year in range(2023, 2026)]
+        winter.cache_clear()
+
+        build_ephemeris(tmp_path / 'ephemeris.bin', 2024, 2024)
+        table = use_ephemeris(tmp_path / 'ephemeris.bin')
+        try:
+            assert table.season(2024, 3) is not None
+            assert table.season(2025, 3) is None
+            assert [full_moon(moon_date) for moon_date in moon_dates] == live_moons
+            assert [winter(year) for year in range(2023, 2026)] == live_winters
+        finally:
+            use_ephemeris(None)
+            winter.cache_clear()
+
+    def test_the_table_covers_the_first_days(self, tmp_path):
+        from paper_cal.ephemeris import lunation
+
+        # New moons looked up early in 2026 belong to a lunation of 2025
+        build_ephemeris(tmp_path / 'ephemeris.bin', 2026, 2026)
+        table = use_ephemeris(tmp_path / 'ephemeris.bin')
+        try:
+            for day in (date(2026, 1, 1), date(2026, 1, 3), date(2026, 12, 31)):
+                assert table.moon_phase(lunation(day), 'full') is not None
+        finally:
+            use_ephemeris(None)
+
+    def test_lunation_numbers_match_pymeeus(self):
+        from pymeeus.Epoch import Epoch
+
+        from paper_cal.ephemeris import lunation
+
+        # The k that Moon.moon_phase() works out from an Epoch, including the
+        # days skipped in October 1582 and times of the day
+        def pymeeus_lunation(moon_date):
+            y, m, d = Epoch(moon_date - timedelta(days=6)).get_date()
+            year = y + Epoch.get_doy(y, m, d) / (366.0 if Epoch.is_leap(y) else 365.0)
+            return int(round((year - 2000.0) * 12.3685, 0))
+
+        moon_dates = [date(year, JANUARY, 7) for year in range(1, 10000, 7)]
+        moon_dates += [date(1582, OCTOBER, 1) + timedelta(n) for n in range(30)]
+        moon_dates += [datetime(2024, MARCH, 10, 23, 59), datetime(1500, JULY, 2, 12)]
+        for moon_date in moon_dates:
+            assert lunation(moon_date) == pymeeus_lunation(moon_date)
+
+    def test_the_table_is_replaced_whole(self, tmp_path):
+        build_ephemeris(tmp_path / 'ephemeris.bin', 2024, 2024)
+        table = use_ephemeris(tmp_path / 'ephemeris.bin')
+        try:
+            # The table being read keeps its moments while a new one is built
+            build_ephemeris(tmp_path / 'ephemeris.bin', 2025, 2025)
+            assert table.season(2024, 3) is not None
+            assert os.listdir(tmp_path) == ['ephemeris.bin']
+            assert use_ephemeris(tmp_path / 'ephemeris.bin').first_year == 2025
+        finally:
+            use_ephemeris(None)
+
+    def test_the_environment(self, tmp_path, monkeypatch):
+        import subprocess
+        import sys
+
+        # A missing table is a warning, not an import error
+        missing = str(tmp_path / 'missing.bin')
+        result = subprocess.run(
+            [sys.executable, '-c', 'import paper_cal; print(paper_cal.spring(2024))'],
+            env={**os.environ, 'PAPER_CAL_EPHEMERIS': missing},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == str(spring(2024))
+        assert 'PAPER_CAL_EPHEMERIS' in result.stderr
+
+        # And the variable is read again by every call
+        build_ephemeris(tmp_path / 'ephemeris.bin', 2024, 2024)
+        monkeypatch.setenv('PAPER_CAL_EPHEMERIS', str(tmp_path / 'ephemeris.bin'))
+        try:
+            assert use_ephemeris().first_year == 2024
+            monkeypatch.setenv('PAPER_CAL_EPHEMERIS', missing)
+            with pytest.warns(UserWarning):
+                assert use_ephemeris() is None
+        finally:
+            use_ephemeris(None)
+
+
+class TestLunations:
+    def test_every_phase_once(self):
+        found = list(lunations(date(2020, JANUARY, 1), date(2021, JANUARY, 1)))
+        assert [phase for _, phase in found[:4]] == [
+            FIRST_QUARTER_MOON,
+            FULL_MOON,
+            LAST_QUARTER_MOON,
+            NEW_MOON,
+        ]
+        assert all(a < b for (a, _), (b, _) in zip(found, found[1:]))
+        for moon_date in [date(2020, month, 16) for month in range(1, 13)]:
+            assert (full_moon(moon_date), FULL_MOON) in found
+
+    @pytest.mark.parametrize('year', [1, 4000, 4900, 9998])
+    def test_every_phase_once_far_away(self, year):
+        # A phase roughly every week from the first days of January to the
+        # last days of December, in the same order all along
+        start, end = date(year, JANUARY, 1), date(year + 1, JANUARY, 1)
+        found = list(lunations(start, end))
+        moments = [start, *(moment.date() for moment, _ in found), end]
+        assert all(0 <= (b - a).days <= 9 for a, b in zip(moments, moments[1:]))
+        phases = [phase for _, phase in found]
+        order = [NEW_MOON, FIRST_QUARTER_MOON, FULL_MOON, LAST_QUARTER_MOON]
+        assert all(
+            order.index(b) == (order.index(a) + 1) % len(order)
+            for a, b in zip(phases, phases[1:])
+        )
+        for moon_date in [date(year, month, 16) for month in range(1, 13)]:
+            if start <= full_moon(moon_date).date() < end:
+                assert (full_moon(moon_date), FULL_MOON) in found
+
+    def test_a_blue_moon(self):
+        full_moons = [
+            found.date() for found, phase in moon_phases(2020) if phase == FULL_MOON
+        ]
+        assert len(full_moons) == 13
+        assert date(2020, OCTOBER, 1) in full_moons
+        assert date(2020, OCTOBER, 31) in full_moons
+
+
+class TestClock:
+    def test_defaults_follow_the_clock(self):
+        previous = set_clock(FixedClock(date(2024, DECEMBER, 31)))
+        try:
+            assert today() == date(2024, DECEMBER, 31)
+            assert is_leap() and days_in_month() == 31
+            assert easter() == date(2024, MARCH, 31)
+            assert closest_date(MONDAY) == date(2024, DECEMBER, 30)
+
+            # A long running process moves on to the next year after midnight
+            set_clock(FixedClock(date(2025, JANUARY, 1)))
+            assert not is_leap() and easter() == date(2025, APRIL, 20)
+            assert spring() == spring(2025)
+        finally:
+            set_clock(previous)
+
+    def test_back_to_the_system_clock(self):
+        set_clock(None)
+        assert today() == date.today()
+
+
+class TestIcal:
+    def test_vobject_reads_it_back(self):
+        import io
+
+        import vobject
+
+        events = list(merged(range(2024, 2026)))
+        out = io.StringIO(newline='')
+        write_ical(events, out)
+        calendar = vobject.readOne(out.getvalue())
+
+        assert len(calendar.vevent_list) == len(events)
+        assert len({vevent.uid.value for vevent in calendar.vevent_list}) > 500
+        for vevent, event in zip(calendar.vevent_list, events):
+            assert vevent.summary.value == event.name
+            if event.time is None:
+                assert vevent.dtstart.value == event.date
+            else:
+                assert vevent.dtstart.value.date() == event.date
+                assert vevent.dtstart.value.time().replace(tzinfo=None) == (
+                    event.time.replace(tzinfo=None)
+                )
+
+    def test_long_lines_are_folded(self):
+        from paper_cal.ical import fold
+
+        name = 'Fête, nationale; du Québec ' * 5
+        folded = fold(f'SUMMARY:{name}')
+        assert all(len(line.encode()) <= 75 for line in folded.split('\r\n'))
+        assert folded.replace('\r\n ', '') == f'SUMMARY:{name}\r\n'
+
+    def test_times(self):
+        from paper_cal.ical import ical_lines
+
+        events = [
+            Event(date(2024, 3, 20), 'Equinox', time(3, 6, tzinfo=timezone.utc)),
+            Event(date(2024, 3, 20), 'Lunch', time(12, 0)),
+            Event(date(2024, 3, 20), 'All day'),
+        ]
+        lines = [line for line in ical_lines(events) if line.startswith('DTSTART')]
+        assert lines == [
+            'DTSTART:20240320T030600Z\r\n',
+            'DTSTART:20240320T120000\r\n',
+            'DTSTART;VALUE=DATE:20240320\r\n',
+        ]
+
+    def test_recurring_rules(self):
+        import io
+
+        import vobject
+
+        from paper_cal.ical import rrule, write_recurring
+
+        assert rrule(Astronomical(function=spring, name='')) is None
+        labour_day = Weekday(weekday=MONDAY, month=SEPTEMBER, day=WEEK1, name='')
+        assert rrule(labour_day) == 'FREQ=YEARLY;BYMONTH=9;BYDAY=1MO'
+        victoria_day = Weekday(weekday=MONDAY, month=MAY, day=21, name='')
+        assert rrule(victoria_day) == (
+            'FREQ=YEARLY;BYMONTH=5;BYDAY=MO;BYMONTHDAY=18,19,20,21,22,23,24'
+        )
+
+        rules = [rule for source in REGISTRY for rule in REGISTRY[source]]
+        years = range(2020, 2030)
+        out = io.StringIO(newline='')
+        write_recurring(rules, years, out)
+        calendar = vobject.readOne(out.getvalue())
+
+        assert len(calendar.vevent_list) < len(evaluate(rules, years)) // 4
+        found = []
+        for vevent in calendar.vevent_list:
+            starts = vevent.getrruleset(addRDate=True) or [vevent.dtstart.value]
+            for start in starts:
+                if isinstance(start, datetime):
+                    start = start.date()
+                found.append((start, vevent.summary.value))
+        assert sorted(found) == sorted(
+            (event.date, event.name) for event in evaluate(rules, years)
+        )
+
+
+@pytest.fixture(scope='class')
+def server():
+    import threading
+
+    from paper_cal.server import serve
+
+    server = serve(port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestExport:
+    EVENTS = [
+        Event(date(2024, JULY, 1), 'Canada Day'),
+        Event(date(2024, JULY, 3), 'Net control, "Name1"', time(20, 0)),
+        Event(date(2024, JULY, 4), 'Tab\tand\nnew line'),
+    ]
+
+    def test_csv(self):
+        import csv
+        import io
+
+        for write, dialect in ((write_csv, csv.excel), (write_tsv, csv.excel_tab)):
+            out = io.StringIO(newline='')
+            write(iter(self.EVENTS), out)
+            rows = list(csv.reader(io.StringIO(out.getvalue()), dialect))
+            assert rows == [
+                ['date', 'time', 'name'],
+                ['2024-07-01', '', 'Canada Day'],
+                ['2024-07-03', '20:00:00', 'Net control, "Name1"'],
+                ['2024-07-04', '', 'Tab\tand\nnew line'],
+            ]
+
+    def test_jsonl(self):
+        import io
+        import json
+
+        from paper_cal.export import json_object
+
+        events = [
+            *self.EVENTS,
+            Event(date(2024, 1, 1), 'Zulu', time(12, tzinfo=timezone.utc)),
+        ]
+        out = io.StringIO(newline='')
+        write_jsonl(events, out)
+        lines = out.getvalue().splitlines()
+        assert len(lines) == len(events)
+        assert json.loads(lines[1]) == {
+            'date': '2024-07-03',
+            'name': 'Net control, "Name1"',
+            'time': '20:00:00',
+        }
+        assert lines == [
+            json.dumps(json_object(event), ensure_ascii=False) for event in events
+        ]
+
+    def test_text(self):
+        import io
+
+        out = io.StringIO()
+        write_events(merged(2024, ['canada']), out)
+        assert out.getvalue().splitlines() == [
+            str(event) for event in merged(2024, ['canada'])
+        ]
+
+
+class TestServer:
+    def get(self, server, path, **headers):
+        from http.client import HTTPConnection
+
+        connection = HTTPConnection(*server.server_address)
+        connection.request('GET', path, headers=headers)
+        found = connection.getresponse()
+        body = found.read()
+        connection.close()
+        return found, body
+
+    def test_formats(self, server):
+        import csv
+        import io
+        import json
+
+        events = list(merged(2024, ['canada']))
+        found, body = self.get(server, '/holidays/canada/2024.json')
+        assert found.status == 200
+        assert found.getheader('Content-Type') == 'application/json'
+        assert [entry['name'] for entry in json.loads(body)] == [
+            event.name for event in events
+        ]
+
+        found, body = self.get(server, '/holidays/canada/2024.csv')
+        rows = list(csv.reader(io.StringIO(body.decode())))
+        assert rows[0] == ['date', 'time', 'name']
+        assert [row[2] for row in rows[1:]] == [event.name for event in events]
+
+        found, body = self.get(server, '/holidays/CA-NS/2024.json')
+        assert [entry['name'] for entry in json.loads(body)] == [
+            event.name for event in merged(2024, region='CA-NS')
+        ]
+
+        found, body = self.get(server, '/holidays/all/2024.ics')
+        assert body.startswith(b'BEGIN:VCALENDAR\r\n')
+        assert body.count(b'BEGIN:VEVENT') == len(list(merged(2024)))
+
+    def test_etag_and_gzip(self, server):
+        import gzip
+
+        found, body = self.get(server, '/holidays/other/2024.ics')
+        etag = found.getheader('ETag')
+        assert found.getheader('Content-Encoding') is None
+
+        found, again = self.get(server, '/holidays/other/2024.ics')
+        assert found.getheader('ETag') == etag and again == body
+        found, empty = self.get(
+            server, '/holidays/other/2024.ics', **{'If-None-Match': etag}
+        )
+        assert found.status == 304 and empty == b''
+
+        found, compressed = self.get(
+            server, '/holidays/other/2024.ics', **{'Accept-Encoding': 'br, gzip'}
+        )
+        assert found.getheader('Content-Encoding') == 'gzip'
+        assert found.getheader('ETag') != etag
+        assert gzip.decompress(compressed) == body
+        found, empty = self.get(
+            server,
+            '/holidays/other/2024.ics',
+            **{
+                'Accept-Encoding': 'gzip',
+                'If-None-Match': found.getheader('ETag'),
+            },
+        )
+        assert found.status == 304
+
+    def test_not_found(self, server):
+        for path in (
+            '/holidays/atlantis/2024.ics',
+            '/holidays/canada/2024.pdf',
+            '/holidays/canada/0.ics',
+            '/holidays/CA-XX/2024.ics',
+            '/holidays/all/4000.json',
+            '/holidays/religious/9999.json',
+            '/calendar/canada/2024.ics',
+        ):
+            found, body = self.get(server, path)
+            assert found.status == 404
+
+        # And the server is still there
+        found, body = self.get(server, '/holidays/all/1.json')
+        assert found.status == 200
+
+
+class TestAsync:
+    def test_same_events(self):
+        import asyncio
+
+        from paper_cal.aio import AsyncCalendar
+
+        calendar = AsyncCalendar()
+        found = asyncio.run(calendar.holidays(range(2023, 2026), ['canada', 'other']))
+        assert found == holidays(range(2023, 2026), ['canada', 'other'])
+        calendar.close()
+
+    def test_coalesced(self):
+        import asyncio
+        import time
+
+        from paper_cal.aio import AsyncCalendar
+
+        calls = []
+
+        def slow(year):
+            calls.append(year)
+            time.sleep(0.05)
+            return year * 2
+
+        async def main(calendar):
+            return await asyncio.gather(
+                *(calendar.call(slow, year) for year in [2024] * 50 + [2025])
+            )
+
+        calendar = AsyncCalendar()
+        assert asyncio.run(main(calendar)) == [4048] * 50 + [4050]
+        assert sorted(calls) == [2024, 2025]
+        assert calendar.pending == {}
+        calendar.close()
+
+    def test_hits_inline(self):
+        import asyncio
+        from concurrent.futures import Executor
+
+        from paper_cal.aio import AsyncCalendar
+
+        class Refusing(Executor):
+            def submit(self, *args, **kwargs):
+                raise AssertionError('went to the executor')
+
+        filling = AsyncCalendar()
+        asyncio.run(filling.holidays(2024))
+        asyncio.run(filling.call(spring, 2024))
+        filling.close()
+
+        calendar = AsyncCalendar(Refusing())
+        assert asyncio.run(calendar.call(spring, 2024)) == spring(2024)
+        assert asyncio.run(calendar.holidays(2024)) == holidays(2024)
+        with pytest.raises(AssertionError):
+            asyncio.run(calendar.call(spring, 1492))
+
+
+class TestImports:
+    def test_nothing_heavy_on_import(self):
+        import subprocess
+        import sys
+
+        script = (
+            'import sys, paper_cal; '
+            'paper_cal.closest_date(paper_cal.MONDAY); '
+            'paper_cal.days_in_month(paper_cal.FEBRUARY, 2024); '
+            'print(sorted(m for m in sys.modules if m.split(".")[0] in '
+            '("pymeeus", "pyluach") or m == "paper_cal.rules"))'
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', script], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == '[]'
+
+    def test_lazy_names(self):
+        import paper_cal
+
+        assert paper_cal.holidays is holidays
+        assert paper_cal.batch is batch
+        with pytest.raises(AttributeError):
+            paper_cal.no_such_thing
+
+    def test_lazy_names_imported_by_another(self):
+        import subprocess
+        import sys
+
+        # Submodules imported first, by another submodule or by hand
+        script = (
+            'import paper_cal, paper_cal.server, paper_cal.bulk, paper_cal.registry;'
+            'paper_cal.holidays(2024); paper_cal.batch(paper_cal.REGISTRY["canada"], [2024])'
+        )
+        subprocess.run([sys.executable, '-c', script], check=True)
+
+    def test_lazy_names_are_not_submodules(self):
+        import pkgutil
+
+        import paper_cal
+
+        submodules = {
+            module.name for module in pkgutil.iter_modules(paper_cal.__path__)
+        }
+        assert not submodules & set(paper_cal.LAZY)
+        assert set(paper_cal.LAZY.values()) <= submodules
+
+
 # class TestMoons:
 #     def test_some_moon_phases(self):
 #         assert moon_phase(date(2020, JANUARY, 2)) == FIRST_QUARTER_MOON